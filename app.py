@@ -11,9 +11,14 @@ from fastapi import FastAPI, UploadFile, File, Request, HTTPException
 # - HTTPException: Used to return error responses (like 400, 500)
 
 # Response classes - Different ways to send data back to the user
-from fastapi.responses import JSONResponse, HTMLResponse
+from fastapi.responses import JSONResponse, HTMLResponse, StreamingResponse, Response
 # - JSONResponse: Sends data in JSON format {"key": "value"}
 # - HTMLResponse: Sends HTML pages (like a website)
+# - StreamingResponse: Sends results piece by piece (one JSON line per image)
+# - Response: Plain response (used for the Prometheus /metrics text)
+
+# Multipart parsing of /predict/batch, fed through our own size-capped body stream
+from starlette.formparsers import MultiPartParser, MultiPartException
 
 # Template and static file handling
 from fastapi.templating import Jinja2Templates  # Renders HTML with dynamic data
@@ -24,9 +29,23 @@ from pathlib import Path  # Modern way to handle file paths (better than strings
 import shutil            # File operations (copy, move, delete)
 import uuid              # Generates unique IDs (prevents filename conflicts)
 import os                # Operating system operations
+import json              # Encoding one result per line (NDJSON)
+import zipfile           # Detecting invalid zip archives
+import asyncio           # Background task watching the model file
+import time              # Measuring request latency
+from contextlib import asynccontextmanager  # Runs code once at startup/shutdown
 
 # Custom ML pipeline - Your trained CNN model
-from cnnClassifier.pipeline.prediction import PredictionPipeline
+import numpy as np       # Image arrays
+from cnnClassifier.pipeline.prediction import (PredictionPipeline, ModelHolder, ImageBufferPool,
+                                               decode_predictions, decode_image_into)
+from cnnClassifier.components.micro_batcher import MicroBatcher
+from cnnClassifier.components.batch_prediction import BatchPrediction, RequestTooLargeError, expand_zip
+from cnnClassifier.components.inference_executor import InferenceExecutor, ServerBusyError
+from cnnClassifier.components.event_loop_monitor import EventLoopMonitor
+from cnnClassifier.components.prediction_cache import PredictionCache
+from cnnClassifier.components.serving_metrics import ServingMetrics
+from cnnClassifier.components.upload_spool import UploadSpool
 from cnnClassifier import logger  # Logs events (like print but better for production)
 
 
@@ -34,12 +53,205 @@ from cnnClassifier import logger  # Logs events (like print but better for produ
 # APP INITIALIZATION - Setting up the FastAPI application
 # =============================================================================
 
+# Process-wide model holder - the model is loaded ONCE per process
+# and shared by every request (instead of reloading VGG16 per upload)
+model_holder = ModelHolder.instance()
+serving_config = model_holder.config
+
+# Prometheus metrics (exposed at /metrics): per-stage latency histograms,
+# predictions by class, errors by type, model load time, RSS, queue sizes
+metrics = ServingMetrics()
+
+# Model forward pass, timed into the "forward" stage histogram
+forward = metrics.timed(metrics.forward, model_holder.predict_batch)
+
+# Inference executor - decoding and TensorFlow calls run on these threads,
+# never on the asyncio event loop (which must stay free for other requests)
+# When all workers are busy and the waiting line is full, new requests get
+# an immediate 503 with a Retry-After header instead of waiting forever
+inference = InferenceExecutor(
+    max_workers=serving_config.inference_workers,
+    max_pending=serving_config.inference_max_pending,
+    retry_after=serving_config.retry_after_seconds
+)
+
+# Event-loop lag monitor - shows (p50/p99) when something blocks the loop
+loop_monitor = EventLoopMonitor(interval_ms=serving_config.loop_lag_interval_ms)
+
+# Prediction cache - re-uploads of the same scan skip the model entirely
+# Key = SHA-256 of the upload bytes + content hash of the model file
+# Created in lifespan(), i.e. in each worker AFTER the gunicorn fork: its disk
+# tier holds an open SQLite connection that forked processes must not share
+prediction_cache = None
+
+
+def create_prediction_cache():
+    """Prediction cache of this process (None when cache_enabled is off)"""
+    if not serving_config.cache_enabled:
+        return None
+    return PredictionCache(
+        max_entries=serving_config.cache_max_entries,
+        ttl_seconds=serving_config.cache_ttl_seconds,
+        disk_dir=serving_config.cache_disk_dir,
+        disk_size_limit=serving_config.cache_disk_size_limit
+    )
+
+# Micro-batcher - concurrent /predict calls are grouped into ONE model call
+# (up to max_batch_size images, waiting at most max_wait_ms for company)
+batcher = None
+if serving_config.batching_enabled:
+    batcher = MicroBatcher(
+        predict_fn=forward,
+        max_batch_size=serving_config.max_batch_size,
+        max_wait_ms=serving_config.max_wait_ms,
+        max_queue_size=serving_config.inference_max_pending,
+        retry_after=serving_config.retry_after_seconds,
+        on_batch=metrics.observe_batch
+    )
+
+# Batch predictor for /predict/batch - many images, fixed-size batches
+batch_predictor = BatchPrediction(
+    predict_fn=forward,
+    image_size=serving_config.params_image_size,
+    batch_size=serving_config.batch_endpoint_size,
+    decode_workers=serving_config.batch_decode_workers,
+    inference=inference,
+    # The exported SavedModel decodes uploads itself: pass it the raw bytes
+    encoded=model_holder.decodes_images
+)
+
+
+async def run_cache(method, *args):
+    """
+    Call a prediction_cache method without blocking the event loop:
+    the in-memory tier answers inline, the disk tier (diskcache = SQLite +
+    files) runs on a worker thread
+    """
+    if prediction_cache.on_disk:
+        return await asyncio.to_thread(method, *args)
+    return method(*args)
+
+
+async def watch_model_file():
+    """
+    Background task: reload the model when model/model.keras changes
+    (and drop cached predictions made with the old model)
+    """
+    while True:
+        await asyncio.sleep(serving_config.model_watch_interval_seconds)
+        try:
+            if await inference.run(model_holder.reload_if_changed, wait=True):
+                if prediction_cache is not None:
+                    await run_cache(prediction_cache.clear)
+        except Exception as e:
+            logger.exception(f"Model reload failed: {e}")
+
+
+def refresh_metrics() -> None:
+    """Copy load/warm-up time, RSS, queue sizes and loop lag into the gauges"""
+    metrics.refresh(model_holder=model_holder, batcher=batcher,
+                    inference=inference, loop_monitor=loop_monitor)
+
+
+async def refresh_metrics_periodically():
+    """
+    Background task: keep the gauges fresh between scrapes
+    (with several gunicorn workers, a scrape only reaches one of them)
+    """
+    while True:
+        await asyncio.sleep(serving_config.metrics_refresh_seconds)
+        refresh_metrics()
+
+
+# Every batch size the model will see: micro-batches and /predict/batch
+# chunks can hold anywhere from 1 image up to their configured maximum
+warmup_batch_sizes = range(
+    1,
+    max(serving_config.max_batch_size if batcher is not None else 1,
+        serving_config.batch_endpoint_size) + 1
+)
+
+
+async def prepare_model(app: FastAPI):
+    """
+    Background startup task: load the model, warm it up at every batch size,
+    then mark the server ready (/readyz). Until then /predict answers 503
+    """
+    try:
+        await inference.run(model_holder.load, wait=True)
+        await inference.run(model_holder.warmup, warmup_batch_sizes, wait=True)
+        app.state.ready = True
+        logger.info("Server ready to take traffic")
+    except Exception as e:
+        logger.exception(f"Model preparation failed: {e}")
+
+
+def fork_safety_problems() -> list:
+    """
+    Resources that must not exist yet when gunicorn forks the workers from
+    the master (preload_app): open cache connections, started threads, a
+    loaded model. Checked by gunicorn.conf.py's when_ready hook.
+
+    Returns:
+        list: One description per problem (empty when the fork is safe).
+    """
+    problems = []
+    if prediction_cache is not None:
+        problems.append("prediction cache is open (its disk tier holds a SQLite connection)")
+    if model_holder._model is not None:
+        problems.append("model is loaded (the TensorFlow runtime cannot be forked)")
+    for name, pool in (("inference", inference._pool), ("batch decode", batch_predictor._decode_pool)):
+        if pool._threads:
+            problems.append(f"{name} thread pool has started {len(pool._threads)} threads")
+    if batcher is not None and batcher._thread is not None:
+        problems.append("micro-batcher thread is started")
+    if upload_spool._thread is not None:
+        problems.append("upload spool writer thread is started")
+    return problems
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Startup/shutdown hook: load, compile and warm up the model in the background
+    (liveness answers right away, readiness once warm-up is done)
+
+    Runs in each worker after the fork: everything holding file handles or
+    threads (prediction cache, batcher, spool writer) is created/started here
+    """
+    global prediction_cache
+    app.state.ready = False
+    prediction_cache = create_prediction_cache()
+    if batcher is not None:
+        batcher.start()
+    loop_monitor.start()
+    upload_spool.start()
+    model_preparation = asyncio.create_task(prepare_model(app))
+    model_watcher = asyncio.create_task(watch_model_file())
+    metrics_refresher = asyncio.create_task(refresh_metrics_periodically())
+    yield
+    model_preparation.cancel()
+    model_watcher.cancel()
+    metrics_refresher.cancel()
+    await loop_monitor.stop()
+    if batcher is not None:
+        batcher.stop()
+    inference.shutdown()
+    if prediction_cache is not None:
+        prediction_cache.close()
+        prediction_cache = None
+    # Finish any pending sampled upload writes
+    upload_spool.stop()
+    batch_predictor.shutdown()
+
+
 # Create FastAPI app instance
 # This is the main object that handles all requests and responses
 app = FastAPI(
     title="Kidney Disease Classifier CNN API",           # Shows in API docs at /docs
     description="FastAPI backend for CNN-based kidney tumor classification",
-    version="1.0"  # API version number
+    version="1.0",  # API version number
+    lifespan=lifespan  # Load the model at startup
 )
 
 # Get the current file's directory path
@@ -74,6 +286,92 @@ app.mount(
 )
 
 
+# =============================================================================
+# UPLOAD HANDLING - Decoding uploads in memory and (optionally) keeping copies
+# =============================================================================
+
+# Preallocated float32 image buffers, reused across requests
+# Each request borrows one, decodes into it, and gives it back when done
+image_buffers = ImageBufferPool(serving_config.params_image_size)
+
+# Upload spool - a sampled fraction of uploads (upload_sample_rate) is kept
+# in UPLOAD_DIR for auditing. A background thread does the writing so the
+# request never waits for the filesystem, and the oldest files are deleted
+# once the folder exceeds spool_max_bytes / spool_max_files (or spool_max_age_seconds).
+# The caps are for the whole folder: every worker checks them against a fresh
+# listing of UPLOAD_DIR, not its own index
+upload_spool = UploadSpool(
+    directory=UPLOAD_DIR,
+    max_bytes=serving_config.spool_max_bytes,
+    max_files=serving_config.spool_max_files,
+    max_age_seconds=serving_config.spool_max_age_seconds,
+    sample_rate=serving_config.upload_sample_rate,
+    queue_size=serving_config.spool_queue_size
+)
+
+
+# Decode/resize of one upload, timed into the "decode" stage histogram
+decode = metrics.timed(metrics.decode, decode_image_into)
+
+
+def decode_and_predict(contents: bytes, image_array: np.ndarray):
+    """
+    Blocking work for one image without batching: decode, then run the model
+    (runs on an inference thread)
+    """
+    decode(contents, image_array)
+    return forward(image_array[np.newaxis])[0]
+
+
+async def predict_from_bytes(contents: bytes):
+    """
+    Decode uploaded bytes into a pooled buffer and return class probabilities
+    (or hand the bytes to the model as-is when its graph decodes images)
+
+    Raises:
+        ServerBusyError: When inference capacity is exhausted
+    """
+    if model_holder.decodes_images:
+        if batcher is None:
+            return (await inference.run(forward, [contents]))[0]
+        return await batcher.predict(contents)
+
+    with image_buffers.buffer() as image_array:
+        if batcher is None:
+            return await inference.run(decode_and_predict, contents, image_array)
+
+        # Decode off the event loop, then join the next micro-batch
+        await inference.run(decode, contents, image_array)
+        return await batcher.predict(image_array)
+
+
+def save_upload(file: UploadFile) -> Path:
+    """
+    Save an uploaded file to UPLOAD_DIR synchronously (upload_mode: disk)
+    """
+    # uuid.uuid4() generates a random unique ID
+    # Example: "a3f2e9d1-4b5c-6789-scan.jpg"
+    # This prevents problems if two users upload files with same name
+    unique_filename = f"{uuid.uuid4()}_{file.filename}"
+
+    # Create full file path: UPLOAD_DIR + unique_filename
+    # Example: /home/user/project/api/uploads/a3f2e9d1-4b5c-6789-scan.jpg
+    file_path = UPLOAD_DIR / unique_filename
+
+    # Open file in write-binary mode ("wb")
+    with file_path.open("wb") as buffer:
+        # Copy uploaded file to our server in chunks (memory efficient)
+        # file.file = the uploaded file stream
+        # buffer = our destination file
+        shutil.copyfileobj(file.file, buffer)
+
+    logger.info(f"File saved at: {file_path}")
+
+    # Count it against the spool limits so the folder can't fill the disk
+    upload_spool.track(file_path)
+    return file_path
+
+
 # =============================================================================
 # ROUTES - URL endpoints that users can access
 # =============================================================================
@@ -114,7 +412,8 @@ async def home(request: Request):
 
 async def predict_image(file: UploadFile = File(...)):
     """
-    Accepts an image file, saves it, and returns CNN prediction
+    Accepts an image file and returns CNN prediction
+    (decoded in memory by default, see upload_mode in config.yaml)
     
     Args:
         file: Uploaded image file (UploadFile object)
@@ -123,10 +422,15 @@ async def predict_image(file: UploadFile = File(...)):
     Returns:
         JSON response with prediction result or error message
     """
+    request_start = time.perf_counter()
     try:
         # Log that we received a prediction request
         logger.info("Prediction request received")
 
+        # Model still loading / warming up: ask the client to come back
+        if not app.state.ready:
+            raise ServerBusyError(serving_config.retry_after_seconds)
+
         # ----------------
         # Step 1: Validate file type (security check)
         # ----------------
@@ -140,68 +444,105 @@ async def predict_image(file: UploadFile = File(...)):
             )
 
         # ----------------
-        # Step 2: Generate unique filename
+        # Step 2: Read the upload and run ML prediction
         # ----------------
-        # uuid.uuid4() generates a random unique ID
-        # Example: "a3f2e9d1-4b5c-6789-scan.jpg"
-        # This prevents problems if two users upload files with same name
-        unique_filename = f"{uuid.uuid4()}_{file.filename}"
-        
-        # Create full file path: UPLOAD_DIR + unique_filename
-        # Example: /home/user/project/api/uploads/a3f2e9d1-4b5c-6789-scan.jpg
-        file_path = UPLOAD_DIR / unique_filename
+        if serving_config.upload_mode == "memory":
+            # Zero-disk path: decode the uploaded bytes straight from memory
+            # into a preallocated buffer (no temp file, nothing read back)
+            read_start = time.perf_counter()
+            contents = await file.read()
+            metrics.upload_read.observe(time.perf_counter() - read_start)
+
+            # Same scan + same model version → reuse the cached probabilities
+            probabilities = None
+            if prediction_cache is not None:
+                cache_key = prediction_cache.key(contents, model_holder.version)
+                probabilities = await run_cache(prediction_cache.get, cache_key)
+                metrics.cache_lookups.labels(result="miss" if probabilities is None else "hit").inc()
+
+            if probabilities is None:
+                probabilities = await predict_from_bytes(contents)
+                if prediction_cache is not None:
+                    await run_cache(prediction_cache.set, cache_key, probabilities)
+
+            prediction = decode_predictions(probabilities)
+
+            # Optionally keep a sampled copy for auditing (written in the background)
+            upload_spool.offer(file.filename, contents)
+        else:
+            # Disk path: save the upload, then let the pipeline read it back
+            # (the blocking file I/O and model call run on an inference thread)
+            if inference.is_saturated():
+                raise inference.reject()
+            file_path = await inference.run(
+                metrics.timed(metrics.upload_read, save_upload), file, wait=True
+            )
 
-        # ----------------
-        # Step 3: Save uploaded file to disk
-        # ----------------
-        # Open file in write-binary mode ("wb")
-        with file_path.open("wb") as buffer:
-            # Copy uploaded file to our server in chunks (memory efficient)
-            # file.file = the uploaded file stream
-            # buffer = our destination file
-            shutil.copyfileobj(file.file, buffer)
-            # This reads and writes in small chunks (like 64KB at a time)
-            # Good for large files - doesn't load entire file into memory
-
-            logger.info(f"File saved at: {file_path}")
-            # ----------------
-            # Step 4: Run ML prediction
-            # ----------------
             # Initialize the CNN prediction pipeline with saved image path
-            predictor = PredictionPipeline(str(file_path))
+            # (cheap: it reuses the shared model_holder, nothing is reloaded)
+            predictor = PredictionPipeline(str(file_path), holder=model_holder)
 
             # Run prediction (returns array like: [{'image': 'Tumor'}])
-            prediction = predictor.predict()
-
-            logger.info(f"Prediction successful: {prediction}")
-
-            # ✅ FIX: Extract simple string from prediction result
-            # Convert [{'image': 'Tumor'}] → "Tumor"
-            prediction_result = prediction
-            if isinstance(prediction, list) and len(prediction) > 0:
-                # Extract from array
-                if isinstance(prediction[0], dict):
-                    prediction_result = prediction[0].get('image', str(prediction[0]))
+            if batcher is not None:
+                # Join the next micro-batch instead of running the model alone
+                if model_holder.decodes_images:
+                    item = await inference.run(file_path.read_bytes, wait=True)
                 else:
-                    prediction_result = str(prediction[0])
-            elif isinstance(prediction, dict):
-                prediction_result = prediction.get('image', str(prediction))
+                    preprocess = metrics.timed(metrics.decode, predictor.preprocess)
+                    item = (await inference.run(preprocess, str(file_path), wait=True))[0]
+                prediction = decode_predictions(await batcher.predict(item))
             else:
-                prediction_result = str(prediction)
-
-            logger.info(f"Extracted prediction: {prediction_result}")
-
-            # ----------------
-            # Step 5: Return success response
-            # ----------------
-            return JSONResponse(
-                content={
-                    "status": "success",
-                    "prediction": prediction_result  # Now returns: "Tumor" or "Normal"
-                }
-            )
+                prediction = await inference.run(
+                    metrics.timed(metrics.forward, predictor.predict), wait=True
+                )
+
+        logger.info(f"Prediction successful: {prediction}")
+        metrics.count_predictions(prediction)
+        metrics.total.observe(time.perf_counter() - request_start)
+
+        # ✅ FIX: Extract simple string from prediction result
+        # Convert [{'image': 'Tumor'}] → "Tumor"
+        prediction_result = prediction
+        if isinstance(prediction, list) and len(prediction) > 0:
+            # Extract from array
+            if isinstance(prediction[0], dict):
+                prediction_result = prediction[0].get('image', str(prediction[0]))
+            else:
+                prediction_result = str(prediction[0])
+        elif isinstance(prediction, dict):
+            prediction_result = prediction.get('image', str(prediction))
+        else:
+            prediction_result = str(prediction)
+
+        logger.info(f"Extracted prediction: {prediction_result}")
+
+        # ----------------
+        # Step 3: Return success response
+        # ----------------
+        return JSONResponse(
+            content={
+                "status": "success",
+                "prediction": prediction_result  # Now returns: "Tumor" or "Normal"
+            }
+        )
+
+    except HTTPException as e:
+        # Already a proper HTTP error (e.g. 400 for non-image files)
+        metrics.errors.labels(error_type=f"http_{e.status_code}").inc()
+        raise
+
+    except ServerBusyError as e:
+        # Overloaded: tell the client to come back instead of queueing forever
+        logger.warning(f"Prediction rejected: {e}")
+        metrics.errors.labels(error_type="server_busy").inc()
+        raise HTTPException(
+            status_code=503,
+            detail={"status": "error", "message": "Server busy, please retry"},
+            headers={"Retry-After": str(e.retry_after)}
+        )
 
     except Exception as e:
+        metrics.errors.labels(error_type=type(e).__name__).inc()
         raise HTTPException(
              status_code=500,
              detail={
@@ -211,6 +552,196 @@ async def predict_image(file: UploadFile = File(...)):
         }
 
         )            
+
+
+class BatchBodyTooLarge(MultiPartException):
+    """
+    The /predict/batch body went past batch_max_request_bytes while it was being read
+    (a MultiPartException, so the parser closes the files it already spooled)
+    """
+
+
+async def read_batch_form(request: Request, max_bytes: int):
+    """
+    Parse the multipart body of /predict/batch, counting bytes as they arrive
+
+    Chunked uploads have no Content-Length: the cap is enforced on the
+    running total, so an oversized body is rejected before it is spooled to disk
+    """
+    async def limited_body():
+        received = 0
+        async for chunk in request.stream():
+            received += len(chunk)
+            if received > max_bytes:
+                raise BatchBodyTooLarge(f"Request larger than {max_bytes} bytes")
+            yield chunk
+
+    return await MultiPartParser(request.headers, limited_body()).parse()
+
+
+# -------------------------
+# Route 3: Batch Prediction API
+# -------------------------
+@app.post("/predict/batch")
+async def predict_batch(request: Request):
+    """
+    Accepts many images in one request and streams back one JSON line per image
+
+    Send either several multipart "files" fields, or a single zip archive
+    containing the scans. The response is NDJSON (application/x-ndjson):
+    {"index": 0, "filename": "...", "status": "success", "prediction": "Tumor", ...}
+
+    The whole request (and a zip's extracted size) is capped by
+    batch_max_request_bytes in config.yaml
+    """
+    max_bytes = serving_config.batch_max_request_bytes
+
+    # Model still loading / warming up: ask the client to come back
+    if not app.state.ready:
+        raise HTTPException(
+            status_code=503,
+            detail="Model is warming up, please retry",
+            headers={"Retry-After": str(serving_config.retry_after_seconds)}
+        )
+
+    # Step 1: Reject oversized requests before reading the body
+    content_length = request.headers.get("content-length")
+    if content_length is not None:
+        if not content_length.isdigit():
+            raise HTTPException(status_code=400, detail="Invalid Content-Length header")
+        if int(content_length) > max_bytes:
+            raise HTTPException(status_code=413, detail=f"Request larger than {max_bytes} bytes")
+
+    if not request.headers.get("content-type", "").startswith("multipart/form-data"):
+        raise HTTPException(status_code=400, detail="Send images or a zip archive as multipart 'files'")
+
+    # Step 2: Read every uploaded file (or the images inside a zip archive)
+    # The size cap is also checked while the body streams in (chunked uploads)
+    try:
+        form = await read_batch_form(request, max_bytes)
+    except BatchBodyTooLarge as e:
+        raise HTTPException(status_code=413, detail=e.message)
+    except MultiPartException as e:
+        raise HTTPException(status_code=400, detail=e.message)
+    uploads = [value for value in form.getlist("files") if hasattr(value, "read")]
+    if not uploads:
+        raise HTTPException(status_code=400, detail="Send images or a zip archive as 'files'")
+
+    items = []
+    total = 0
+    try:
+        for upload in uploads:
+            contents = await upload.read()
+            total += len(contents)
+            if total > max_bytes:
+                raise RequestTooLargeError(f"Request larger than {max_bytes} bytes")
+
+            if upload.filename.lower().endswith(".zip") or upload.content_type in ("application/zip", "application/x-zip-compressed"):
+                items.extend(expand_zip(contents, max_bytes - total))
+            else:
+                items.append((upload.filename, contents))
+
+    except RequestTooLargeError as e:
+        raise HTTPException(status_code=413, detail=str(e))
+    except zipfile.BadZipFile:
+        raise HTTPException(status_code=400, detail="Invalid zip archive")
+    finally:
+        await form.close()
+
+    logger.info(f"Batch prediction request received: {len(items)} images")
+
+    # Fail fast if inference is already saturated (the stream waits once started)
+    if inference.is_saturated():
+        error = inference.reject()
+        raise HTTPException(
+            status_code=503,
+            detail="Server busy, please retry",
+            headers={"Retry-After": str(error.retry_after)}
+        )
+
+    # Step 3: Stream results back as each batch completes
+    async def ndjson_lines():
+        async for result in batch_predictor.stream(items):
+            if result["status"] == "success":
+                metrics.predictions.labels(predicted_class=result["prediction"]).inc()
+            else:
+                metrics.errors.labels(error_type="decode_error").inc()
+            yield json.dumps(result) + "\n"
+
+    return StreamingResponse(ndjson_lines(), media_type="application/x-ndjson")
+
+
+# -------------------------
+# Route 4: Served Model Info
+# -------------------------
+@app.get("/model/info")
+async def model_info():
+    """
+    Returns load time, in-memory identity (model_id) and version hash of the
+    served model. model_id stays the same across requests when the model is reused.
+    """
+    return JSONResponse(content=model_holder.info())
+
+
+# -------------------------
+# Route 5: Liveness / Readiness Probes
+# -------------------------
+@app.get("/healthz")
+async def healthz():
+    """
+    Liveness probe: the process is up and the event loop responds (always cheap)
+    """
+    return {"status": "alive"}
+
+
+@app.get("/readyz")
+async def readyz():
+    """
+    Readiness probe: 200 only once the model is loaded and warmed up,
+    503 before that so the load balancer keeps traffic away
+    """
+    if not app.state.ready:
+        return JSONResponse(status_code=503, content={"status": "warming_up"})
+    return {
+        "status": "ready",
+        "warmup_time_seconds": model_holder.warmup_time
+    }
+
+
+# -------------------------
+# Route 6: Prometheus Metrics
+# -------------------------
+@app.get("/metrics")
+async def prometheus_metrics():
+    """
+    Prometheus scrape endpoint (text exposition format)
+    """
+    refresh_metrics()
+    payload, content_type = metrics.exposition()
+    return Response(content=payload, media_type=content_type)
+
+
+# -------------------------
+# Route 7: Serving Stats
+# -------------------------
+@app.get("/stats")
+async def serving_stats():
+    """
+    Returns serving statistics: queue depth, batch-size histogram and
+    queueing delay of the micro-batcher (None when batching is disabled),
+    inference executor load, prediction cache hits/misses, upload spool usage
+    and p50/p99 event-loop lag
+    """
+    return JSONResponse(content={
+        "model": model_holder.info(),
+        "batcher": batcher.stats() if batcher is not None else None,
+        "inference": inference.stats(),
+        "cache": prediction_cache.stats() if prediction_cache is not None else None,
+        "upload_spool": upload_spool.stats(),
+        "event_loop_lag_ms": loop_monitor.stats()
+    })
+
+
 # =============================================================================
 # SERVER STARTUP - Run the application
 # =============================================================================
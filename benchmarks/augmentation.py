@@ -0,0 +1,69 @@
+"""
+Augmentation throughput: per-image ImageDataGenerator.random_transform vs batched Keras layers.
+
+Reads the training split through ImageFolderDataset three ways, without a
+model, and prints images/sec per epoch:
+    none         no augmentation (upper bound of the input pipeline)
+    per-image    augment=random_transform_augment() (scipy, one image per call)
+    batched      batch_augment=augment_batches() (what Training uses)
+The first epoch also decodes (or reads the packed store); the speedup is
+taken on the last epoch, when only the augmentation differs.
+
+Usage (from the project root, after data ingestion):
+    python benchmarks/augmentation.py
+    python benchmarks/augmentation.py --epochs 3 --batch-size 32
+"""
+
+import sys
+import time
+import argparse
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+from cnnClassifier.config.configuration import ConfigurationManager  # noqa: E402
+from cnnClassifier.components.image_dataset import ImageFolderDataset  # noqa: E402
+from cnnClassifier.components.augmentation import augment_batches, random_transform_augment  # noqa: E402
+
+
+def images_per_second(batches) -> float:
+    """Read every batch of an iterable once."""
+    start = time.perf_counter()
+    images = sum(len(images) for images, _ in batches)
+    return images / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--epochs", type=int, default=2, help="Epochs per path (the first one fills the cache)")
+    parser.add_argument("--batch-size", type=int, default=None, help="Default: BATCH_SIZE")
+    args = parser.parse_args()
+
+    config = ConfigurationManager().get_training_config()
+    batch_size = args.batch_size or config.params_batch_size
+
+    paths = [
+        ("none", {}),
+        ("per-image", {"augment": random_transform_augment()}),
+        ("batched", {"batch_augment": augment_batches()}),
+    ]
+    rows = []
+    for name, kwargs in paths:
+        dataset = ImageFolderDataset(
+            directory=config.training_data, image_size=config.params_image_size[:-1],
+            batch_size=batch_size, backbone=config.params_backbone, subset="training",
+            validation_split=0.20, shuffle=True, packed_index=config.packed_index_path, **kwargs
+        ).dataset
+        rows.append((name, [images_per_second(dataset) for _ in range(args.epochs)]))
+
+    per_image = dict(rows)["per-image"][-1]
+    print(f"\n{config.params_backbone}, batch size {batch_size}, training split, images/sec")
+    print("| augmentation | " + " | ".join(f"epoch {epoch + 1}" for epoch in range(args.epochs)) + " | vs per-image |")
+    print("|---|" + "---|" * args.epochs + "---|")
+    for name, epochs in rows:
+        print(f"| {name} | " + " | ".join(f"{value:.0f}" for value in epochs) + f" | {epochs[-1] / per_image:.1f}x |")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+Backbone comparison: params, FLOPs and CPU latency of the full classifier.
+
+Builds every backbone supported by BACKBONE in params.yaml, adds the same
+classification head as stage_02 (PrepareBaseModel._prepare_full_model) and
+prints a table of parameters, GFLOPs per image and CPU latency.
+
+Usage (from the project root):
+    python benchmarks/backbone_latency.py --batch-sizes 1 8
+    python benchmarks/backbone_latency.py --backbones MobileNetV2 VGG16 --weights imagenet
+"""
+
+import sys
+import argparse
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+from cnnClassifier.components.backbones import BACKBONES, build_backbone  # noqa: E402
+from cnnClassifier.components.model_benchmark import benchmark_model  # noqa: E402
+from cnnClassifier.components.prepare_base_model import PrepareBaseModel  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--backbones", nargs="+", default=list(BACKBONES), choices=list(BACKBONES))
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[1])
+    parser.add_argument("--image-size", type=int, nargs=3, default=[224, 224, 3])
+    parser.add_argument("--classes", type=int, default=2)
+    parser.add_argument("--runs", type=int, default=20)
+    # Latency and FLOPs don't depend on the weights, so skip the download by default
+    parser.add_argument("--weights", default=None, help="'imagenet' or omit for random weights")
+    args = parser.parse_args()
+
+    rows = []
+    for name in args.backbones:
+        base = build_backbone(name, input_shape=args.image_size, weights=args.weights, include_top=False)
+        model = PrepareBaseModel._prepare_full_model(
+            model=base, classes=args.classes, freeze_all=True, freeze_till=None, learning_rate=0.01
+        )
+        for batch_size in args.batch_sizes:
+            result = benchmark_model(model, batch_size=batch_size, runs=args.runs)
+            print(f"{name} batch={batch_size}: {result}", flush=True)
+            rows.append((name, result))
+
+    print("\n| backbone | params (M) | GFLOPs/image | batch | p50 (ms) | p99 (ms) | images/sec |")
+    print("|---|---|---|---|---|---|---|")
+    for name, result in rows:
+        print(
+            f"| {name} | {result['params'] / 1e6:.1f} | {result['flops_per_image'] / 1e9:.2f} "
+            f"| {result['batch_size']} | {result['latency_ms_p50']:.1f} | {result['latency_ms_p99']:.1f} "
+            f"| {result['images_per_second']:.1f} |"
+        )
+
+
+if __name__ == "__main__":
+    main()
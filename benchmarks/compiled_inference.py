@@ -0,0 +1,83 @@
+"""
+Per-call latency: model.predict vs predict_on_batch vs CompiledModel (bucketed tf.function, with and without XLA).
+
+Loads the serving model (or builds a backbone with random weights), then
+times one call per batch size for every path and prints a table. Batch
+sizes that are not buckets show the cost of padding.
+
+Usage (from the project root):
+    python benchmarks/compiled_inference.py --model-path model/model.keras
+    python benchmarks/compiled_inference.py --backbone MobileNetV2 --batch-sizes 1 3 8 16
+"""
+
+import sys
+import time
+import argparse
+from pathlib import Path
+
+import numpy as np
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+import tensorflow as tf  # noqa: E402
+
+from cnnClassifier.components.backbones import BACKBONES, build_backbone  # noqa: E402
+from cnnClassifier.components.compiled_model import DEFAULT_BUCKETS, CompiledModel  # noqa: E402
+from cnnClassifier.components.model_benchmark import measure_latency  # noqa: E402
+from cnnClassifier.components.prepare_base_model import PrepareBaseModel  # noqa: E402
+
+
+def load(args) -> tf.keras.Model:
+    if args.model_path:
+        return tf.keras.models.load_model(args.model_path, compile=False)
+    base = build_backbone(args.backbone, input_shape=[224, 224, 3], weights=None, include_top=False)
+    return PrepareBaseModel._prepare_full_model(
+        model=base, classes=2, freeze_all=True, freeze_till=None, learning_rate=0.01
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--model-path", default=None, help="Keras model to load (default: build --backbone)")
+    parser.add_argument("--backbone", default="VGG16", choices=list(BACKBONES))
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[1, 3, 8, 16])
+    parser.add_argument("--buckets", type=int, nargs="+", default=list(DEFAULT_BUCKETS))
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+
+    model = load(args)
+    paths = {
+        "model.predict": lambda batch: model.predict(batch, verbose=0),
+        "predict_on_batch": model.predict_on_batch,
+    }
+    compile_seconds = {}
+    for name, jit_compile in (("CompiledModel", False), ("CompiledModel + XLA", True)):
+        compiled = CompiledModel(model, buckets=args.buckets, jit_compile=jit_compile)
+        start = time.perf_counter()
+        compiled.compile_buckets()
+        compile_seconds[name] = time.perf_counter() - start
+        paths[name] = compiled.predict_on_batch
+
+    rng = np.random.default_rng(0)
+    rows = []
+    for batch_size in args.batch_sizes:
+        batch = rng.uniform(-1, 1, size=[batch_size] + list(model.input_shape[1:])).astype("float32")
+        for name, predict_fn in paths.items():
+            result = measure_latency(predict_fn, batch, runs=args.runs)
+            print(f"{name} batch={batch_size}: {result}", flush=True)
+            rows.append((name, batch_size, result))
+
+    print("\n" + ", ".join(f"{name}: {seconds:.1f}s to compile {len(args.buckets)} buckets"
+                           for name, seconds in compile_seconds.items()))
+    print("\n| path | batch | p50 (ms) | p99 (ms) | images/sec |")
+    print("|---|---|---|---|---|")
+    for name, batch_size, result in rows:
+        print(
+            f"| {name} | {batch_size} | {result['latency_ms_p50']:.1f} "
+            f"| {result['latency_ms_p99']:.1f} | {result['images_per_second']:.1f} |"
+        )
+
+
+if __name__ == "__main__":
+    main()
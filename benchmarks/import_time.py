@@ -0,0 +1,120 @@
+"""
+Import-time guard: how long the project's entry points take to import, and what they pull in.
+
+Imports each module in a fresh interpreter with `python -X importtime`,
+prints its cumulative import time and the slowest dependencies, and fails
+(exit status 1) when a module imports one of the heavy packages it must
+leave to the stage or backend that needs them (TensorFlow, mlflow, ...),
+when it goes over its time budget, or when importing the package creates
+the logs/ directory.
+
+Usage (from the project root):
+    python benchmarks/import_time.py
+    python benchmarks/import_time.py --modules app cnnClassifier.pipeline.prediction --top 15
+    python benchmarks/import_time.py --budget-scale 2   # slower machine
+"""
+
+import os
+import sys
+import argparse
+import subprocess
+import tempfile
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+
+# Imported only when a stage runs or a model is loaded
+HEAVY = ("tensorflow", "keras", "mlflow", "dotenv", "gdown", "joblib", "ai_edge_litert")
+
+# module -> cumulative import budget in ms (measured on 1 CPU, with headroom)
+BUDGETS_MS = {
+    "cnnClassifier": 50,
+    "cnnClassifier.config.configuration": 300,
+    "cnnClassifier.pipeline.stage_01_data_ingestion": 300,
+    "cnnClassifier.pipeline.stage_02_prepare_base_model": 300,
+    "cnnClassifier.pipeline.stage_03_model_training": 300,
+    "cnnClassifier.pipeline.stage_04_model_evaluation": 300,
+    "cnnClassifier.pipeline.stage_05_model_export": 300,
+    "cnnClassifier.pipeline.stage_06_model_quantization": 300,
+    "cnnClassifier.pipeline.stage_07_feature_extraction": 300,
+    "cnnClassifier.pipeline.stage_08_model_distillation": 300,
+    "cnnClassifier.pipeline.stage_09_model_compression": 300,
+    "cnnClassifier.pipeline.stage_10_serving_export": 300,
+    "cnnClassifier.pipeline.stage_11_dataset_packing": 300,
+    "cnnClassifier.pipeline.prediction": 600,
+    "app": 1500,
+}
+
+
+def import_profile(module: str, cwd: Path) -> list:
+    """
+    Import module in a fresh interpreter and parse its -X importtime report.
+
+    Returns:
+        list: (self_us, cumulative_us, name) per imported module, in import order.
+    """
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join([str(PROJECT_ROOT / "src"), str(PROJECT_ROOT)]))
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=cwd, env=env, capture_output=True, text=True
+    )
+    if completed.returncode != 0:
+        raise RuntimeError(f"import {module} failed:\n{completed.stderr[-2000:]}")
+
+    rows = []
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        rows.append((int(self_us), int(cumulative_us), name.strip()))
+    return rows
+
+
+def check(module: str, budget_ms: float, top: int) -> list:
+    """Profile one module, print its report and return the problems found."""
+    # app.py needs the project root (config, templates); everything else runs in
+    # an empty directory so side effects such as a logs/ directory show up
+    with tempfile.TemporaryDirectory() as scratch:
+        cwd = PROJECT_ROOT if module == "app" else Path(scratch)
+        rows = import_profile(module, cwd)
+        created_logs = module != "app" and (cwd / "logs").exists()
+
+    total_ms = next(cumulative for _, cumulative, name in rows if name == module) / 1000
+    heavy = sorted({name.split(".")[0] for _, _, name in rows if name.split(".")[0] in HEAVY})
+
+    print(f"\n{module}: {total_ms:.0f} ms (budget {budget_ms:.0f} ms), {len(rows)} modules")
+    for self_us, cumulative_us, name in sorted(rows, key=lambda row: -row[1])[1:top + 1]:
+        print(f"  {cumulative_us / 1000:8.1f} ms  {name}")
+
+    problems = []
+    if heavy:
+        problems.append(f"{module} imports {', '.join(heavy)} at import time")
+    if total_ms > budget_ms:
+        problems.append(f"{module} took {total_ms:.0f} ms to import (budget {budget_ms:.0f} ms)")
+    if created_logs:
+        problems.append(f"importing {module} created a logs/ directory")
+    return problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--modules", nargs="+", default=list(BUDGETS_MS))
+    parser.add_argument("--top", type=int, default=8, help="Slowest dependencies listed per module")
+    parser.add_argument("--budget-scale", type=float, default=1.0, help="Multiply every time budget")
+    args = parser.parse_args()
+
+    problems = []
+    for module in args.modules:
+        budget_ms = BUDGETS_MS.get(module, max(BUDGETS_MS.values())) * args.budget_scale
+        problems += check(module, budget_ms, args.top)
+
+    print()
+    if problems:
+        for problem in problems:
+            print(f"FAIL: {problem}")
+        sys.exit(1)
+    print("OK: no heavy imports, all modules within budget")
+
+
+if __name__ == "__main__":
+    main()
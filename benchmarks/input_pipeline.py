@@ -0,0 +1,87 @@
+"""
+Input pipeline throughput: ImageDataGenerator.flow_from_directory vs the tf.data ImageFolderDataset.
+
+Reads every batch of the training split (with and without augmentation)
+and of the validation split through both loaders, without a model, and
+prints images/sec. The tf.data pipeline is read for several epochs: the
+first one decodes the files, the next ones come from its cache.
+
+Usage (from the project root, after data ingestion):
+    python benchmarks/input_pipeline.py
+    python benchmarks/input_pipeline.py --epochs 3 --batch-size 32
+"""
+
+import sys
+import time
+import argparse
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+import tensorflow as tf  # noqa: E402
+
+from cnnClassifier.config.configuration import ConfigurationManager  # noqa: E402
+from cnnClassifier.components.backbones import get_preprocess_function  # noqa: E402
+from cnnClassifier.components.image_dataset import ImageFolderDataset  # noqa: E402
+from cnnClassifier.components.augmentation import POLICY, augment_batches  # noqa: E402
+
+
+def images_per_second(batches) -> float:
+    """Read every batch of an iterable once."""
+    start = time.perf_counter()
+    images = sum(len(images) for images, _ in batches)
+    return images / (time.perf_counter() - start)
+
+
+def generator_batches(generator):
+    for step in range(len(generator)):
+        yield generator[step]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--epochs", type=int, default=2, help="tf.data epochs (the first is uncached)")
+    parser.add_argument("--batch-size", type=int, default=None, help="Default: BATCH_SIZE")
+    args = parser.parse_args()
+
+    config = ConfigurationManager().get_training_config()
+    batch_size = args.batch_size or config.params_batch_size
+    size = config.params_image_size[:-1]
+
+    cases = [("training", "train, augmented", True), ("training", "train", False), ("validation", "valid", False)]
+    rows = []
+    for subset, name, augmented in cases:
+        datagenerator = tf.keras.preprocessing.image.ImageDataGenerator(
+            preprocessing_function=get_preprocess_function(config.params_backbone),
+            validation_split=0.20,
+            **(POLICY if augmented else {})
+        )
+        generator = datagenerator.flow_from_directory(
+            directory=config.training_data, subset=subset, shuffle=subset == "training",
+            target_size=size, batch_size=batch_size, interpolation="bilinear"
+        )
+        baseline = images_per_second(generator_batches(generator))
+
+        dataset = ImageFolderDataset(
+            directory=config.training_data, image_size=size, batch_size=batch_size,
+            backbone=config.params_backbone, subset=subset, validation_split=0.20,
+            shuffle=subset == "training", batch_augment=augment_batches() if augmented else None
+        ).dataset
+        epochs = [images_per_second(dataset) for _ in range(args.epochs)]
+        rows.append((name, generator.samples, baseline, epochs))
+
+    print(f"\n{config.params_backbone}, batch size {batch_size}, images/sec")
+    print("| split | images | ImageDataGenerator | " + " | ".join(
+        f"tf.data epoch {epoch + 1}" for epoch in range(args.epochs)) + " | speedup |")
+    print("|---|---|---|" + "---|" * args.epochs + "---|")
+    for name, samples, baseline, epochs in rows:
+        print(
+            f"| {name} | {samples} | {baseline:.0f} | "
+            + " | ".join(f"{value:.0f}" for value in epochs)
+            + f" | {epochs[-1] / baseline:.1f}x |"
+        )
+
+
+if __name__ == "__main__":
+    main()
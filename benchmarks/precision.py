@@ -0,0 +1,56 @@
+"""
+float32 vs mixed_bfloat16: validation accuracy and throughput of the trained model, side by side.
+
+Runs the evaluation stage (Evaluation.evaluation) once per precision on the
+same model and validation split, and prints loss, accuracy and images per
+second at BATCH_SIZE. Whether bfloat16 is faster depends on the CPU
+(AVX512_BF16 / AMX); run this on the serving hardware before switching
+PRECISION in params.yaml.
+
+Usage (from the project root, after training):
+    python benchmarks/precision.py
+    python benchmarks/precision.py --model-path model/model.keras
+"""
+
+import sys
+import argparse
+from dataclasses import replace
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+from cnnClassifier.config.configuration import ConfigurationManager  # noqa: E402
+from cnnClassifier.components.model_evaluation import Evaluation  # noqa: E402
+from cnnClassifier.components.precision import PRECISIONS  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--model-path", default=None, help="Model to evaluate (default: evaluation config)")
+    parser.add_argument("--precisions", nargs="+", default=list(PRECISIONS), choices=list(PRECISIONS))
+    args = parser.parse_args()
+
+    eval_config = ConfigurationManager().get_evaluation_config()
+    if args.model_path:
+        eval_config = replace(eval_config, path_of_model=Path(args.model_path))
+
+    rows = []
+    for precision in args.precisions:
+        evaluation = Evaluation(replace(eval_config, params_precision=precision))
+        evaluation.evaluation()
+        rows.append((precision, evaluation.score, evaluation.throughput))
+
+    baseline = rows[0][2]["images_per_second"]
+    print(f"\nbatch size {eval_config.params_batch_size}, {evaluation.valid_generator.samples} validation images")
+    print("| precision | loss | accuracy | images/sec | speedup |")
+    print("|---|---|---|---|---|")
+    for precision, (loss, accuracy), throughput in rows:
+        print(
+            f"| {precision} | {loss:.4f} | {accuracy:.4f} "
+            f"| {throughput['images_per_second']:.1f} | {throughput['images_per_second'] / baseline:.2f}x |"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""
+Serving throughput benchmark for the multi-worker gunicorn setup.
+
+Starts `gunicorn -c gunicorn.conf.py app:app` once per worker count, waits
+for /readyz, fires concurrent /predict requests for a fixed duration and
+prints images/sec and latency percentiles per worker count.
+
+Usage (from the project root, with model/model.keras in place):
+    python benchmarks/serving_throughput.py --image path/to/scan.jpg --workers 1 2 4
+"""
+
+import os
+import sys
+import time
+import argparse
+import subprocess
+import threading
+from pathlib import Path
+
+import httpx
+import numpy as np
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+
+
+def wait_until_ready(url: str, timeout: float) -> None:
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            if httpx.get(f"{url}/readyz", timeout=2).status_code == 200:
+                return
+        except httpx.TransportError:
+            pass
+        time.sleep(0.5)
+    raise TimeoutError(f"Server at {url} not ready after {timeout}s")
+
+
+def run_load(url: str, image_bytes: bytes, concurrency: int, duration: float) -> dict:
+    latencies, errors = [], [0]
+    lock = threading.Lock()
+    stop_at = time.perf_counter() + duration
+
+    def client():
+        with httpx.Client(timeout=60) as session:
+            while time.perf_counter() < stop_at:
+                # Random trailing bytes (ignored by the JPEG/PNG decoder) give every
+                # request a new content hash, so the prediction cache never answers
+                payload = image_bytes + os.urandom(16)
+                start = time.perf_counter()
+                response = session.post(
+                    f"{url}/predict", files={"file": ("scan.jpg", payload, "image/jpeg")}
+                )
+                elapsed = time.perf_counter() - start
+                with lock:
+                    if response.status_code == 200:
+                        latencies.append(elapsed)
+                    else:
+                        errors[0] += 1
+
+    threads = [threading.Thread(target=client) for _ in range(concurrency)]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    wall = time.perf_counter() - started
+
+    latencies_ms = np.asarray(latencies) * 1000.0
+    return {
+        "requests": len(latencies),
+        "errors": errors[0],
+        "images_per_sec": len(latencies) / wall,
+        "p50_ms": float(np.percentile(latencies_ms, 50)) if latencies else float("nan"),
+        "p99_ms": float(np.percentile(latencies_ms, 99)) if latencies else float("nan"),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--image", required=True, help="Image sent with every request")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--concurrency", type=int, default=32, help="Concurrent clients")
+    parser.add_argument("--duration", type=float, default=30.0, help="Seconds of load per run")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--ready-timeout", type=float, default=300.0)
+    parser.add_argument("--project-root", default=str(PROJECT_ROOT), help="Directory holding app.py and model/")
+    args = parser.parse_args()
+
+    image_bytes = Path(args.image).read_bytes()
+    url = f"http://127.0.0.1:{args.port}"
+    rows = []
+
+    for workers in args.workers:
+        env = dict(os.environ, WEB_CONCURRENCY=str(workers), PORT=str(args.port))
+        server = subprocess.Popen(
+            [sys.executable, "-m", "gunicorn", "-c", "gunicorn.conf.py", "app:app"],
+            cwd=args.project_root, env=env,
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+        )
+        try:
+            # /readyz is per worker: poll until several probes in a row succeed
+            for _ in range(workers * 2):
+                wait_until_ready(url, args.ready_timeout)
+            result = run_load(url, image_bytes, args.concurrency, args.duration)
+        finally:
+            server.terminate()
+            server.wait()
+
+        rows.append((workers, result))
+        print(f"workers={workers}: {result}", flush=True)
+
+    baseline = rows[0][1]["images_per_sec"] or float("nan")
+    print("\n| workers | images/sec | speed-up | p50 (ms) | p99 (ms) | errors |")
+    print("|---|---|---|---|---|---|")
+    for workers, result in rows:
+        print(
+            f"| {workers} | {result['images_per_sec']:.1f} | {result['images_per_sec'] / baseline:.2f}x "
+            f"| {result['p50_ms']:.0f} | {result['p99_ms']:.0f} | {result['errors']} |"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Gunicorn settings for serving app.py with several worker processes.
+
+Run with:  gunicorn -c gunicorn.conf.py app:app
+
+Environment variables:
+    WEB_CONCURRENCY  Number of worker processes (default: 1 per 4 cores)
+    PORT             Port to listen on (default: 8000)
+    PROMETHEUS_MULTIPROC_DIR  Empty directory shared by the workers so /metrics
+                     reports all of them (optional)
+"""
+
+import os
+import sys
+
+from cnnClassifier.constants import CONFIG_PATH_YAML
+from cnnClassifier.utils.common import get_cpu_count, configure_tf_threads, read_yaml
+
+cpu_count = get_cpu_count()
+
+# XLA:CPU runtime for serving.jit_compile: with TensorFlow 2.20 (pinned in
+# requirements.txt) the default runtime runs convolutions several times slower.
+# Only set in workers that actually serve an XLA-compiled model; remove it when
+# upgrading to a TensorFlow whose XLA no longer knows this flag (XLA aborts).
+XLA_CPU_FLAGS = "--xla_cpu_use_thunk_runtime=false"
+serving = read_yaml(CONFIG_PATH_YAML).serving
+uses_xla = serving.backend == "keras" and serving.compiled_inference and serving.jit_compile
+
+# Worker processes - each one serves requests with its own event loop
+workers = int(os.environ.get("WEB_CONCURRENCY", max(1, cpu_count // 4)))
+worker_class = "uvicorn.workers.UvicornWorker"
+bind = f"0.0.0.0:{os.environ.get('PORT', '8000')}"
+
+# Import app.py (NumPy, FastAPI) once in the master and fork the workers from
+# it: the imported code is shared copy-on-write instead of being loaded by
+# every worker. TensorFlow is not imported in the master: each worker imports
+# it with the model, after the fork, so no TensorFlow runtime state (thread
+# pools, allocators) is ever forked.
+preload_app = True
+
+# Model load + warm-up happen in the background after the worker boots,
+# /readyz tells the load balancer when a worker can take traffic
+timeout = 120
+graceful_timeout = 30
+
+
+def when_ready(server):
+    """
+    Runs in the master just before the workers are forked: refuse to fork
+    if the preloaded app already holds per-process resources (open cache
+    connections, threads, a loaded model), which the workers would share
+    """
+    app_module = sys.modules.get("app")
+    if app_module is None:
+        return
+    problems = app_module.fork_safety_problems()
+    if "tensorflow" in sys.modules:
+        problems.append("TensorFlow is imported in the master")
+    if problems:
+        raise RuntimeError(f"app.py is not safe to fork: {'; '.join(problems)}")
+    server.log.info("Preloaded app holds no per-process resources, forking workers")
+
+
+def post_fork(server, worker):
+    """
+    Give each worker its share of the cores: intra-op threads = cores / workers
+    (set before TensorFlow runs its first op in this worker), and select the
+    XLA CPU runtime when the model is served XLA-compiled (read by XLA when
+    the worker compiles its first bucket)
+    """
+    configure_tf_threads(workers=server.cfg.workers, cpu_count=cpu_count)
+    if uses_xla and XLA_CPU_FLAGS not in os.environ.get("XLA_FLAGS", ""):
+        os.environ["XLA_FLAGS"] = f"{os.environ.get('XLA_FLAGS', '')} {XLA_CPU_FLAGS}".strip()
+
+
+def child_exit(server, worker):
+    """
+    With PROMETHEUS_MULTIPROC_DIR set, /metrics aggregates every worker:
+    drop the live gauges of a worker that exited
+    """
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        from prometheus_client import multiprocess
+        multiprocess.mark_process_dead(worker.pid)
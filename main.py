@@ -3,6 +3,18 @@ from cnnClassifier.pipeline.stage_01_data_ingestion import DataIngestionTraining
 from cnnClassifier.pipeline.stage_02_prepare_base_model import PrepareBaseModelTrainingPipeline
 from cnnClassifier.pipeline.stage_03_model_training import ModelTrainingPipeline
 from cnnClassifier.pipeline.stage_04_model_evaluation import EvaluationPipeline
+from cnnClassifier.pipeline.stage_05_model_export import ModelExportPipeline
+from cnnClassifier.pipeline.stage_06_model_quantization import ModelQuantizationPipeline
+from cnnClassifier.pipeline.stage_07_feature_extraction import FeatureExtractionPipeline
+from cnnClassifier.pipeline.stage_08_model_distillation import ModelDistillationPipeline
+from cnnClassifier.pipeline.stage_09_model_compression import ModelCompressionPipeline
+from cnnClassifier.pipeline.stage_10_serving_export import ServingExportPipeline
+from cnnClassifier.pipeline.stage_11_dataset_packing import DatasetPackingPipeline
+from cnnClassifier.constants import PARAMS_FILE_PATH
+from cnnClassifier.utils.common import read_yaml
+
+# Switches of the optional stages
+params = read_yaml(PARAMS_FILE_PATH)
 # Stage name used for logging and pipeline monitoring
 STAGE_NAME = "Data Ingestion Stage"
 
@@ -17,6 +29,17 @@ except Exception as e:
     raise 
 
 
+STAGE_NAME = "Dataset Packing Stage"
+try:
+    logger.info(f">>>>>> stage {STAGE_NAME}<<<<<<")
+    obj = DatasetPackingPipeline()
+    obj.main()
+    logger.info(f">>>>> stage {STAGE_NAME} Completed<<<<<<\n\n")
+except Exception as e:
+    logger.exception(e)
+    raise e
+
+
 # Stage name used for logging and pipeline monitoring
 STAGE_NAME = "Prepare Base Model Training Stage"
 
@@ -31,6 +54,21 @@ except Exception as e:
     raise 
 
 
+# Stage name used for logging and pipeline monitoring
+STAGE_NAME = "Feature Extraction Stage"
+# Only when Training reads the cached features (same condition as stage_03)
+if params.FEATURE_CACHE and not params.AUGMENTATION:
+    try:
+        logger.info(f">>>>>> stage {STAGE_NAME}<<<<<<")
+        obj = FeatureExtractionPipeline()
+        obj.main()
+        logger.info(f">>>>> stage {STAGE_NAME} Completed<<<<<<\n\n")
+    except Exception as e:
+
+        logger.exception(e)
+        raise 
+
+
 # Stage name used for logging and pipeline monitoring
 STAGE_NAME = "Model Training Stage"
 
@@ -44,6 +82,30 @@ except Exception as e:
     logger.exception(e)
     raise 
 
+STAGE_NAME = "Model Distillation Stage"
+try:
+    logger.info(f">>>>>> stage {STAGE_NAME}<<<<<<")
+    obj = ModelDistillationPipeline()
+    obj.main()
+    logger.info(f">>>>> stage {STAGE_NAME} Completed<<<<<<\n\n")
+except Exception as e:
+    logger.exception(e)
+    raise e
+
+
+STAGE_NAME = "Model Compression Stage"
+# Optional: only with COMPRESSION: True in params.yaml
+if params.COMPRESSION:
+    try:
+        logger.info(f">>>>>> stage {STAGE_NAME}<<<<<<")
+        obj = ModelCompressionPipeline()
+        obj.main()
+        logger.info(f">>>>> stage {STAGE_NAME} Completed<<<<<<\n\n")
+    except Exception as e:
+        logger.exception(e)
+        raise e
+
+
 STAGE_NAME = "Evaluation Stage"
 try:
     logger.info(f"*"*30)
@@ -54,4 +116,37 @@ try:
     
 except Exception  as e:
     logger.exception(e)
-    raise e 
\ No newline at end of file
+    raise e
+
+
+STAGE_NAME = "Model Export Stage"
+try:
+    logger.info(f">>>>>> stage {STAGE_NAME}<<<<<<")
+    obj = ModelExportPipeline()
+    obj.main()
+    logger.info(f">>>>> stage {STAGE_NAME} Completed<<<<<<\n\n")
+except Exception as e:
+    logger.exception(e)
+    raise e
+
+
+STAGE_NAME = "Model Quantization Stage"
+try:
+    logger.info(f">>>>>> stage {STAGE_NAME}<<<<<<")
+    obj = ModelQuantizationPipeline()
+    obj.main()
+    logger.info(f">>>>> stage {STAGE_NAME} Completed<<<<<<\n\n")
+except Exception as e:
+    logger.exception(e)
+    raise e
+
+
+STAGE_NAME = "Serving Export Stage"
+try:
+    logger.info(f">>>>>> stage {STAGE_NAME}<<<<<<")
+    obj = ServingExportPipeline()
+    obj.main()
+    logger.info(f">>>>> stage {STAGE_NAME} Completed<<<<<<\n\n")
+except Exception as e:
+    logger.exception(e)
+    raise e
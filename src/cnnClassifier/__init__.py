@@ -13,18 +13,30 @@ logging_str = "[%(asctime)s: %(levelname)s: %(module)s: %(message)s:]"
 # Directory where log files will be stored
 log_dir = "logs"
 
-# Create logs directory if it does not already exist
-os.makedirs(log_dir, exist_ok=True)
-
 # Full path to the log file
 log_filepath = os.path.join(log_dir, "running_logs.log")
 
+
+class LazyFileHandler(logging.FileHandler):
+    """
+    FileHandler that creates the logs directory and opens the file on the
+    first record, so importing the package has no filesystem side effects.
+    """
+
+    def __init__(self, filename, mode="a"):
+        super().__init__(filename, mode=mode, delay=True)
+
+    def _open(self):
+        os.makedirs(os.path.dirname(self.baseFilename), exist_ok=True)
+        return super()._open()
+
+
 # Configure root logger settings
 logging.basicConfig(
     level=logging.INFO,                 # Log INFO level and above
     format=logging_str,                 # Apply custom log format
     handlers=[
-        logging.FileHandler(log_filepath, mode="a"),  # Save logs to file (append mode)
+        LazyFileHandler(log_filepath, mode="a"),  # Save logs to file (append mode, opened on first record)
         logging.StreamHandler(sys.stdout)              # Also display logs in console
     ]
 )
@@ -0,0 +1,123 @@
+"""
+cnnClassifier.components.augmentation
+
+This module contains the data augmentation helpers responsible for:
+- The augmentation policy of Training (rotation, flip, shifts, shear, zoom)
+- Applying it to whole batches with Keras preprocessing layers, inside the
+  tf.data graph (vectorized, no Python per image)
+- The previous per-image ImageDataGenerator.random_transform path, kept as
+  the reference of the policy and for the throughput benchmark
+- Stripping augmentation layers from a model before it is exported
+"""
+
+import math
+
+import tensorflow as tf
+
+# Same values ImageDataGenerator was given (ImageDataGenerator units)
+POLICY = dict(
+    rotation_range=40,          # Rotate up to 40 degrees left or right
+    horizontal_flip=True,       # Flip left ↔ right
+    width_shift_range=0.2,      # Shift up to 20% of the width
+    height_shift_range=0.2,     # Shift up to 20% of the height
+    shear_range=0.2,            # Slant (rectangle → parallelogram), in degrees
+    zoom_range=0.2              # Zoom in/out up to 20%, independently per axis
+)
+
+# ImageDataGenerator's default: fill the uncovered border with the nearest pixel
+FILL_MODE = "nearest"
+
+
+AUGMENTATION_LAYERS = (
+    tf.keras.layers.RandomFlip, tf.keras.layers.RandomRotation, tf.keras.layers.RandomTranslation,
+    tf.keras.layers.RandomZoom, tf.keras.layers.RandomShear,
+)
+
+
+def batch_augmentation(seed: int = None) -> tf.keras.Sequential:
+    """
+    POLICY as Keras preprocessing layers working on whole (N, H, W, 3) batches.
+
+    Every image of a batch still gets its own random transform. Each layer
+    gets its own seed so the random draws of the layers are independent.
+    """
+    def layer_seed(offset: int):
+        return None if seed is None else seed + offset
+
+    # ImageDataGenerator shears by an angle (degrees) along the rows:
+    # the matching RandomShear intensity is its tangent
+    shear = math.tan(math.radians(POLICY["shear_range"]))
+    zoom = (-POLICY["zoom_range"], POLICY["zoom_range"])
+
+    return tf.keras.Sequential([
+        tf.keras.layers.RandomRotation(POLICY["rotation_range"] / 360, fill_mode=FILL_MODE, seed=layer_seed(0)),
+        tf.keras.layers.RandomTranslation(
+            POLICY["height_shift_range"], POLICY["width_shift_range"], fill_mode=FILL_MODE, seed=layer_seed(1)
+        ),
+        tf.keras.layers.RandomShear(x_factor=0.0, y_factor=shear, fill_mode=FILL_MODE, seed=layer_seed(2)),
+        tf.keras.layers.RandomZoom(zoom, zoom, fill_mode=FILL_MODE, seed=layer_seed(3)),
+        tf.keras.layers.RandomFlip("horizontal", seed=layer_seed(4)),
+    ], name="augmentation")
+
+
+def augment_batches(seed: int = None):
+    """
+    POLICY as a function on float32 batches in [0, 255], for ImageFolderDataset(batch_augment=...)
+    """
+    layers = batch_augmentation(seed)
+
+    def augment(images):
+        return layers(images, training=True)
+
+    return augment
+
+
+def random_transform_augment(generator=None):
+    """
+    ImageDataGenerator.random_transform (one image, scipy) as a function
+    on float32 image tensors, for ImageFolderDataset(augment=...)
+
+    The per-image path Training used before batch_augmentation(); the
+    input_pipeline benchmark compares the two.
+    """
+    if generator is None:
+        generator = tf.keras.preprocessing.image.ImageDataGenerator(**POLICY)
+
+    def augment(image):
+        transformed = tf.numpy_function(
+            lambda x: generator.random_transform(x).astype("float32"), [image], tf.float32
+        )
+        transformed.set_shape(image.shape)
+        return transformed
+
+    return augment
+
+
+def strip_augmentation(model: tf.keras.Model) -> tf.keras.Model:
+    """
+    Return model without augmentation layers (they are replaced by Identity).
+
+    Random* layers are no-ops at inference but still add ops and seed state
+    to an exported graph. Training applies augmentation in the input
+    pipeline, so its models normally have none and are returned unchanged.
+    """
+    def is_augmentation(layer) -> bool:
+        if isinstance(layer, AUGMENTATION_LAYERS):
+            return True
+        return isinstance(layer, tf.keras.Sequential) and bool(layer.layers) and all(
+            is_augmentation(inner) for inner in layer.layers
+        )
+
+    if not any(is_augmentation(layer) for layer in model.layers):
+        return model
+
+    def clone(layer):
+        if is_augmentation(layer):
+            return tf.keras.layers.Identity(name=layer.name)
+        return layer.__class__.from_config(layer.get_config())
+
+    stripped = tf.keras.models.clone_model(model, clone_function=clone)
+    for layer in model.layers:
+        if not is_augmentation(layer) and layer.weights:
+            stripped.get_layer(layer.name).set_weights(layer.get_weights())
+    return stripped
@@ -0,0 +1,62 @@
+"""
+cnnClassifier.components.backbones
+
+This module contains the backbone registry responsible for:
+- Mapping the BACKBONE name in params.yaml to a Keras application
+- Building the pre-trained convolutional base of that backbone
+- Returning the backbone's own input preprocessing function
+"""
+
+import numpy as np
+import tensorflow as tf
+
+# BACKBONE name -> (tf.keras.applications module, constructor name)
+BACKBONES = {
+    "VGG16": ("vgg16", "VGG16"),
+    "ResNet50": ("resnet50", "ResNet50"),
+    "MobileNetV2": ("mobilenet_v2", "MobileNetV2"),
+    "EfficientNetB0": ("efficientnet", "EfficientNetB0"),
+}
+
+
+def _application_module(name: str):
+    if name not in BACKBONES:
+        raise ValueError(f"Unknown BACKBONE {name!r}, expected one of {list(BACKBONES)}")
+    return getattr(tf.keras.applications, BACKBONES[name][0])
+
+
+def build_backbone(name: str, input_shape, weights, include_top: bool) -> tf.keras.Model:
+    """
+    Create the convolutional base of a backbone.
+
+    Args:
+        name: One of BACKBONES (e.g. "MobileNetV2").
+        input_shape: (height, width, channels).
+        weights: "imagenet" for pre-trained weights, None for random initialization.
+        include_top: Keep the original ImageNet classification head.
+    """
+    constructor = getattr(_application_module(name), BACKBONES[name][1])
+    return constructor(input_shape=input_shape, weights=weights, include_top=include_top)
+
+
+def get_preprocess_input(name: str):
+    """The backbone's preprocess_input as is (safe on tensors, which it never modifies in place)."""
+    return _application_module(name).preprocess_input
+
+
+def get_preprocess_function(name: str):
+    """
+    The backbone's preprocess_input, wrapped so it never modifies its argument.
+
+    It takes raw RGB pixels in [0, 255] (one image or a batch) and returns
+    what the backbone was trained on: BGR mean-subtracted for VGG16/ResNet50,
+    [-1, 1] for MobileNetV2 and unchanged pixels for EfficientNetB0 (which
+    rescales inside the model).
+    """
+    preprocess_input = get_preprocess_input(name)
+
+    def preprocess(images):
+        # preprocess_input works in place on float arrays, so hand it a copy
+        return preprocess_input(np.array(images, dtype="float32", copy=True))
+
+    return preprocess
@@ -0,0 +1,200 @@
+"""
+cnnClassifier.components.batch_prediction
+
+This module contains the BatchPrediction component responsible for:
+- Expanding zip archives of scans into individual images
+- Decoding many uploaded images in parallel
+- Running them through the model in fixed-size batches
+- Yielding per-image results as soon as each batch completes
+"""
+
+import asyncio
+import zipfile
+import io
+from pathlib import PurePosixPath
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from cnnClassifier import logger
+from cnnClassifier.pipeline.prediction import decode_image_into, decode_predictions
+
+# File types picked out of uploaded zip archives
+IMAGE_EXTENSIONS = (".jpg", ".jpeg", ".png", ".bmp")
+
+
+class RequestTooLargeError(ValueError):
+    """Raised when a batch request exceeds the configured size cap."""
+
+
+def expand_zip(data: bytes, max_bytes: int) -> list:
+    """
+    Read the images contained in a zip archive.
+
+    Args:
+        data: Raw bytes of the zip archive.
+        max_bytes: Cap on the total uncompressed size of the images.
+
+    Raises:
+        RequestTooLargeError: If the images would exceed max_bytes once extracted.
+
+    Returns:
+        list: (filename, bytes) pairs in archive order.
+    """
+    items = []
+    with zipfile.ZipFile(io.BytesIO(data)) as archive:
+        members = [
+            member for member in archive.infolist()
+            if not member.is_dir()
+            and PurePosixPath(member.filename).suffix.lower() in IMAGE_EXTENSIONS
+            and not PurePosixPath(member.filename).name.startswith(".")
+        ]
+
+        # Check declared sizes first so a zip bomb is never inflated
+        total = sum(member.file_size for member in members)
+        if total > max_bytes:
+            raise RequestTooLargeError(
+                f"Archive expands to {total} bytes, limit is {max_bytes}"
+            )
+
+        for member in members:
+            items.append((member.filename, archive.read(member)))
+
+    return items
+
+
+class BatchPrediction:
+    """
+    Runs many images through the model in fixed-size batches.
+
+    Images of the next batch are decoded in parallel while the current
+    batch is in the model, and results are yielded batch by batch so a
+    caller can stream them back.
+
+    With encoded=True the model decodes images itself (serving_export
+    SavedModel): the raw bytes of a batch go straight to predict_fn.
+    """
+
+    def __init__(self, predict_fn, image_size, batch_size: int = 16, decode_workers: int = 4,
+                 inference=None, encoded: bool = False):
+        """
+        Args:
+            predict_fn: Callable taking an (N, H, W, C) array and returning (N, classes).
+            image_size: (height, width, channels) expected by the model.
+            batch_size: Number of images per forward pass.
+            decode_workers: Threads used to decode images in parallel.
+            inference: Optional InferenceExecutor the forward passes are run on.
+            encoded: predict_fn takes a list of encoded images (bytes) instead of pixels.
+        """
+        self.predict_fn = predict_fn
+        self.inference = inference
+        self.encoded = encoded
+        self.image_size = tuple(image_size)
+        self.batch_size = batch_size
+        self._decode_pool = ThreadPoolExecutor(
+            max_workers=decode_workers, thread_name_prefix="batch-decode"
+        )
+
+    def shutdown(self) -> None:
+        """Stop the decode threads."""
+        self._decode_pool.shutdown(wait=True)
+
+    def _decode_batch(self, items: list, buffer: np.ndarray) -> list:
+        """Start decoding one batch of (filename, bytes) into buffer, one slot per image."""
+        return [
+            asyncio.wrap_future(self._decode_pool.submit(decode_image_into, data, buffer[slot]))
+            for slot, (_, data) in enumerate(items)
+        ]
+
+    async def _predict(self, batch):
+        if self.inference is not None:
+            # Request was already admitted, so wait for a slot rather than fail mid-stream
+            return await self.inference.run(self.predict_fn, batch, wait=True)
+        return await asyncio.to_thread(self.predict_fn, batch)
+
+    async def _predict_encoded(self, batch: list) -> list:
+        """
+        Run a batch of encoded images, returning one probability row or
+        exception per image. One undecodable image fails the whole graph
+        call, so a failed batch is retried image by image.
+        """
+        try:
+            return list(await self._predict([data for _, data in batch]))
+        except Exception:
+            if len(batch) == 1:
+                raise
+        decoded = []
+        for item in batch:
+            try:
+                decoded.append((await self._predict([item[1]]))[0])
+            except Exception as e:
+                decoded.append(e)
+        return decoded
+
+    async def stream(self, items: list):
+        """
+        Predict every image and yield one result dict per image.
+
+        Args:
+            items: (filename, bytes) pairs.
+
+        Yields:
+            dict: {"index", "filename", "status", "prediction", "probabilities"}
+                  or {"index", "filename", "status": "error", "error"}.
+        """
+        batches = [
+            items[start:start + self.batch_size]
+            for start in range(0, len(items), self.batch_size)
+        ]
+        if not batches:
+            return
+
+        if self.encoded:
+            for number, batch in enumerate(batches):
+                try:
+                    probabilities = await self._predict_encoded(batch)
+                except Exception as e:
+                    probabilities = [e]
+                for slot, (filename, _) in enumerate(batch):
+                    yield {"index": number * self.batch_size + slot, "filename": filename,
+                           **self._result(filename, probabilities[slot])}
+            return
+
+        # Two preallocated buffers: one is being decoded while the other is in the model
+        buffers = [
+            np.empty((self.batch_size,) + self.image_size, dtype="float32")
+            for _ in range(min(2, len(batches)))
+        ]
+        pending = self._decode_batch(batches[0], buffers[0])
+
+        for number, batch in enumerate(batches):
+            buffer = buffers[number % len(buffers)]
+            decoded = await asyncio.gather(*pending, return_exceptions=True)
+
+            if number + 1 < len(batches):
+                # Decode the next batch while this one runs through the model
+                pending = self._decode_batch(batches[number + 1], buffers[(number + 1) % len(buffers)])
+
+            ok = [slot for slot, result in enumerate(decoded) if not isinstance(result, Exception)]
+            probabilities = []
+            if ok:
+                batch_array = buffer[:len(batch)] if len(ok) == len(batch) else buffer[ok]
+                probabilities = await self._predict(batch_array)
+
+            rows = dict(zip(ok, probabilities))
+            offset = number * self.batch_size
+            for slot, (filename, _) in enumerate(batch):
+                yield {"index": offset + slot, "filename": filename,
+                       **self._result(filename, rows.get(slot, decoded[slot]))}
+
+    @staticmethod
+    def _result(filename: str, outcome) -> dict:
+        """Result fields of one image from its probabilities or its decode exception."""
+        if isinstance(outcome, Exception):
+            logger.warning(f"Could not decode {filename}: {outcome}")
+            return {"status": "error", "error": f"Could not decode image: {outcome}"}
+        return {
+            "status": "success",
+            "prediction": decode_predictions(outcome)[0]["image"],
+            "probabilities": [float(p) for p in outcome],
+        }
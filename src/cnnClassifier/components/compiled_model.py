@@ -0,0 +1,101 @@
+"""
+cnnClassifier.components.compiled_model
+
+This module contains the CompiledModel component responsible for:
+- Compiling the forward pass of a Keras model with XLA (tf.function(jit_compile=True))
+- Tracing it once per batch-size bucket, so request sizes never trigger a retrace
+- Padding every batch up to the nearest bucket (and splitting batches larger
+  than the biggest bucket)
+- Exposing the same predict_on_batch() call as a Keras model
+"""
+
+import threading
+
+import numpy as np
+import tensorflow as tf
+
+DEFAULT_BUCKETS = (1, 4, 8, 16, 32)
+
+
+class CompiledModel:
+    """
+    Keras model behind one XLA-compiled concrete function per batch bucket.
+
+    model.predict / predict_on_batch go through Keras' generic data-adapter
+    and step machinery on every call; here a call is a numpy pad, one
+    compiled function call and a slice.
+    """
+
+    def __init__(self, model: tf.keras.Model, buckets=DEFAULT_BUCKETS, jit_compile: bool = True):
+        """
+        Args:
+            model: Loaded Keras model (inference only).
+            buckets: Batch sizes to compile for; other sizes are padded up to the next one.
+            jit_compile: Compile with XLA. False keeps the bucketing with a plain tf.function.
+        """
+        self.model = model
+        self.buckets = tuple(sorted(set(int(size) for size in buckets)))
+        self.jit_compile = jit_compile
+        self._forward = tf.function(self._call, jit_compile=jit_compile, autograph=False)
+        self._functions = {}
+        self._lock = threading.Lock()
+
+    def _call(self, images):
+        return self.model(images, training=False)
+
+    def __getattr__(self, name):
+        # input_shape, count_params(), ... of the wrapped model
+        return getattr(self.model, name)
+
+    def bucket(self, batch_size: int) -> int:
+        """Smallest bucket that holds batch_size images (the largest bucket if none does)."""
+        for size in self.buckets:
+            if size >= batch_size:
+                return size
+        return self.buckets[-1]
+
+    def _function(self, bucket: int):
+        """Concrete function of a bucket, traced and compiled on first use."""
+        function = self._functions.get(bucket)
+        if function is None:
+            with self._lock:
+                function = self._functions.get(bucket)
+                if function is None:
+                    shape = [bucket] + list(self.model.input_shape[1:])
+                    function = self._forward.get_concrete_function(tf.TensorSpec(shape, tf.float32))
+                    self._functions[bucket] = function
+        return function
+
+    def compile_buckets(self) -> None:
+        """Trace and compile every bucket now (one forward pass each) instead of on first use."""
+        for size in self.buckets:
+            self.predict_on_batch(np.zeros([size] + list(self.model.input_shape[1:]), dtype="float32"))
+
+    def predict_on_batch(self, batch: np.ndarray) -> np.ndarray:
+        """
+        Run one forward pass.
+
+        Args:
+            batch: Preprocessed images of shape (N, height, width, 3).
+
+        Returns:
+            np.ndarray: Model outputs of shape (N, classes).
+        """
+        batch = np.asarray(batch, dtype="float32")
+        if len(batch) > self.buckets[-1]:
+            return self.predict(batch, batch_size=self.buckets[-1])
+
+        bucket = self.bucket(len(batch))
+        if bucket != len(batch):
+            padded = np.zeros((bucket,) + batch.shape[1:], dtype="float32")
+            padded[:len(batch)] = batch
+        else:
+            padded = batch
+        return self._function(bucket)(tf.constant(padded)).numpy()[:len(batch)]
+
+    def predict(self, images: np.ndarray, batch_size: int = 32) -> np.ndarray:
+        """Run predict_on_batch() over images in chunks of batch_size."""
+        return np.concatenate([
+            self.predict_on_batch(images[start:start + batch_size])
+            for start in range(0, len(images), batch_size)
+        ])
@@ -0,0 +1,220 @@
+"""
+cnnClassifier.components.dataset_packing
+
+This module contains the DatasetPacking component responsible for:
+- Decoding and resizing every extracted image once, right after ingestion
+- Writing the uint8 pixels to one memory-mapped .npy store (ImageStore)
+  or to fixed-size TFRecord shards
+- An index (index.json) with the store/shard list, class indices, the image
+  order, the labels and a fingerprint of the source folder
+- Reading the shards back sequentially as a tf.data pipeline
+"""
+
+import os
+from pathlib import Path
+
+import numpy as np
+import tensorflow as tf
+
+from cnnClassifier import logger
+from cnnClassifier.entitiy.config_entity import DatasetPackingConfig
+from cnnClassifier.components.image_dataset import AUTOTUNE, list_images, load_pixels
+from cnnClassifier.components.image_store import ImageStore
+from cnnClassifier.utils.common import dataset_fingerprint, load_json, save_json
+
+# dataset_packing.format in config.yaml
+FORMATS = ("memmap", "tfrecord")
+
+# Large sequential reads: shards are read front to back, never seeked
+READ_BUFFER_BYTES = 8 * 2**20
+
+RECORD_FEATURES = {
+    "position": tf.io.FixedLenFeature([], tf.int64),
+    "label": tf.io.FixedLenFeature([], tf.int64),
+    "pixels": tf.io.FixedLenFeature([], tf.string),
+}
+
+
+def _int64(value: int) -> tf.train.Feature:
+    return tf.train.Feature(int64_list=tf.train.Int64List(value=[value]))
+
+
+def _bytes(value: bytes) -> tf.train.Feature:
+    return tf.train.Feature(bytes_list=tf.train.BytesList(value=[value]))
+
+
+def packed_fingerprint(source_dir, image_size) -> dict:
+    """
+    Everything the packed files depend on.
+
+    The source folder is fingerprinted by relative path and size only: DVC
+    restores and fresh checkouts give the same images new mtimes, and the
+    packed files must stay valid for them.
+    """
+    return {
+        "dataset": dataset_fingerprint(source_dir, mtime=False),
+        "image_size": [int(size) for size in image_size[:2]],
+    }
+
+
+def load_packed_index(index_path, source_dir, image_size):
+    """
+    The packing index, if it exists and matches the current source folder and IMAGE_SIZE.
+
+    Returns:
+        ConfigBox or None: None when the packed files are missing or stale.
+    """
+    if index_path is None or not Path(index_path).exists():
+        return None
+    index = load_json(Path(index_path))
+    if index.fingerprint.to_dict() != packed_fingerprint(source_dir, image_size):
+        logger.warning(f"Packed dataset {index_path} is stale, decoding the image files instead")
+        return None
+    return index
+
+
+def read_packed(index, index_path, positions: np.ndarray) -> tf.data.Dataset:
+    """
+    Sequential tf.data reader of the packed images at `positions`.
+
+    Args:
+        index: Index returned by load_packed_index().
+        index_path: Path of index.json (shard paths are relative to its folder).
+        positions: Positions of the wanted images in the index's file order.
+
+    Returns:
+        tf.data.Dataset: (uint8 pixels (H, W, 3), position in the index's file order)
+        in shard order.
+    """
+    height, width = index.fingerprint.image_size
+    wanted = np.zeros(len(index.files), dtype=bool)
+    wanted[positions] = True
+    wanted = tf.constant(wanted)
+
+    shard_paths = [str(Path(index_path).parent / shard.file) for shard in index.shards]
+
+    def parse(record):
+        example = tf.io.parse_single_example(record, RECORD_FEATURES)
+        pixels = tf.reshape(tf.io.decode_raw(example["pixels"], tf.uint8), [height, width, 3])
+        return example["position"], pixels, tf.cast(example["label"], tf.int32)
+
+    dataset = tf.data.TFRecordDataset(shard_paths, buffer_size=READ_BUFFER_BYTES)
+    dataset = dataset.map(parse, num_parallel_calls=AUTOTUNE)
+    dataset = dataset.filter(lambda position, pixels, label: tf.gather(wanted, position))
+    return dataset.map(lambda position, pixels, label: (pixels, tf.cast(position, tf.int32)))
+
+
+class DatasetPacking:
+    """
+    Packs artifacts/data_ingestion/kidney-ct-scan-image into pre-decoded files.
+
+    Every image is decoded and resized to IMAGE_SIZE once. dataset_packing.format
+    in config.yaml chooses how the uint8 pixels are stored:
+
+    - "memmap": one contiguous (N, H, W, 3) .npy file (ImageStore), for
+      datasets that fit on disk as a single array; random access, no decoding
+    - "tfrecord": fixed-size TFRecord shards holding raw uint8 bytes, the
+      label and the position of each image, read front to back
+
+    Training and evaluation then skip decoding thousands of JPEGs on every run.
+    """
+
+    def __init__(self, config: DatasetPackingConfig):
+        if config.format not in FORMATS:
+            raise ValueError(f"Unknown dataset_packing format {config.format!r}, expected one of {FORMATS}")
+        self.config = config
+
+    def is_up_to_date(self) -> bool:
+        """True when index.json matches the source folder and format, and its files exist."""
+        index = load_packed_index(self.config.index_path, self.config.source_dir, self.config.params_image_size)
+        if index is None or index.get("format", "tfrecord") != self.config.format:
+            return False
+        root = self.config.index_path.parent
+        if index.format == "memmap":
+            return (root / index.store).exists()
+        return all((root / shard.file).exists() for shard in index.shards)
+
+    def _clear(self) -> None:
+        # Drop the old index first so half-written files are never used
+        if self.config.index_path.exists():
+            self.config.index_path.unlink()
+        os.makedirs(self.config.shard_dir, exist_ok=True)
+        for shard in Path(self.config.shard_dir).glob("*.tfrecord"):
+            shard.unlink()
+        if self.config.store_path.exists():
+            self.config.store_path.unlink()
+
+    def _write_shards(self, images, labels: np.ndarray) -> dict:
+        shard_size = self.config.shard_size
+        num_shards = max(1, -(-len(labels) // shard_size))
+
+        shards = []
+        writer = None
+        for position, pixels in enumerate(images):
+            if position % shard_size == 0:
+                if writer is not None:
+                    writer.close()
+                path = Path(self.config.shard_dir) / f"shard-{len(shards):05d}-of-{num_shards:05d}.tfrecord"
+                writer = tf.io.TFRecordWriter(str(path))
+                shards.append({"file": os.path.relpath(path, self.config.index_path.parent), "count": 0})
+            record = tf.train.Example(features=tf.train.Features(feature={
+                "position": _int64(position),
+                "label": _int64(int(labels[position])),
+                "pixels": _bytes(pixels.tobytes()),
+            }))
+            writer.write(record.SerializeToString())
+            shards[-1]["count"] += 1
+        if writer is not None:
+            writer.close()
+
+        logger.info(f"Wrote {len(shards)} TFRecord shards to {self.config.shard_dir}")
+        return {"shards": shards}
+
+    def _write_store(self, images, labels: np.ndarray) -> dict:
+        store = ImageStore.create(self.config.store_path, len(labels), self.config.params_image_size)
+        for position, pixels in enumerate(images):
+            store[position] = pixels
+        store.flush()
+        logger.info(
+            f"Wrote image store {store.shape} to {self.config.store_path} "
+            f"({store.nbytes / 2**20:.1f} MB)"
+        )
+        del store
+        return {"store": os.path.relpath(self.config.store_path, self.config.index_path.parent)}
+
+    def pack(self) -> bool:
+        """
+        Decode every image (in parallel) and write the packed files and the index.
+
+        Returns:
+            bool: False if the packed files were still up to date (nothing done).
+        """
+        if self.is_up_to_date():
+            logger.info(f"Packed dataset {self.config.index_path} is up to date, skipping")
+            return False
+        self._clear()
+
+        source_dir = self.config.source_dir
+        size = tuple(self.config.params_image_size[:2])
+        filepaths, labels, class_indices = list_images(source_dir)
+
+        images = tf.data.Dataset.from_tensor_slices(filepaths).map(
+            lambda path: load_pixels(path, size), num_parallel_calls=AUTOTUNE
+        ).prefetch(AUTOTUNE).as_numpy_iterator()
+
+        if self.config.format == "memmap":
+            layout = self._write_store(images, labels)
+        else:
+            layout = self._write_shards(images, labels)
+
+        save_json(path=self.config.index_path, data={
+            "fingerprint": packed_fingerprint(source_dir, size),
+            "format": self.config.format,
+            "class_indices": class_indices,
+            **layout,
+            # Image order of the packed files, relative to the source folder
+            "files": [os.path.relpath(path, source_dir) for path in filepaths],
+            "labels": labels.tolist(),
+        })
+        logger.info(f"Packed {len(filepaths)} images of {size[0]}x{size[1]} ({self.config.format})")
+        return True
@@ -0,0 +1,64 @@
+"""
+cnnClassifier.components.event_loop_monitor
+
+This module contains the EventLoopMonitor component responsible for:
+- Measuring how late the asyncio event loop wakes up (event-loop lag)
+- Reporting p50/p99 lag so blocking work on the loop becomes visible
+"""
+
+import asyncio
+from collections import deque
+
+import numpy as np
+
+
+class EventLoopMonitor:
+    """
+    Sleeps for a fixed interval in a background task and records how much
+    later than requested it woke up. A loop blocked by synchronous work
+    (e.g. a model call inside an async handler) shows up as lag.
+    """
+
+    def __init__(self, interval_ms: float = 100.0, window: int = 600):
+        """
+        Args:
+            interval_ms: Time between two probes.
+            window: Number of most recent probes kept for percentiles.
+        """
+        self.interval = interval_ms / 1000.0
+        self._lags = deque(maxlen=window)
+        self._task = None
+
+    async def _probe(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            start = loop.time()
+            await asyncio.sleep(self.interval)
+            self._lags.append(max(loop.time() - start - self.interval, 0.0))
+
+    def start(self) -> None:
+        """Start probing on the running event loop."""
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._probe())
+
+    async def stop(self) -> None:
+        """Cancel the probe task."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def stats(self) -> dict:
+        """p50, p99 and max event-loop lag in milliseconds over the recent window."""
+        lags = np.asarray(self._lags) * 1000.0
+        if not lags.size:
+            return {"p50": None, "p99": None, "max": None, "samples": 0}
+        return {
+            "p50": float(np.percentile(lags, 50)),
+            "p99": float(np.percentile(lags, 99)),
+            "max": float(lags.max()),
+            "samples": int(lags.size),
+        }
@@ -0,0 +1,175 @@
+"""
+cnnClassifier.components.feature_extraction
+
+This module contains the FeatureExtraction component responsible for:
+- Running the frozen backbone once over the training and validation splits,
+  under the same PRECISION as training
+- Storing the bottleneck activations (e.g. (7, 7, 512) for VGG16) and labels
+  as memory-mapped .npy arrays
+- Fingerprinting the base model and the dataset so stale features are recomputed
+- Serving the cached features in batches for head-only training
+"""
+
+import math
+from dataclasses import replace
+from pathlib import Path
+
+import numpy as np
+import tensorflow as tf
+
+from cnnClassifier import logger
+from cnnClassifier.entitiy.config_entity import FeatureExtractionConfig, TrainingConfig
+from cnnClassifier.components.model_training import Training
+from cnnClassifier.components.precision import with_precision
+from cnnClassifier.utils.common import dataset_fingerprint, get_file_hash, load_json, save_json
+
+SPLITS = ("train", "valid")
+
+
+class FeatureBatches(tf.keras.utils.PyDataset):
+    """
+    Batches of cached features read straight from the memory-mapped arrays.
+
+    Only the rows of the current batch are read from disk, so the cache can
+    be larger than RAM.
+    """
+
+    def __init__(self, features: np.ndarray, labels: np.ndarray, batch_size: int, shuffle: bool = False):
+        super().__init__()
+        self.features = features
+        self.labels = labels
+        self.batch_size = batch_size
+        self.shuffle = shuffle
+        self._order = np.arange(len(features))
+        self.on_epoch_end()
+
+    def __len__(self):
+        return math.ceil(len(self.features) / self.batch_size)
+
+    def __getitem__(self, index):
+        rows = self._order[index * self.batch_size:(index + 1) * self.batch_size]
+        # Sorted rows turn random access into mostly sequential reads
+        rows = np.sort(rows)
+        return self.features[rows], self.labels[rows]
+
+    def on_epoch_end(self):
+        if self.shuffle:
+            np.random.shuffle(self._order)
+
+
+class FeatureExtraction:
+    """
+    Bottleneck feature cache of the frozen backbone.
+
+    Features are keyed by a fingerprint of the base model file, the
+    dataset files, the image size, the backbone and the precision;
+    extract() is a no-op while that fingerprint is unchanged.
+
+    The backbone runs under PRECISION (with_precision), like the one
+    full-model training would fine-tune, so a mixed_bfloat16 head is
+    trained on the activations it will see at inference. The arrays are
+    always stored as float32.
+    """
+
+    def __init__(self, config: FeatureExtractionConfig, training_config: TrainingConfig):
+        """
+        Args:
+            config: Where the feature arrays and manifest live.
+            training_config: Training configuration (data folder, split, batch size).
+        """
+        self.config = config
+        # Same split as Training.train_valid_generator, never augmented
+        self.training = Training(config=replace(training_config, params_is_augmentation=False))
+
+    def _paths(self, split: str) -> tuple:
+        return (self.config.root_dir / f"{split}_features.npy",
+                self.config.root_dir / f"{split}_labels.npy")
+
+    def fingerprint(self) -> dict:
+        """Everything the cached features depend on."""
+        return {
+            "base_model": get_file_hash(self.config.base_model_path),
+            "dataset": dataset_fingerprint(self.config.training_data),
+            "image_size": list(self.config.params_image_size),
+            "backbone": self.config.params_backbone,
+            "precision": self.config.params_precision,
+        }
+
+    def is_up_to_date(self) -> bool:
+        """True when the manifest matches the current base model and dataset."""
+        if not self.config.manifest_path.exists():
+            return False
+        manifest = load_json(self.config.manifest_path)
+        if manifest.fingerprint.to_dict() != self.fingerprint():
+            return False
+        return all(path.exists() for split in SPLITS for path in self._paths(split))
+
+    def extract(self) -> bool:
+        """
+        Run the frozen backbone over both splits and write the feature arrays.
+
+        Returns:
+            bool: False if the cached features were still up to date (nothing done).
+        """
+        if self.is_up_to_date():
+            logger.info(f"Bottleneck features in {self.config.root_dir} are up to date, skipping")
+            return False
+
+        # Drop the old manifest first so a half-written cache is never used
+        if self.config.manifest_path.exists():
+            self.config.manifest_path.unlink()
+
+        base_model = with_precision(
+            tf.keras.models.load_model(self.config.base_model_path, compile=False),
+            self.config.params_precision
+        )
+        self.training.train_valid_generator()
+        generators = {"train": self.training.train_generator, "valid": self.training.valid_generator}
+
+        shapes = {}
+        for split in SPLITS:
+            generator = generators[split]
+            feature_path, label_path = self._paths(split)
+            features = np.lib.format.open_memmap(
+                feature_path, mode="w+", dtype="float32",
+                shape=(generator.samples,) + tuple(base_model.output_shape[1:])
+            )
+            labels = np.lib.format.open_memmap(
+                label_path, mode="w+", dtype="float32",
+                shape=(generator.samples, generator.num_classes)
+            )
+
+            row = 0
+            for step in range(len(generator)):
+                images, batch_labels = generator[step]
+                features[row:row + len(images)] = base_model.predict_on_batch(images)
+                labels[row:row + len(images)] = batch_labels
+                row += len(images)
+
+            features.flush()
+            labels.flush()
+            shapes[split] = list(features.shape)
+            logger.info(f"Extracted {split} features {features.shape} to {feature_path}")
+            del features, labels
+
+        save_json(path=self.config.manifest_path, data={
+            "fingerprint": self.fingerprint(),
+            "shapes": shapes,
+            "class_indices": self.training.train_generator.class_indices,
+        })
+        return True
+
+    def load(self, split: str) -> tuple:
+        """
+        Open the cached features and labels of a split without reading them into memory.
+
+        Returns:
+            tuple: (features, labels) as read-only np.memmap arrays.
+        """
+        feature_path, label_path = self._paths(split)
+        return np.load(feature_path, mmap_mode="r"), np.load(label_path, mmap_mode="r")
+
+    def batches(self, split: str, batch_size: int, shuffle: bool = False) -> FeatureBatches:
+        """Batches of (features, labels) of a split, read from the memory-mapped cache."""
+        features, labels = self.load(split)
+        return FeatureBatches(features, labels, batch_size=batch_size, shuffle=shuffle)
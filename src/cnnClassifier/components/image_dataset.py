@@ -0,0 +1,308 @@
+"""
+cnnClassifier.components.image_dataset
+
+This module contains the ImageFolderDataset component responsible for:
+- Listing the images of a class-per-subfolder directory and splitting them
+  into training/validation exactly like ImageDataGenerator.flow_from_directory
+- A tf.data pipeline over them: parallel decode and bilinear resize, cache()
+  of the decoded pixels, shuffling, augmentation, batching, backbone
+  preprocessing and prefetch(AUTOTUNE)
+- Random access to batch number `step`, like a Keras Sequence
+- Optionally yielding the row of every image with its batch, for callers
+  keeping per-image state (e.g. the teacher outputs of distillation)
+- Reading already decoded images from the dataset_packing store (memory-mapped)
+  or shards (TFRecord) when they are up to date
+"""
+
+import os
+import math
+
+import numpy as np
+import tensorflow as tf
+
+from cnnClassifier.components.image_ops import decode_and_resize, preprocess_batch
+from cnnClassifier.components.image_store import ImageStore, IndexSampler
+
+# Extensions flow_from_directory reads that TensorFlow can also decode
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".bmp")
+
+AUTOTUNE = tf.data.AUTOTUNE
+
+
+def list_images(directory, subset: str = None, validation_split: float = 0.0) -> tuple:
+    """
+    Image files and labels of directory/<class>/..., split like flow_from_directory.
+
+    Classes are the sorted subfolder names. Within a class, files are sorted
+    and the first int(validation_split * n) of them are the validation subset,
+    the rest the training subset, so the split never changes between runs.
+
+    Args:
+        directory: Folder with one subfolder per class.
+        subset: "training", "validation" or None (all files).
+        validation_split: Fraction of every class reserved for validation.
+
+    Returns:
+        tuple: (filepaths, labels as an int array, class_indices dict)
+    """
+    classes = sorted(
+        name for name in os.listdir(directory) if os.path.isdir(os.path.join(directory, name))
+    )
+    class_indices = {name: index for index, name in enumerate(classes)}
+
+    filepaths, labels = [], []
+    for name in classes:
+        files = [
+            os.path.join(root, file)
+            for root, _, files in sorted(os.walk(os.path.join(directory, name)))
+            for file in sorted(files)
+            if file.lower().endswith(IMAGE_EXTENSIONS)
+        ]
+        split = int(validation_split * len(files))
+        if subset == "validation":
+            files = files[:split]
+        elif subset == "training":
+            files = files[split:]
+        filepaths += files
+        labels += [class_indices[name]] * len(files)
+
+    return filepaths, np.array(labels, dtype="int32"), class_indices
+
+
+def load_pixels(path: tf.Tensor, size) -> tf.Tensor:
+    """Read and decode one image file into uint8 RGB pixels of shape (height, width, 3)."""
+    return tf.cast(decode_and_resize(tf.io.read_file(path), size), tf.uint8)
+
+
+class ImageFolderDataset:
+    """
+    One split of an image folder, served as a tf.data.Dataset or batch by batch.
+
+    `dataset` is what model.fit/evaluate consume: files are decoded and
+    resized on all cores, the decoded uint8 pixels are cached in memory
+    after the first epoch, and the next batches are prepared while the
+    model works on the current one. Augmentation runs after the cache, so
+    every epoch still sees new random transforms.
+
+    With packed_index (dataset_packing stage) and up-to-date packed files,
+    the decoded pixels come from there instead of the image files: batch
+    views of the memory-mapped ImageStore, drawn by an IndexSampler
+    ("memmap"), or a sequential read of the TFRecord shards ("tfrecord").
+
+    len(), [step], samples, batch_size, classes, class_indices, filepaths,
+    index_array and on_epoch_end() behave like the DirectoryIterator of
+    flow_from_directory, for code that walks the split batch by batch.
+
+    Inside the pipeline every image travels with its row (its position in
+    filepaths / classes); the one-hot label is looked up from it at the end.
+    `rows_dataset` keeps the rows in the batches.
+    """
+
+    def __init__(self, directory, image_size, batch_size: int, backbone: str,
+                 subset: str = None, validation_split: float = 0.0, shuffle: bool = False,
+                 augment=None, batch_augment=None, cache: bool = True, seed: int = 42,
+                 packed_index=None):
+        """
+        Args:
+            directory: Folder with one subfolder per class.
+            image_size: (height, width) or (height, width, channels).
+            batch_size: Images per batch.
+            backbone: BACKBONE whose preprocess_input is applied to every batch.
+            subset: "training", "validation" or None.
+            validation_split: Fraction of every class reserved for validation.
+            shuffle: Reshuffle the split every epoch.
+            augment: Optional callable taking one float32 (H, W, 3) image in
+                     [0, 255] and returning a randomly transformed one.
+            batch_augment: Optional callable doing the same for a whole float32
+                     (N, H, W, 3) batch (vectorized, e.g. augmentation.augment_batches).
+            cache: Keep the decoded pixels in memory after the first pass.
+            seed: Seed of the shuffling order.
+            packed_index: Optional index.json of the dataset_packing stage.
+        """
+        self.directory = directory
+        self.image_size = tuple(image_size[:2])
+        self.batch_size = batch_size
+        self.backbone = backbone
+        self.shuffle = shuffle
+        self.augment = augment
+        self.batch_augment = batch_augment
+        self.cache = cache
+        self.seed = seed
+
+        self.filepaths, self.classes, self.class_indices = list_images(directory, subset, validation_split)
+        self.samples = len(self.filepaths)
+        self.num_classes = len(self.class_indices)
+        self._rng = np.random.default_rng(seed)
+        self._dataset = None
+        self._rows_dataset = None
+
+        self.packed_index = packed_index
+        self._packed = None
+        self._store = None
+        if packed_index is not None:
+            # Imported here: dataset_packing builds on this module
+            from cnnClassifier.components.dataset_packing import load_packed_index
+            self._packed = load_packed_index(packed_index, directory, self.image_size)
+        if self._packed is not None:
+            # Row of every image of this split in the packed file order
+            positions = {path: position for position, path in enumerate(self._packed.files)}
+            self._rows = np.array(
+                [positions[os.path.relpath(path, directory)] for path in self.filepaths], dtype="int64"
+            )
+            # And back: row in this split of every packed image (-1 = other split)
+            self._split_rows = np.full(len(self._packed.files), -1, dtype="int32")
+            self._split_rows[self._rows] = np.arange(self.samples, dtype="int32")
+            if self._packed.get("format", "tfrecord") == "memmap":
+                self._store = ImageStore.from_index(self._packed, packed_index)
+                self._sampler = IndexSampler(self._rows, batch_size, shuffle=shuffle, seed=seed)
+        self.on_epoch_end()
+
+    @property
+    def packed(self) -> bool:
+        """True when the images are read from the dataset_packing store or shards."""
+        return self._packed is not None
+
+    @property
+    def labels(self) -> np.ndarray:
+        return self.classes
+
+    def __len__(self) -> int:
+        return math.ceil(self.samples / self.batch_size)
+
+    def on_epoch_end(self) -> None:
+        """New random order of the images for [step] (shuffle=True only)."""
+        self.index_array = (
+            self._rng.permutation(self.samples) if self.shuffle else np.arange(self.samples)
+        )
+
+    def _finish(self, images: tf.Tensor, rows: tf.Tensor) -> tuple:
+        """Backbone preprocessing and one-hot labels for a batch of [0, 255] pixels and their rows."""
+        return (preprocess_batch(images, self.backbone),
+                tf.one_hot(tf.gather(self.classes, rows), self.num_classes, dtype=tf.float32))
+
+    def _finish_with_rows(self, images: tf.Tensor, rows: tf.Tensor) -> tuple:
+        images, labels = self._finish(images, rows)
+        return images, labels, rows
+
+    def _augment(self, image: tf.Tensor, row: tf.Tensor) -> tuple:
+        return self.augment(tf.cast(image, tf.float32)), row
+
+    def _augment_batch(self, images: tf.Tensor, rows: tf.Tensor) -> tuple:
+        return self.batch_augment(tf.cast(images, tf.float32)), rows
+
+    def _read_packed(self) -> tf.data.Dataset:
+        from cnnClassifier.components.dataset_packing import read_packed
+        split_rows = tf.constant(self._split_rows)
+        return read_packed(self._packed, self.packed_index, self._rows).map(
+            lambda pixels, position: (pixels, tf.gather(split_rows, position))
+        )
+
+    def _store_batches(self):
+        """One epoch of (uint8 images, rows) batches from the ImageStore, in sampler order."""
+        for store_rows in self._sampler.epoch():
+            yield self._store.take(store_rows), self._split_rows[store_rows]
+
+    def _read_store(self) -> tf.data.Dataset:
+        height, width = self.image_size
+        # Every iteration (epoch) calls _store_batches again: a new permutation
+        return tf.data.Dataset.from_generator(
+            self._store_batches,
+            output_signature=(
+                tf.TensorSpec([None, height, width, 3], tf.uint8),
+                tf.TensorSpec([None], tf.int32),
+            )
+        )
+
+    def __getitem__(self, step: int) -> tuple:
+        """
+        Batch number `step` in the current index_array order.
+
+        Returns:
+            tuple: (preprocessed images (N, H, W, 3), one-hot labels (N, classes)) as numpy arrays.
+        """
+        if not 0 <= step < len(self):
+            raise IndexError(f"Batch {step} out of range for {len(self)} batches")
+        rows = self.index_array[step * self.batch_size:(step + 1) * self.batch_size]
+
+        if self._store is not None:
+            # Read in sorted order (one forward read, or a view, of the store),
+            # then put the images back in index_array order
+            store_rows = self._rows[rows]
+            order = np.argsort(store_rows, kind="stable")
+            pixels = self._store.take(store_rows[order])
+            images = tf.cast(pixels[np.argsort(order)], tf.float32)
+            if self.augment is not None:
+                images = tf.stack([self.augment(image) for image in images])
+        else:
+            images = []
+            for row in rows:
+                image = tf.cast(load_pixels(self.filepaths[row], self.image_size), tf.float32)
+                images.append(self.augment(image) if self.augment is not None else image)
+            images = tf.stack(images)
+        if self.batch_augment is not None:
+            images = self.batch_augment(images)
+        images, labels = self._finish(images, tf.constant(rows, dtype=tf.int32))
+        return images.numpy(), labels.numpy()
+
+    @property
+    def dataset(self) -> tf.data.Dataset:
+        """
+        The split as a tf.data.Dataset of (preprocessed images, one-hot labels) batches.
+
+        One iteration is one epoch; iterating again reshuffles (shuffle=True).
+        """
+        if self._dataset is None:
+            self._dataset = self._pipeline().map(self._finish, num_parallel_calls=AUTOTUNE).prefetch(AUTOTUNE)
+        return self._dataset
+
+    @property
+    def rows_dataset(self) -> tf.data.Dataset:
+        """
+        Like `dataset`, with a third element: the rows of the batch's images in
+        filepaths / classes, to look up per-image data kept outside the pipeline.
+        """
+        if self._rows_dataset is None:
+            self._rows_dataset = self._pipeline().map(
+                self._finish_with_rows, num_parallel_calls=AUTOTUNE
+            ).prefetch(AUTOTUNE)
+        return self._rows_dataset
+
+    def _pipeline(self) -> tf.data.Dataset:
+        """(pixels, rows) batches, augmented but not yet preprocessed."""
+        if self._store is not None:
+            # Batches are drawn straight from the memory-mapped store: nothing
+            # to decode or cache, the sampler does the shuffling
+            dataset = self._read_store()
+            if self.augment is not None:
+                dataset = dataset.map(
+                    lambda images, rows: (tf.map_fn(self.augment, tf.cast(images, tf.float32)), rows),
+                    num_parallel_calls=AUTOTUNE
+                )
+            if self.batch_augment is not None:
+                dataset = dataset.map(self._augment_batch, num_parallel_calls=AUTOTUNE)
+            return dataset
+
+        if self._packed is not None:
+            # Already decoded and resized: read the shards front to back
+            dataset = self._read_packed()
+        else:
+            dataset = tf.data.Dataset.from_tensor_slices(
+                (self.filepaths, np.arange(self.samples, dtype="int32"))
+            )
+            # Decode and resize in parallel; the order of the files is kept
+            dataset = dataset.map(
+                lambda path, row: (load_pixels(path, self.image_size), row),
+                num_parallel_calls=AUTOTUNE
+            )
+        if self.cache:
+            # Decoded uint8 pixels, before any random transform
+            dataset = dataset.cache()
+        if self.shuffle:
+            dataset = dataset.shuffle(self.samples, seed=self.seed, reshuffle_each_iteration=True)
+        if self.augment is not None:
+            dataset = dataset.map(self._augment, num_parallel_calls=AUTOTUNE)
+        dataset = dataset.batch(self.batch_size)
+        if self.batch_augment is not None:
+            # One vectorized transform per batch instead of one call per image
+            dataset = dataset.map(self._augment_batch, num_parallel_calls=AUTOTUNE)
+        return dataset
@@ -0,0 +1,49 @@
+"""
+cnnClassifier.components.image_ops
+
+This module contains the TensorFlow image ops responsible for:
+- Decoding JPEG/PNG/BMP/GIF bytes into RGB pixels
+- Bilinear resizing to IMAGE_SIZE the same way Keras' load_img does it
+- Applying the backbone's preprocessing to a batch of pixel tensors
+"""
+
+import tensorflow as tf
+
+from cnnClassifier.components.backbones import get_preprocess_input
+
+
+def decode_image(data: tf.Tensor) -> tf.Tensor:
+    """
+    Decode one encoded image (scalar tf.string) into uint8 RGB pixels of shape (H, W, 3).
+
+    JPEGs use the accurate integer IDCT, like PIL, so decoded pixels match
+    what PIL/load_img decode (prediction without the fused graph).
+    """
+    return tf.cond(
+        tf.io.is_jpeg(data),
+        lambda: tf.io.decode_jpeg(data, channels=3, dct_method="INTEGER_ACCURATE"),
+        lambda: tf.io.decode_image(data, channels=3, expand_animations=False),
+    )
+
+
+def resize_image(pixels: tf.Tensor, size) -> tf.Tensor:
+    """
+    Bilinear resize of (H, W, 3) pixels to size=(height, width), as float32 in [0, 255].
+
+    PIL's bilinear filter (used by load_img) widens its kernel when shrinking,
+    which is what antialias=True does; rounding mirrors PIL's uint8 output.
+    """
+    resized = tf.image.resize(pixels, size, method="bilinear", antialias=True)
+    return tf.clip_by_value(tf.round(resized), 0.0, 255.0)
+
+
+def decode_and_resize(data: tf.Tensor, size) -> tf.Tensor:
+    """Encoded image bytes → float32 RGB pixels of shape (height, width, 3)."""
+    pixels = decode_image(data)
+    pixels.set_shape([None, None, 3])
+    return resize_image(pixels, size)
+
+
+def preprocess_batch(images: tf.Tensor, backbone: str) -> tf.Tensor:
+    """The backbone's preprocess_input on a float32 tensor of raw [0, 255] pixels."""
+    return get_preprocess_input(backbone)(tf.cast(images, tf.float32))
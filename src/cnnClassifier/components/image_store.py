@@ -0,0 +1,92 @@
+"""
+cnnClassifier.components.image_store
+
+This module contains the ImageStore component responsible for:
+- The whole resized dataset as one contiguous (N, H, W, 3) uint8 .npy
+  file, memory-mapped instead of read into RAM
+- Batches as zero-copy views of consecutive rows, or one sorted gather
+- IndexSampler: shuffling through a permutation of row numbers, so no
+  image is moved or loaded before its batch is needed
+"""
+
+from pathlib import Path
+
+import numpy as np
+
+
+class ImageStore:
+    """
+    Read-only memory-mapped images with their labels and filenames.
+
+    The images live in the page cache, not in this process: opening the
+    store is instant and several processes share the same memory.
+    """
+
+    def __init__(self, path: Path, labels, files):
+        """
+        Args:
+            path: .npy file of shape (N, height, width, 3), dtype uint8.
+            labels: N class indices.
+            files: N image paths (relative to the source folder).
+        """
+        self.path = Path(path)
+        self.images = np.load(self.path, mmap_mode="r")
+        self.labels = np.asarray(labels, dtype="int32")
+        self.files = list(files)
+        if not len(self.images) == len(self.labels) == len(self.files):
+            raise ValueError(
+                f"{self.path} holds {len(self.images)} images for "
+                f"{len(self.labels)} labels and {len(self.files)} files"
+            )
+
+    @classmethod
+    def from_index(cls, index, index_path: Path) -> "ImageStore":
+        """Open the store described by a dataset_packing index.json (its labels/files are the sidecar)."""
+        return cls(Path(index_path).parent / index.store, index.labels, index.files)
+
+    @staticmethod
+    def create(path: Path, count: int, image_size) -> np.memmap:
+        """A writable (count, height, width, 3) uint8 .npy file to fill row by row."""
+        height, width = image_size[:2]
+        return np.lib.format.open_memmap(path, mode="w+", dtype="uint8", shape=(count, height, width, 3))
+
+    def __len__(self) -> int:
+        return len(self.images)
+
+    def take(self, rows: np.ndarray) -> np.ndarray:
+        """
+        Pixels of the given (sorted) rows.
+
+        Consecutive rows are returned as a view of the file, without copying;
+        other rows are gathered in one pass, in file order.
+        """
+        rows = np.asarray(rows)
+        if len(rows) and rows[-1] - rows[0] == len(rows) - 1:
+            return self.images[rows[0]:rows[-1] + 1]
+        return self.images[rows]
+
+
+class IndexSampler:
+    """
+    Batches of row numbers over a fixed set of rows.
+
+    With shuffle=True every epoch() walks a new permutation of the rows;
+    rows are sorted inside each batch so reads go forward through the file.
+    Without shuffling, batches of consecutive rows stay consecutive, and
+    ImageStore.take() serves them as zero-copy views.
+    """
+
+    def __init__(self, rows: np.ndarray, batch_size: int, shuffle: bool = False, seed: int = 42):
+        self.rows = np.asarray(rows)
+        self.batch_size = batch_size
+        self.shuffle = shuffle
+        self._rng = np.random.default_rng(seed)
+
+    def __len__(self) -> int:
+        return -(-len(self.rows) // self.batch_size)
+
+    def epoch(self):
+        """Yield one epoch of sorted row batches."""
+        order = self._rng.permutation(self.rows) if self.shuffle else self.rows
+        for start in range(0, len(order), self.batch_size):
+            yield np.sort(order[start:start + self.batch_size])
@@ -0,0 +1,101 @@
+"""
+cnnClassifier.components.inference_executor
+
+This module contains the InferenceExecutor component responsible for:
+- Running blocking decode/TensorFlow work on dedicated threads
+- Bounding how many inference jobs may run or wait at once
+- Rejecting new work immediately when that bound is reached
+"""
+
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+
+from cnnClassifier import logger
+
+
+class ServerBusyError(RuntimeError):
+    """Raised when inference capacity is exhausted; the client should retry later."""
+
+    def __init__(self, retry_after: int = 1):
+        super().__init__(f"Server busy, retry after {retry_after}s")
+        self.retry_after = retry_after
+
+
+class InferenceExecutor:
+    """
+    Bounded executor for blocking inference work called from async handlers.
+
+    At most max_workers jobs run at once and at most max_pending more may
+    wait for a thread. Anything beyond that fails fast with ServerBusyError
+    instead of piling up on the event loop.
+    """
+
+    def __init__(self, max_workers: int = 2, max_pending: int = 32, retry_after: int = 1):
+        """
+        Args:
+            max_workers: Threads running inference concurrently.
+            max_pending: Jobs allowed to queue behind the running ones.
+            retry_after: Seconds suggested to rejected clients (Retry-After header).
+        """
+        self.max_workers = max_workers
+        self.capacity = max_workers + max_pending
+        self.retry_after = retry_after
+
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="inference")
+        self._slots = None
+        self._in_flight = 0
+        self._rejected = 0
+
+    def _semaphore(self) -> asyncio.Semaphore:
+        # Created lazily so it binds to the running event loop
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.capacity)
+        return self._slots
+
+    def is_saturated(self) -> bool:
+        """True when a new job would be rejected."""
+        return self._in_flight >= self.capacity
+
+    def reject(self) -> ServerBusyError:
+        """Count a rejection and return the error to raise."""
+        self._rejected += 1
+        return ServerBusyError(self.retry_after)
+
+    async def run(self, fn, *args, wait: bool = False, **kwargs):
+        """
+        Run fn(*args, **kwargs) on an inference thread and await its result.
+
+        Args:
+            wait: Queue even when at capacity (for work that was already admitted).
+
+        Raises:
+            ServerBusyError: If capacity is exhausted and wait is False.
+        """
+        slots = self._semaphore()
+        if not wait and self.is_saturated():
+            raise self.reject()
+
+        async with slots:
+            self._in_flight += 1
+            try:
+                loop = asyncio.get_running_loop()
+                return await loop.run_in_executor(
+                    self._pool, functools.partial(fn, *args, **kwargs)
+                )
+            finally:
+                self._in_flight -= 1
+
+    def shutdown(self) -> None:
+        """Wait for running jobs and stop the threads."""
+        self._pool.shutdown(wait=True)
+        logger.info("Inference executor stopped")
+
+    def stats(self) -> dict:
+        """Running/queued job count, capacity and number of rejected requests."""
+        return {
+            "in_flight": self._in_flight,
+            "max_workers": self.max_workers,
+            "capacity": self.capacity,
+            "rejected": self._rejected,
+        }
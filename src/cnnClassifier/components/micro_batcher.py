@@ -0,0 +1,224 @@
+"""
+cnnClassifier.components.micro_batcher
+
+This module contains the MicroBatcher component responsible for:
+- Collecting concurrent prediction requests into one batch
+- Running a single forward pass per batch
+- Handing each row of the result back to the caller's future
+- Reporting queue depth, batch sizes and queueing delay
+"""
+
+import time
+import queue
+import asyncio
+import threading
+from collections import Counter, deque
+from concurrent.futures import Future
+
+import numpy as np
+
+from cnnClassifier import logger
+from cnnClassifier.components.inference_executor import ServerBusyError
+
+
+class _Request:
+    """One queued image waiting for a batch slot."""
+
+    __slots__ = ("item", "future", "enqueued_at")
+
+    def __init__(self, item: np.ndarray):
+        self.item = item
+        self.future = Future()
+        self.enqueued_at = time.perf_counter()
+
+
+class MicroBatcher:
+    """
+    Dynamic micro-batching scheduler in front of a batch predict function.
+
+    A background thread waits for the first request, then keeps collecting
+    requests until either max_batch_size is reached or max_wait_ms has
+    passed since that first request. The whole batch goes through the
+    model in one call and every caller receives its own row.
+
+    Items are preprocessed (H, W, C) arrays, copied into one reused batch
+    buffer, or encoded images (bytes) for models that decode them in their
+    own graph, passed on as a list.
+    """
+
+    def __init__(self, predict_fn, max_batch_size: int = 16, max_wait_ms: float = 5.0,
+                 max_queue_size: int = 0, retry_after: int = 1, on_batch=None):
+        """
+        Args:
+            predict_fn: Callable taking an (N, H, W, C) array (or a list of N
+                        encoded images) and returning (N, classes).
+            max_batch_size: Largest number of images sent to the model at once.
+            max_wait_ms: Longest time the first request of a batch waits for company.
+            max_queue_size: Requests allowed to wait for a batch (0 = unbounded).
+            retry_after: Seconds suggested to callers rejected by a full queue.
+            on_batch: Optional callback(batch_size, queue_delays_in_seconds) run after each batch.
+        """
+        self.predict_fn = predict_fn
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000.0
+        self.max_queue_size = max_queue_size
+        self.retry_after = retry_after
+        self.on_batch = on_batch
+
+        self._queue = queue.Queue()
+        self._thread = None
+        self._running = False
+        # Batch buffer is allocated once (on the first batch) and reused
+        self._buffer = None
+
+        self._stats_lock = threading.Lock()
+        self._batch_sizes = Counter()
+        self._queue_delays = deque(maxlen=2048)
+        self._requests = 0
+        self._batches = 0
+        self._rejected = 0
+
+    def start(self) -> None:
+        """Start the background batching thread."""
+        if self._running:
+            return
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name="micro-batcher", daemon=True)
+        self._thread.start()
+        logger.info(
+            f"Micro-batcher started (max_batch_size={self.max_batch_size}, "
+            f"max_wait_ms={self.max_wait * 1000:g})"
+        )
+
+    def stop(self) -> None:
+        """Stop the batching thread after the queued requests are served."""
+        if not self._running:
+            return
+        self._running = False
+        self._queue.put(None)
+        self._thread.join()
+        logger.info("Micro-batcher stopped")
+
+    def submit(self, item: np.ndarray) -> Future:
+        """
+        Queue one preprocessed image of shape (H, W, C), or one encoded image (bytes).
+
+        Raises:
+            ServerBusyError: If max_queue_size requests are already waiting.
+
+        Returns:
+            Future: Resolves to the class probabilities of this image.
+        """
+        if not self._running:
+            raise RuntimeError("MicroBatcher is not running, call start() first")
+        if self.max_queue_size and self._queue.qsize() >= self.max_queue_size:
+            with self._stats_lock:
+                self._rejected += 1
+            raise ServerBusyError(self.retry_after)
+        request = _Request(item)
+        self._queue.put(request)
+        return request.future
+
+    async def predict(self, item: np.ndarray) -> np.ndarray:
+        """Async wrapper around submit() for use inside request handlers."""
+        return await asyncio.wrap_future(self.submit(item))
+
+    def _collect(self, first: _Request) -> list:
+        """Gather requests until the batch is full or the first one waited long enough."""
+        batch = [first]
+        deadline = first.enqueued_at + self.max_wait
+
+        while len(batch) < self.max_batch_size:
+            timeout = deadline - time.perf_counter()
+            try:
+                request = self._queue.get(timeout=timeout) if timeout > 0 else self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if request is None:
+                # Stop signal: serve what we have, then let _run() exit
+                self._queue.put(None)
+                break
+            batch.append(request)
+
+        return batch
+
+    def _run(self) -> None:
+        while True:
+            first = self._queue.get()
+            if first is None:
+                break
+
+            batch = self._collect(first)
+            started = time.perf_counter()
+            size = len(batch)
+
+            try:
+                if isinstance(first.item, np.ndarray):
+                    if self._buffer is None:
+                        self._buffer = np.empty(
+                            (self.max_batch_size,) + first.item.shape, dtype="float32"
+                        )
+                    for index, request in enumerate(batch):
+                        self._buffer[index] = request.item
+                    probabilities = self.predict_fn(self._buffer[:size])
+                else:
+                    probabilities = self.predict_fn([request.item for request in batch])
+
+                for index, request in enumerate(batch):
+                    request.future.set_result(probabilities[index])
+
+            except Exception as e:
+                if size > 1 and not isinstance(first.item, np.ndarray):
+                    # One undecodable upload fails the whole graph call:
+                    # retry one by one so only that request gets the error
+                    self._run_each(batch)
+                else:
+                    logger.exception("Batched prediction failed")
+                    for request in batch:
+                        if not request.future.done():
+                            request.future.set_exception(e)
+
+            delays = [started - request.enqueued_at for request in batch]
+            with self._stats_lock:
+                self._requests += size
+                self._batches += 1
+                self._batch_sizes[size] += 1
+                self._queue_delays.extend(delays)
+
+            if self.on_batch is not None:
+                self.on_batch(size, delays)
+
+    def _run_each(self, batch: list) -> None:
+        for request in batch:
+            if request.future.done():
+                continue
+            try:
+                request.future.set_result(self.predict_fn([request.item])[0])
+            except Exception as e:
+                request.future.set_exception(e)
+
+    def stats(self) -> dict:
+        """Queue depth, batch-size histogram and queueing delay (ms) so far."""
+        with self._stats_lock:
+            delays = np.asarray(self._queue_delays) * 1000.0
+            histogram = dict(sorted(self._batch_sizes.items()))
+            requests, batches, rejected = self._requests, self._batches, self._rejected
+
+        delay_ms = {"p50": None, "p99": None, "mean": None, "max": None}
+        if delays.size:
+            delay_ms = {
+                "p50": float(np.percentile(delays, 50)),
+                "p99": float(np.percentile(delays, 99)),
+                "mean": float(delays.mean()),
+                "max": float(delays.max()),
+            }
+
+        return {
+            "queue_depth": self._queue.qsize(),
+            "requests": requests,
+            "batches": batches,
+            "rejected": rejected,
+            "mean_batch_size": requests / batches if batches else None,
+            "batch_size_histogram": histogram,
+            "queue_delay_ms": delay_ms,
+        }
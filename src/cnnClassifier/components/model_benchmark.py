@@ -0,0 +1,89 @@
+"""
+cnnClassifier.components.model_benchmark
+
+This module contains the model benchmark helpers responsible for:
+- Counting the parameters of a Keras model
+- Counting the floating-point operations of one forward pass
+- Measuring CPU latency at a given batch size
+"""
+
+import time
+
+import numpy as np
+import tensorflow as tf
+
+
+def count_flops(model: tf.keras.Model, batch_size: int = 1) -> int:
+    """
+    Floating-point operations of one forward pass (a multiply-add counts as 2).
+
+    The model is traced once, its variables are frozen into constants and
+    the TensorFlow profiler adds up the float ops of every node.
+    """
+    from tensorflow.python.framework.convert_to_constants import convert_variables_to_constants_v2_as_graph
+
+    input_shape = [batch_size] + list(model.input_shape[1:])
+
+    @tf.function
+    def forward(images):
+        return model(images, training=False)
+
+    concrete = forward.get_concrete_function(tf.TensorSpec(input_shape, tf.float32))
+    _, graph_def = convert_variables_to_constants_v2_as_graph(concrete)
+
+    with tf.Graph().as_default() as graph:
+        tf.graph_util.import_graph_def(graph_def, name="")
+        options = (tf.compat.v1.profiler.ProfileOptionBuilder(
+            tf.compat.v1.profiler.ProfileOptionBuilder.float_operation()
+        ).with_empty_output().build())
+        profile = tf.compat.v1.profiler.profile(
+            graph=graph, run_meta=tf.compat.v1.RunMetadata(), cmd="op", options=options
+        )
+    return int(profile.total_float_ops)
+
+
+def measure_latency(predict_fn, batch: np.ndarray, runs: int = 20, warmup: int = 3) -> dict:
+    """
+    Time repeated calls of predict_fn(batch) after a few warm-up calls.
+
+    Returns:
+        dict: p50/p99/mean latency in milliseconds and images per second.
+    """
+    for _ in range(warmup):
+        predict_fn(batch)
+
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        predict_fn(batch)
+        timings.append(time.perf_counter() - start)
+
+    timings = np.asarray(timings) * 1000.0
+    return {
+        "latency_ms_p50": float(np.percentile(timings, 50)),
+        "latency_ms_p99": float(np.percentile(timings, 99)),
+        "latency_ms_mean": float(timings.mean()),
+        "images_per_second": float(len(batch) * 1000.0 / timings.mean()),
+    }
+
+
+def benchmark_model(model: tf.keras.Model, batch_size: int = 1, runs: int = 20) -> dict:
+    """
+    Parameters, FLOPs per image and CPU latency of a Keras model.
+
+    Args:
+        model: Model to benchmark.
+        batch_size: Images per timed forward pass.
+        runs: Number of timed forward passes.
+    """
+    batch = np.random.default_rng(0).uniform(
+        0, 255, size=[batch_size] + list(model.input_shape[1:])
+    ).astype("float32")
+
+    return {
+        "params": int(model.count_params()),
+        "trainable_params": int(sum(np.prod(weight.shape) for weight in model.trainable_weights)),
+        "flops_per_image": count_flops(model),
+        "batch_size": batch_size,
+        **measure_latency(model.predict_on_batch, batch, runs=runs),
+    }
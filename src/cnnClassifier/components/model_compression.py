@@ -0,0 +1,294 @@
+"""
+cnnClassifier.components.model_compression
+
+This module contains the ModelCompression component responsible for:
+- Magnitude pruning of the kernels to a target sparsity, or clustering their
+  weights into a small number of shared values (trainable layers only, or
+  every layer with the backbone unfrozen for the fine-tune)
+- A short fine-tuning run that keeps the pruned / clustered structure
+- Saving a deflate-compressed .keras file (still loadable with load_model)
+- Reporting compressed size, load time and accuracy delta next to the original model
+"""
+
+import os
+import time
+import zipfile
+from pathlib import Path
+
+import numpy as np
+import tensorflow as tf
+
+from cnnClassifier import logger
+from cnnClassifier.entitiy.config_entity import ModelCompressionConfig, TrainingConfig
+from cnnClassifier.components.model_training import Training
+from cnnClassifier.utils.common import save_json
+
+METHODS = ("prune", "cluster")
+
+# COMPRESSION_SCOPE: "all" (default) compresses every kernel and unfreezes the
+# backbone so its pruned/clustered kernels get recovery training; "trainable"
+# only touches the layers the fine-tune updates - with a frozen backbone that
+# is the small head, so the file barely shrinks
+SCOPES = ("trainable", "all")
+
+
+def kernel_layers(model, trainable_only: bool = False) -> list:
+    """Every layer with a kernel (Conv, Dense, ...), including those of nested models."""
+    layers = []
+    for layer in model.layers:
+        if hasattr(layer, "layers"):
+            layers.extend(kernel_layers(layer, trainable_only))
+        elif getattr(layer, "kernel", None) is not None and (layer.trainable or not trainable_only):
+            layers.append(layer)
+    return layers
+
+
+def magnitude_mask(weights: np.ndarray, sparsity: float) -> np.ndarray:
+    """1 for the largest-magnitude (1 - sparsity) fraction of weights, 0 for the rest."""
+    if sparsity <= 0:
+        return np.ones_like(weights)
+    threshold = np.quantile(np.abs(weights), sparsity)
+    return (np.abs(weights) > threshold).astype(weights.dtype)
+
+
+def kmeans_1d(weights: np.ndarray, clusters: int, iterations: int = 20) -> tuple:
+    """
+    k-means over the scalar values of weights, centroids initialised linearly
+    between the minimum and maximum weight.
+
+    Returns:
+        tuple: (centroids, assignments) with assignments shaped like weights.
+    """
+    values = weights.ravel()
+    centroids = np.linspace(values.min(), values.max(), clusters)
+    for _ in range(iterations):
+        # In 1-D the nearest centroid is found by bisecting the midpoints
+        assignments = np.searchsorted((centroids[1:] + centroids[:-1]) / 2, values)
+        counts = np.bincount(assignments, minlength=clusters)
+        sums = np.bincount(assignments, weights=values, minlength=clusters)
+        # Empty clusters keep their previous centroid
+        updated = np.where(counts > 0, sums / np.maximum(counts, 1), centroids)
+        if np.allclose(updated, centroids):
+            break
+        centroids = np.sort(updated)
+    assignments = np.searchsorted((centroids[1:] + centroids[:-1]) / 2, values)
+    return centroids.astype(weights.dtype), assignments.reshape(weights.shape)
+
+
+class _KeepCompressed(tf.keras.callbacks.Callback):
+    """
+    Re-applies the pruning masks / weight sharing after every optimizer step,
+    so fine-tuning never brings back pruned weights or distinct values.
+    """
+
+    def __init__(self, compression: "ModelCompression"):
+        super().__init__()
+        self.compression = compression
+
+    def on_epoch_begin(self, epoch, logs=None):
+        self.compression.update(epoch)
+
+    def on_train_batch_end(self, batch, logs=None):
+        self.compression.project(trainable_only=True)
+
+
+class ModelCompression:
+    """
+    Prunes or clusters artifacts/training/model.keras and fine-tunes it briefly.
+
+    prune:   per-layer magnitude pruning; sparsity ramps up to params_sparsity
+             over the fine-tuning epochs (cubic schedule), pruned weights stay zero.
+    cluster: per-layer k-means into params_clusters shared values; fine-tuning
+             moves the shared values (cluster assignments stay fixed).
+
+    params_scope chooses the layers: "all" (default) compresses every kernel
+    and fine-tunes the whole model; "trainable" leaves the frozen backbone
+    untouched, which keeps its accuracy but hardly reduces the size. Zeros and
+    repeated values compress well, so the saved model is a deflate-compressed
+    .keras file.
+    """
+
+    def __init__(self, config: ModelCompressionConfig, training_config: TrainingConfig):
+        """
+        Args:
+            config: Model paths, compression method and fine-tuning hyperparameters.
+            training_config: Training configuration (data folder, split, augmentation).
+        """
+        if config.params_method not in METHODS:
+            raise ValueError(f"Unknown compression method {config.params_method!r}, expected one of {METHODS}")
+        if config.params_scope not in SCOPES:
+            raise ValueError(f"Unknown compression scope {config.params_scope!r}, expected one of {SCOPES}")
+        self.config = config
+        self.training = Training(config=training_config)
+
+    def load_data(self):
+        """Training and validation generators, same split as Training."""
+        self.training.train_valid_generator()
+        self.train_generator = self.training.train_generator
+        self.valid_generator = self.training.valid_generator
+
+    def _load_model(self, path: Path, unfreeze: bool = False) -> tf.keras.Model:
+        model = tf.keras.models.load_model(path, compile=False)
+        if unfreeze:
+            # Before compile: the trainable weights are fixed when the train step is built
+            model.trainable = True
+        # Plain SGD: no optimizer slots to bloat the saved file
+        model.compile(
+            optimizer=tf.keras.optimizers.SGD(learning_rate=self.config.params_learning_rate),
+            loss=tf.keras.losses.CategoricalCrossentropy(),
+            metrics=["accuracy"]
+        )
+        return model
+
+    def _target_sparsity(self, epoch: int) -> float:
+        """Sparsity to reach at the start of epoch, ending at params_sparsity on the last one."""
+        epochs = max(self.config.params_epochs, 1)
+        progress = min((epoch + 1) / epochs, 1.0)
+        return self.config.params_sparsity * (1.0 - (1.0 - progress) ** 3)
+
+    def update(self, epoch: int):
+        """Recompute the pruning masks (prune) or cluster the weights (cluster, first epoch only)."""
+        if self.config.params_method == "prune":
+            sparsity = self._target_sparsity(epoch)
+            self.masks = [magnitude_mask(layer.kernel.numpy(), sparsity) for layer in self.layers]
+        elif epoch == 0:
+            self.assignments = [
+                kmeans_1d(layer.kernel.numpy(), self.config.params_clusters)[1] for layer in self.layers
+            ]
+        self.project(trainable_only=False)
+
+    def project(self, trainable_only: bool):
+        """Zero the pruned weights, or set every weight to the mean of its cluster."""
+        for index, layer in enumerate(self.layers):
+            if trainable_only and not layer.trainable:
+                continue
+            kernel = layer.kernel.numpy()
+            if self.config.params_method == "prune":
+                layer.kernel.assign(kernel * self.masks[index])
+            else:
+                assignments = self.assignments[index]
+                counts = np.bincount(assignments.ravel(), minlength=self.config.params_clusters)
+                sums = np.bincount(assignments.ravel(), weights=kernel.ravel(), minlength=self.config.params_clusters)
+                centroids = (sums / np.maximum(counts, 1)).astype(kernel.dtype)
+                layer.kernel.assign(centroids[assignments])
+
+    def compress(self) -> tf.keras.Model:
+        """
+        Prune or cluster the trained model, fine-tune it and save the compressed file.
+
+        Returns:
+            tf.keras.Model: The compressed model.
+        """
+        compress_all = self.config.params_scope == "all"
+        self.model = self._load_model(self.config.model_path, unfreeze=compress_all)
+        self.layers = kernel_layers(self.model, trainable_only=not compress_all)
+        if not self.layers:
+            raise ValueError("No trainable kernels to compress; use COMPRESSION_SCOPE: all to include frozen layers")
+        if not compress_all:
+            logger.warning(
+                f"COMPRESSION_SCOPE: trainable compresses {self.compressed_weight_fraction():.1%} "
+                f"of the kernel weights, the file will hardly shrink"
+            )
+
+        if self.config.params_epochs > 0:
+            self.model.fit(
+                self.train_generator.dataset,
+                epochs=self.config.params_epochs,
+                validation_data=self.valid_generator.dataset,
+                callbacks=[_KeepCompressed(self)]
+            )
+        else:
+            # One-shot compression, no recovery training
+            self.update(epoch=0)
+
+        self.save_model(self.config.compressed_model_path, self.model)
+        logger.info(f"{self.describe()}; saved at {self.config.compressed_model_path}")
+        return self.model
+
+    def describe(self) -> str:
+        if self.config.params_method == "prune":
+            return f"Pruned {len(self.layers)} {self.config.params_scope} kernels to {self.sparsity():.1%} sparsity"
+        return (f"Clustered {len(self.layers)} {self.config.params_scope} kernels "
+                f"into {self.config.params_clusters} values each")
+
+    def compressed_weight_fraction(self) -> float:
+        """Compressed kernel weights over every kernel weight of the model."""
+        compressed = sum(int(np.prod(layer.kernel.shape)) for layer in self.layers)
+        total = sum(int(np.prod(layer.kernel.shape)) for layer in kernel_layers(self.model))
+        return compressed / total
+
+    def sparsity(self) -> float:
+        """Fraction of zero weights over the compressed kernels."""
+        zeros = sum(int(np.sum(layer.kernel.numpy() == 0)) for layer in self.layers)
+        total = sum(int(np.prod(layer.kernel.shape)) for layer in self.layers)
+        return zeros / total
+
+    @staticmethod
+    def save_model(path: Path, model: tf.keras.Model):
+        """
+        Save model as a .keras archive with deflate compression.
+
+        Keras stores the archive members uncompressed; rewriting them with
+        ZIP_DEFLATED is what turns zeros and shared values into smaller files.
+        """
+        path = Path(path)
+        staging_path = path.with_name(f"uncompressed_{path.name}")
+        model.save(staging_path)
+        with zipfile.ZipFile(staging_path) as source, \
+                zipfile.ZipFile(path, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=9) as target:
+            for member in source.infolist():
+                target.writestr(member.filename, source.read(member.filename))
+        staging_path.unlink()
+
+    @staticmethod
+    def _load_seconds(path: Path, runs: int = 3) -> float:
+        """Median wall time of load_model(path) (inference only, no optimizer)."""
+        times = []
+        for _ in range(runs):
+            start = time.perf_counter()
+            tf.keras.models.load_model(path, compile=False)
+            times.append(time.perf_counter() - start)
+        return float(np.median(times))
+
+    def save_score(self) -> dict:
+        """
+        Evaluate the compressed and original models on the validation split and write the report.
+
+        The report starts with "loss" and "accuracy" of the compressed model,
+        like scores.json from Evaluation.save_score.
+
+        Returns:
+            dict: loss, accuracy, accuracy_delta, sizes, size_ratio and load times.
+        """
+        original = self._load_model(self.config.model_path)
+        original_loss, original_accuracy = original.evaluate(self.valid_generator.dataset)
+        loss, accuracy = self.model.evaluate(self.valid_generator.dataset)
+
+        scores = {
+            "loss": float(loss),
+            "accuracy": float(accuracy),
+            "accuracy_delta": float(accuracy - original_accuracy),
+            "original_loss": float(original_loss),
+            "original_accuracy": float(original_accuracy),
+            "method": self.config.params_method,
+            "scope": self.config.params_scope,
+            # Share of all kernel weights that were compressed: the size can only shrink this much
+            "compressed_weight_fraction": self.compressed_weight_fraction(),
+            "compressed_layers": [layer.name for layer in self.layers],
+            "sparsity": self.sparsity(),
+            "size_bytes": os.path.getsize(self.config.compressed_model_path),
+            "original_size_bytes": os.path.getsize(self.config.model_path),
+            "load_seconds": self._load_seconds(self.config.compressed_model_path),
+            "original_load_seconds": self._load_seconds(self.config.model_path),
+        }
+        if self.config.params_method == "cluster":
+            scores["clusters"] = self.config.params_clusters
+        scores["size_ratio"] = scores["size_bytes"] / scores["original_size_bytes"]
+
+        save_json(path=self.config.report_path, data=scores)
+        logger.info(
+            f"Compressed vs original: accuracy {scores['accuracy']:.4f} vs {scores['original_accuracy']:.4f}, "
+            f"size {scores['size_bytes'] / 2**20:.1f} MB vs {scores['original_size_bytes'] / 2**20:.1f} MB, "
+            f"load {scores['load_seconds']:.2f}s vs {scores['original_load_seconds']:.2f}s"
+        )
+        return scores
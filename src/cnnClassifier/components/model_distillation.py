@@ -0,0 +1,188 @@
+"""
+cnnClassifier.components.model_distillation
+
+This module contains the ModelDistillation component responsible for:
+- Building a compact CNN student
+- Training it on the soft targets of the trained teacher (temperature-scaled)
+  mixed with the true labels
+- Comparing accuracy, size, FLOPs and CPU latency of teacher and student
+"""
+
+import os
+from pathlib import Path
+
+import numpy as np
+import tensorflow as tf
+
+from cnnClassifier import logger
+from cnnClassifier.entitiy.config_entity import ModelDistillationConfig, TrainingConfig
+from cnnClassifier.components.model_training import Training
+from cnnClassifier.components.model_benchmark import count_flops, measure_latency
+from cnnClassifier.utils.common import save_json
+
+
+def build_student(input_shape, classes: int) -> tf.keras.Model:
+    """
+    Compact CNN: a strided stem and four depthwise-separable blocks, then global pooling.
+
+    The last layer is a separate softmax Activation, so the logits are
+    available (the "logits" layer) for distillation while the saved model still
+    outputs probabilities like the teacher.
+    """
+    inputs = tf.keras.Input(shape=input_shape)
+    x = tf.keras.layers.Conv2D(32, 3, strides=2, padding="same", use_bias=False)(inputs)
+    x = tf.keras.layers.BatchNormalization()(x)
+    x = tf.keras.layers.ReLU()(x)
+
+    for filters in (64, 128, 256, 256):
+        x = tf.keras.layers.SeparableConv2D(filters, 3, strides=2, padding="same", use_bias=False)(x)
+        x = tf.keras.layers.BatchNormalization()(x)
+        x = tf.keras.layers.ReLU()(x)
+
+    x = tf.keras.layers.GlobalAveragePooling2D()(x)
+    x = tf.keras.layers.Dropout(0.2)(x)
+    logits = tf.keras.layers.Dense(classes, name="logits")(x)
+    outputs = tf.keras.layers.Activation("softmax", name="probabilities")(logits)
+    return tf.keras.Model(inputs=inputs, outputs=outputs, name="student")
+
+
+class ModelDistillation:
+    """
+    Distils artifacts/training/model.keras (teacher) into a small student CNN.
+
+    Loss = alpha * cross-entropy(true labels)
+         + (1 - alpha) * T^2 * KL(teacher soft targets || student soft predictions)
+    where soft distributions are softmax(logits / T).
+    """
+
+    def __init__(self, config: ModelDistillationConfig, training_config: TrainingConfig):
+        """
+        Args:
+            config: Teacher/student paths and distillation hyperparameters.
+            training_config: Training configuration (data folder, split, augmentation).
+        """
+        self.config = config
+        self.training = Training(config=training_config)
+
+    def load_data(self):
+        """Training (with augmentation if enabled) and validation generators, same split as Training."""
+        self.training.train_valid_generator()
+        self.train_generator = self.training.train_generator
+        self.valid_generator = self.training.valid_generator
+
+    def distill(self) -> tf.keras.Model:
+        """
+        Train the student on the teacher's soft targets and save it.
+
+        Returns:
+            tf.keras.Model: The trained student (outputs probabilities).
+        """
+        self.teacher = tf.keras.models.load_model(self.config.teacher_model_path, compile=False)
+        self.student = build_student(self.config.params_image_size, self.config.params_classes)
+        # Same network, stopping at the logits
+        student_logits = tf.keras.Model(self.student.input, self.student.get_layer("logits").output)
+
+        temperature = float(self.config.params_temperature)
+        alpha = float(self.config.params_alpha)
+        optimizer = tf.keras.optimizers.Adam(learning_rate=self.config.params_learning_rate)
+        kl_divergence = tf.keras.losses.KLDivergence()
+        cross_entropy = tf.keras.losses.CategoricalCrossentropy(from_logits=True)
+
+        @tf.function
+        def train_step(images, labels, teacher_probabilities):
+            # The teacher ends in a softmax: log-probabilities are its logits up to a constant
+            teacher_soft = tf.nn.softmax(tf.math.log(teacher_probabilities + 1e-7) / temperature)
+            with tf.GradientTape() as tape:
+                logits = student_logits(images, training=True)
+                student_soft = tf.nn.softmax(logits / temperature)
+                loss = (alpha * cross_entropy(labels, logits)
+                        + (1.0 - alpha) * temperature ** 2 * kl_divergence(teacher_soft, student_soft))
+            gradients = tape.gradient(loss, student_logits.trainable_variables)
+            optimizer.apply_gradients(zip(gradients, student_logits.trainable_variables))
+            return loss
+
+        generator = self.train_generator
+        # Without augmentation every epoch sees the same images, so the teacher
+        # only has to run once per image: its outputs are kept by row (position
+        # of the image in the split), which rows_dataset yields with every batch
+        teacher_cache = None
+        if not self.training.config.params_is_augmentation:
+            teacher_cache = np.full((generator.samples, self.config.params_classes), np.nan, dtype="float32")
+
+        for epoch in range(self.config.params_epochs):
+            losses = []
+            # tf.data pipeline (parallel decode, cache, prefetch), not generator[step]
+            for images, labels, rows in generator.rows_dataset:
+                if teacher_cache is not None:
+                    rows = rows.numpy()
+                    if np.isnan(teacher_cache[rows, 0]).any():
+                        teacher_cache[rows] = np.asarray(self.teacher(images, training=False))
+                    teacher_probabilities = teacher_cache[rows]
+                else:
+                    teacher_probabilities = self.teacher(images, training=False)
+                losses.append(float(train_step(images, labels, teacher_probabilities)))
+
+            logger.info(
+                f"Distillation epoch {epoch + 1}/{self.config.params_epochs}: "
+                f"loss {np.mean(losses):.4f}, student val accuracy {self._accuracy(self.student):.4f}"
+            )
+
+        self.student.save(self.config.student_model_path)
+        logger.info(f"Student model saved at: {self.config.student_model_path}")
+        return self.student
+
+    def _predict_validation(self, model) -> tuple:
+        probabilities, labels = [], []
+        for step in range(len(self.valid_generator)):
+            images, batch_labels = self.valid_generator[step]
+            probabilities.append(np.asarray(model.predict_on_batch(images)))
+            labels.append(batch_labels)
+        return np.concatenate(probabilities), np.concatenate(labels)
+
+    def _accuracy(self, model) -> float:
+        probabilities, labels = self._predict_validation(model)
+        return float(np.mean(probabilities.argmax(axis=1) == labels.argmax(axis=1)))
+
+    def _score(self, model, path: Path, probabilities: np.ndarray, labels: np.ndarray) -> dict:
+        loss = -np.mean(np.sum(labels * np.log(np.clip(probabilities, 1e-7, 1.0)), axis=1))
+        single_image = np.random.default_rng(0).uniform(
+            0, 255, size=[1] + list(model.input_shape[1:])
+        ).astype("float32")
+        return {
+            "loss": float(loss),
+            "accuracy": float(np.mean(probabilities.argmax(axis=1) == labels.argmax(axis=1))),
+            "params": int(model.count_params()),
+            "size_bytes": os.path.getsize(path),
+            "flops_per_image": count_flops(model),
+            **measure_latency(model.predict_on_batch, single_image),
+        }
+
+    def save_score(self) -> dict:
+        """
+        Score teacher and student on the validation split and write the comparison.
+
+        Returns:
+            dict: {"teacher": {...}, "student": {...}, "accuracy_delta", "speedup", "agreement"}
+        """
+        teacher_probabilities, labels = self._predict_validation(self.teacher)
+        student_probabilities, _ = self._predict_validation(self.student)
+
+        scores = {
+            "images": int(len(labels)),
+            "temperature": float(self.config.params_temperature),
+            "alpha": float(self.config.params_alpha),
+            "teacher": self._score(self.teacher, self.config.teacher_model_path, teacher_probabilities, labels),
+            "student": self._score(self.student, self.config.student_model_path, student_probabilities, labels),
+        }
+        scores["accuracy_delta"] = scores["student"]["accuracy"] - scores["teacher"]["accuracy"]
+        scores["speedup"] = scores["teacher"]["latency_ms_p50"] / scores["student"]["latency_ms_p50"]
+        scores["agreement"] = float(np.mean(
+            teacher_probabilities.argmax(axis=1) == student_probabilities.argmax(axis=1)
+        ))
+
+        save_json(path=self.config.report_path, data=scores)
+        logger.info(
+            f"Student vs teacher: accuracy {scores['student']['accuracy']:.4f} vs {scores['teacher']['accuracy']:.4f}, "
+            f"{scores['speedup']:.1f}x faster, agreement {scores['agreement']:.2%}"
+        )
+        return scores
@@ -1,49 +1,35 @@
 import tensorflow as tf
 from pathlib import Path 
-import mlflow
-import mlflow.keras
 from urllib.parse import urlparse 
 from cnnClassifier.entitiy.config_entity import EvaluationConfig
+from cnnClassifier.components.image_dataset import ImageFolderDataset
+from cnnClassifier.components.model_benchmark import measure_latency
+from cnnClassifier.components.precision import with_precision
 from cnnClassifier.utils.common import save_json
-from dotenv import load_dotenv
-load_dotenv()
+
 class Evaluation:
     def __init__(self, config: EvaluationConfig):
         self.config = config  # Store config with model path, image size, batch size
 
     def _valid_generator(self):
-        # Image preprocessing settings
         """
-        Create data generator for validation data
-        Normalizes pixel values, resizes images to (height, width), and loads them in batches
+        Create the tf.data input pipeline for validation data
+        Decodes and resizes images (height, width) in parallel, applies the backbone
+        preprocessing and loads them in batches, prefetching the next ones
         Validation data is loaded from disk in batches, not all at once - saves memory!
         Automatic batching: No need to manually create batches
-        Real-time augmentation: Creates new variations on-the-fly
         """
-        
-        datagenerator_kwargs = dict(
-            rescale=1./255,  # Normalize pixel values from [0,255] to [0,1]
-            validation_split=0.30  # Reserve 30% of data for validation
-        )
-
-        # Data loading settings
-        dataflow_kwargs = dict(
-            target_size=self.config.params_image_size[:-1],  # Resize images to (height, width)
-            batch_size=self.config.params_batch_size,  # Number of images per batch
-            interpolation="bilinear"  # Image resizing method
-        )
-
-        # Create ImageDataGenerator for validation data
-        valid_datagenerator = tf.keras.preprocessing.image.ImageDataGenerator(
-            **datagenerator_kwargs
-        )
-
-        # Load validation images from directory
-        self.valid_generator = valid_datagenerator.flow_from_directory(
+        self.valid_generator = ImageFolderDataset(
             directory=self.config.training_data,  # Path to data folder
+            image_size=self.config.params_image_size[:-1],  # Resize images to (height, width)
+            batch_size=self.config.params_batch_size,  # Number of images per batch
+            # Same backbone preprocessing as training and prediction
+            backbone=self.config.params_backbone,
             subset="validation",  # Use validation split
+            validation_split=0.30,  # Reserve 30% of data for validation
             shuffle=False,  # Keep order for consistent evaluation
-            **dataflow_kwargs
+            # Pre-decoded images from the dataset_packing shards, if up to date
+            packed_index=self.config.packed_index_path
         )
 
     @staticmethod
@@ -57,17 +43,27 @@ class Evaluation:
         Evaluate a model on the validation set and store the evaluation metrics in self.score
 
         Evaluates the model using the validation data generator and stores the loss and accuracy in self.score
+        The model runs under PRECISION from params.yaml; its throughput on one
+        validation batch is stored in self.throughput
         """
-        self.model = self.load_model(self.config.path_of_model)
+        self.model = with_precision(self.load_model(self.config.path_of_model), self.config.params_precision)
         # Prepare validation data
         self._valid_generator()
         # Evaluate model and get loss/metrics
-        self.score = self.model.evaluate(self.valid_generator)  # Fixed: was 'model', should be 'self.model'
+        self.score = self.model.evaluate(self.valid_generator.dataset)  # Fixed: was 'model', should be 'self.model'
+        # Images per second at BATCH_SIZE, to compare precisions on this hardware
+        images, _ = self.valid_generator[0]
+        self.throughput = measure_latency(self.model.predict_on_batch, images)
 
         # self.save_score()
 
     def save_score(self):
-        scores = {"loss":self.score[0],"accuracy":self.score[1]}
+        scores = {
+            "loss":self.score[0],
+            "accuracy":self.score[1],
+            "precision":self.config.params_precision,
+            "images_per_second":self.throughput["images_per_second"]
+        }
         save_json(path=Path("scores.json"),data=scores)
 
     def log_into_mlflow(self):
@@ -76,6 +72,13 @@ class Evaluation:
 
         Logs the evaluation metrics into the current MLflow run and registers the model in the MLflow Model Registry if the tracking URI is not a file store
         """
+        # Imported here so evaluation (and importing this module) never pays for
+        # mlflow; .env holds the MLFLOW_TRACKING_* credentials
+        import mlflow
+        import mlflow.keras
+        from dotenv import load_dotenv
+        load_dotenv()
+
         mlflow.set_registry_uri(self.config.mlflow_uri)
 
         tracking_uri_type_store = urlparse(mlflow.get_tracking_uri()).scheme 
@@ -83,7 +86,8 @@ class Evaluation:
         with mlflow.start_run():
             mlflow.log_params(self.config.all_params)
             mlflow.log_metrics(
-                {"loss":self.score[0],"accuracy":self.score[1]}
+                {"loss":self.score[0],"accuracy":self.score[1],
+                 "images_per_second":self.throughput["images_per_second"]}
             )
 
             # Model registry does not work with file store 
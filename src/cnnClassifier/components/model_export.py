@@ -0,0 +1,117 @@
+"""
+cnnClassifier.components.model_export
+
+This module contains the ModelExport component responsible for:
+- Converting the trained Keras model to TFLite for CPU serving
+- Checking that the TFLite model gives the same probabilities as Keras
+  on the validation split
+- Writing a parity report (max/mean probability difference, label agreement, sizes)
+"""
+
+import os
+from pathlib import Path
+
+import numpy as np
+import tensorflow as tf
+
+from cnnClassifier import logger
+from cnnClassifier.entitiy.config_entity import ModelExportConfig
+from cnnClassifier.components.tflite_model import TFLiteModel
+from cnnClassifier.components.image_dataset import ImageFolderDataset
+from cnnClassifier.components.precision import with_precision
+from cnnClassifier.components.augmentation import strip_augmentation
+from cnnClassifier.utils.common import save_json
+
+
+class ModelExport:
+    """
+    Exports artifacts/training/model.keras to a .tflite file and verifies it.
+    """
+
+    def __init__(self, config: ModelExportConfig):
+        self.config = config
+
+    def _valid_generator(self):
+        """
+        Validation images exactly as Training sees them
+        (backbone preprocessing, same 20% validation split, bilinear resize, no shuffling)
+        """
+        self.valid_generator = ImageFolderDataset(
+            directory=self.config.training_data,
+            image_size=self.config.params_image_size[:-1],
+            batch_size=self.config.params_batch_size,
+            backbone=self.config.params_backbone,
+            subset="validation",
+            validation_split=0.20,
+            shuffle=False
+        )
+
+    def load_keras_model(self) -> tf.keras.Model:
+        """
+        Load the trained Keras model (inference only, no optimizer state).
+
+        Models trained with a mixed PRECISION are converted back to float32:
+        the TFLite model is always a float32 (or int8) graph. Augmentation
+        layers, if any, are stripped before conversion.
+        """
+        model = tf.keras.models.load_model(self.config.keras_model_path, compile=False)
+        return with_precision(strip_augmentation(model), "float32")
+
+    def convert(self) -> Path:
+        """
+        Convert the trained Keras model to TFLite (float32 weights).
+
+        Returns:
+            Path: Where the .tflite file was written.
+        """
+        self.keras_model = self.load_keras_model()
+
+        converter = tf.lite.TFLiteConverter.from_keras_model(self.keras_model)
+        tflite_model = converter.convert()
+
+        self.config.tflite_model_path.write_bytes(tflite_model)
+        logger.info(
+            f"TFLite model saved at: {self.config.tflite_model_path} "
+            f"({len(tflite_model) / 2**20:.1f} MB)"
+        )
+        return self.config.tflite_model_path
+
+    def parity_check(self) -> dict:
+        """
+        Compare Keras and TFLite probabilities on the validation split.
+
+        Returns:
+            dict: max/mean absolute probability difference, label agreement and model sizes.
+        """
+        if not hasattr(self, "keras_model"):
+            self.keras_model = self.load_keras_model()
+        tflite_model = TFLiteModel(self.config.tflite_model_path, num_threads=self.config.num_threads)
+        self._valid_generator()
+
+        differences = []
+        agreements = []
+        for step in range(len(self.valid_generator)):
+            images, _ = self.valid_generator[step]
+            keras_probabilities = np.asarray(self.keras_model.predict_on_batch(images))
+            tflite_probabilities = tflite_model.predict_on_batch(images)
+
+            differences.append(np.abs(keras_probabilities - tflite_probabilities))
+            agreements.append(keras_probabilities.argmax(axis=1) == tflite_probabilities.argmax(axis=1))
+
+        differences = np.concatenate(differences)
+        agreements = np.concatenate(agreements)
+
+        report = {
+            "images": int(len(agreements)),
+            "max_abs_diff": float(differences.max()),
+            "mean_abs_diff": float(differences.mean()),
+            "label_agreement": float(agreements.mean()),
+            "keras_size_bytes": os.path.getsize(self.config.keras_model_path),
+            "tflite_size_bytes": os.path.getsize(self.config.tflite_model_path),
+        }
+        save_json(path=self.config.parity_report_path, data=report)
+        logger.info(
+            f"TFLite parity on {report['images']} validation images: "
+            f"max |diff| = {report['max_abs_diff']:.2e}, label agreement = {report['label_agreement']:.2%}"
+        )
+        return report
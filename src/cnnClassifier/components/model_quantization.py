@@ -0,0 +1,150 @@
+"""
+cnnClassifier.components.model_quantization
+
+This module contains the ModelQuantization component responsible for:
+- Full-integer (int8) post-training quantization of the trained model
+- Calibrating activation ranges on a representative set of training images
+- Scoring the float and int8 TFLite models on the validation split
+  (accuracy, loss, model size, per-image latency)
+"""
+
+import os
+import time
+from dataclasses import replace
+from pathlib import Path
+
+import numpy as np
+import tensorflow as tf
+
+from cnnClassifier import logger
+from cnnClassifier.entitiy.config_entity import ModelQuantizationConfig, TrainingConfig
+from cnnClassifier.components.model_training import Training
+from cnnClassifier.components.tflite_model import TFLiteModel
+from cnnClassifier.components.precision import with_precision
+from cnnClassifier.utils.common import save_json
+
+
+class ModelQuantization:
+    """
+    Quantizes the trained classifier to int8 and compares it with the float TFLite model.
+
+    Images come from Training.train_valid_generator(), so calibration uses
+    the training split and scoring uses the validation split, exactly as
+    during training.
+    """
+
+    def __init__(self, config: ModelQuantizationConfig, training_config: TrainingConfig):
+        """
+        Args:
+            config: Paths of the float/int8 models and the report.
+            training_config: Training configuration (data folder, image size, batch size).
+        """
+        self.config = config
+        # Calibration must see the real images, never augmented ones
+        self.training = Training(config=replace(training_config, params_is_augmentation=False))
+
+    def load_data(self):
+        """Create the training (calibration) and validation (scoring) generators."""
+        self.training.train_valid_generator()
+        self.train_generator = self.training.train_generator
+        self.valid_generator = self.training.valid_generator
+
+    def representative_dataset(self):
+        """
+        Yield up to params_calibration_samples single training images
+        for the converter to measure activation ranges on.
+        """
+        remaining = self.config.params_calibration_samples
+        for step in range(len(self.train_generator)):
+            images, _ = self.train_generator[step]
+            for image in images[:remaining]:
+                yield [image[np.newaxis].astype("float32")]
+            remaining -= len(images)
+            if remaining <= 0:
+                break
+
+    def quantize(self) -> Path:
+        """
+        Convert the Keras model to a full-integer TFLite model
+        (int8 weights, activations, inputs and outputs).
+
+        Returns:
+            Path: Where the int8 .tflite file was written.
+        """
+        # Quantize from float32 even if the model was trained with a mixed PRECISION
+        model = with_precision(tf.keras.models.load_model(self.config.keras_model_path, compile=False), "float32")
+
+        converter = tf.lite.TFLiteConverter.from_keras_model(model)
+        converter.optimizations = [tf.lite.Optimize.DEFAULT]
+        converter.representative_dataset = self.representative_dataset
+        # Fail instead of silently keeping float ops
+        converter.target_spec.supported_ops = [tf.lite.OpsSet.TFLITE_BUILTINS_INT8]
+        converter.inference_input_type = tf.int8
+        converter.inference_output_type = tf.int8
+        tflite_model = converter.convert()
+
+        self.config.int8_model_path.write_bytes(tflite_model)
+        logger.info(
+            f"int8 model saved at: {self.config.int8_model_path} "
+            f"({len(tflite_model) / 2**20:.1f} MB)"
+        )
+        return self.config.int8_model_path
+
+    def _validation_set(self) -> tuple:
+        images, labels = [], []
+        for step in range(len(self.valid_generator)):
+            batch_images, batch_labels = self.valid_generator[step]
+            images.append(batch_images)
+            labels.append(batch_labels)
+        return np.concatenate(images), np.concatenate(labels)
+
+    def _score(self, model_path: Path, images: np.ndarray, labels: np.ndarray) -> dict:
+        """Accuracy, categorical cross-entropy, size and batch-1 latency of one TFLite model."""
+        model = TFLiteModel(model_path, num_threads=self.config.num_threads)
+
+        # Warm-up pass, then time one image at a time (the /predict case)
+        model.predict_on_batch(images[:1])
+        latencies = []
+        probabilities = []
+        for image in images:
+            start = time.perf_counter()
+            probabilities.append(model.predict_on_batch(image[np.newaxis])[0])
+            latencies.append(time.perf_counter() - start)
+
+        probabilities = np.asarray(probabilities)
+        loss = -np.mean(np.sum(labels * np.log(np.clip(probabilities, 1e-7, 1.0)), axis=1))
+        accuracy = np.mean(probabilities.argmax(axis=1) == labels.argmax(axis=1))
+        latencies = np.asarray(latencies) * 1000.0
+
+        return {
+            "loss": float(loss),
+            "accuracy": float(accuracy),
+            "size_bytes": os.path.getsize(model_path),
+            "latency_ms_p50": float(np.percentile(latencies, 50)),
+            "latency_ms_p99": float(np.percentile(latencies, 99)),
+        }
+
+    def save_score(self) -> dict:
+        """
+        Score the float and int8 models on the validation split and write the report.
+
+        Returns:
+            dict: {"float": {...}, "int8": {...}, "accuracy_delta": ..., "size_ratio": ...}
+        """
+        images, labels = self._validation_set()
+
+        scores = {
+            "images": int(len(images)),
+            "float": self._score(self.config.float_model_path, images, labels),
+            "int8": self._score(self.config.int8_model_path, images, labels),
+        }
+        scores["accuracy_delta"] = scores["int8"]["accuracy"] - scores["float"]["accuracy"]
+        scores["size_ratio"] = scores["int8"]["size_bytes"] / scores["float"]["size_bytes"]
+
+        save_json(path=self.config.report_path, data=scores)
+        logger.info(
+            f"int8 vs float: accuracy {scores['int8']['accuracy']:.4f} vs {scores['float']['accuracy']:.4f}, "
+            f"p50 latency {scores['int8']['latency_ms_p50']:.1f} ms vs {scores['float']['latency_ms_p50']:.1f} ms, "
+            f"size x{scores['size_ratio']:.2f}"
+        )
+        return scores
@@ -5,6 +5,10 @@ from zipfile import ZipFile
 from pathlib import Path
 import tensorflow as tf 
 import time 
+from cnnClassifier.components.image_dataset import ImageFolderDataset
+from cnnClassifier.components.augmentation import augment_batches
+from cnnClassifier.components.precision import with_precision
+
 
 class Training:
     """
@@ -12,7 +16,7 @@ class Training:
     
     This class takes care of:
     1. Loading the prepared VGG16 model
-    2. Creating data generators for training and validation
+    2. Creating tf.data input pipelines for training and validation
     3. Training the model on kidney CT scan images
     4. Saving the trained model 
     """
@@ -41,10 +45,15 @@ class Training:
         - Compiled and ready for training
         
         The model is loaded from: artifacts/prepare_base_model/base_model_updated.h5
+        and runs under PRECISION from params.yaml (float32 or mixed_bfloat16;
+        the softmax output always stays float32)
         """
-        self.model = tf.keras.models.load_model(
-            self.config.updated_base_model_path,
-            compile=False
+        self.model = with_precision(
+            tf.keras.models.load_model(
+                self.config.updated_base_model_path,
+                compile=False
+            ),
+            self.config.params_precision
         )
 
         self.model.compile(
@@ -55,156 +64,136 @@ class Training:
     
     def train_valid_generator(self):
         """
-        Create data generators for feeding images to the model during training
+        Create the training and validation input pipelines (ImageFolderDataset)
+        
+        Each one:
+        - Decodes and resizes images on all CPU cores with tf.data
+        - Caches the decoded pixels in memory after the first epoch
+        - Applies data augmentation to the training set (increases dataset variety)
+        - Applies the backbone preprocessing to whole batches
+        - Prepares the next batches while the model trains on the current one (prefetch)
         
-        Data generators:
-        - Load images from disk in batches (not all at once - saves memory!)
-        - Apply preprocessing (normalization, resizing)
-        - Apply data augmentation to training set (increases dataset variety)
-        - Split data into training (80%) and validation (20%) sets
+        The split is the one flow_from_directory used: per class, the first 20%
+        of the sorted files are validation, the rest training - same files every run
         
-        Why use generators?
-        - Memory efficient: Only loads one batch at a time
-        - Real-time augmentation: Creates new variations on-the-fly
-        - Automatic batching: No need to manually create batches
+        self.train_generator / self.valid_generator also work batch by batch:
+        len(generator), generator[step], generator.samples, ...
         """
         
-        # ==================== COMMON SETTINGS FOR BOTH GENERATORS ====================
+        # ==================== COMMON SETTINGS FOR BOTH SPLITS ====================
         
-        # Dictionary of settings applied to BOTH training and validation generators
-        datagenerator_kwargs = dict(
-            # Rescale pixel values from [0, 255] to [0, 1]
-            # Neural networks work better with normalized inputs
-            # Example: pixel value 255 becomes 1.0, value 127 becomes 0.498
-            rescale = 1./255,
+        dataset_kwargs = dict(
+            # Path to data folder containing Normal/ and Tumor/ subfolders
+            directory = self.config.training_data,
             
-            # Split dataset: 80% training, 20% validation
-            # Validation set is used to check if model is overfitting
-            validation_split = 0.20
-        )
-
-        # Dictionary of settings for how images flow through the generators
-        dataflow_kwargs = dict(
-            # Resize all images to (224, 224) - VGG16's required input size
+            # Resize all images to (224, 224) with bilinear interpolation
             # [:-1] removes the last element (channels), so [224, 224, 3] becomes [224, 224]
-            target_size = self.config.params_image_size[:-1],
+            image_size = self.config.params_image_size[:-1],
             
-            # Number of images to load in each batch
-            # Smaller batch = less memory, but noisier training
-            # Larger batch = more memory, but stabler training
-            # 16 is a good balance for most systems
+            # Number of images in each batch
             batch_size = self.config.params_batch_size,
             
-            # Method for resizing images
-            # "bilinear" = smooth interpolation, good quality
-            # Other options: "nearest", "bicubic"
-            interpolation = "bilinear"
-        )
-
-        # ==================== VALIDATION GENERATOR ====================
-        
-        # Create validation data generator
-        # Validation images get NO augmentation - we want to test on real, unchanged images
-        # Only rescaling is applied (normalize to [0, 1])
-        valid_datagenerator = tf.keras.preprocessing.image.ImageDataGenerator(
-            **datagenerator_kwargs  # ** unpacks the dictionary into keyword arguments
-        )
-
-        # Create the actual generator that loads validation images
-        self.valid_generator = valid_datagenerator.flow_from_directory(
-            # Path to data folder containing Normal/ and Tumor/ subfolders
-            directory=self.config.training_data,
-            
-            # Use the validation split (20% of data)
-            subset="validation",
+            # Apply the backbone's own preprocessing to the [0, 255] pixels
+            # Example: MobileNetV2 scales to [-1, 1], VGG16 subtracts the ImageNet mean (BGR)
+            # The same function is used by evaluation and prediction
+            backbone = self.config.params_backbone,
             
-            # Don't shuffle validation data - we want consistent evaluation
-            # Shuffling would give slightly different accuracy each time
-            shuffle=False, 
+            # Split dataset: 80% training, 20% validation
+            validation_split = 0.20,
             
-            # Apply the dataflow settings (target_size, batch_size, etc.)
-            **dataflow_kwargs
+            # Read already decoded images from the dataset_packing shards when
+            # they are up to date (falls back to decoding the files otherwise)
+            packed_index = self.config.packed_index_path
         )
-        # Output example: "Found 40 images belonging to 2 classes."
 
-        # ==================== TRAINING GENERATOR ====================
+        # ==================== VALIDATION SPLIT ====================
         
+        # Validation images get NO augmentation and are not shuffled,
+        # so every evaluation sees exactly the same batches
+        self.valid_generator = ImageFolderDataset(subset="validation", shuffle=False, **dataset_kwargs)
+
+        # ==================== TRAINING SPLIT ====================
+        
+        batch_augment = None
         # Check if data augmentation is enabled in params.yaml
         if self.config.params_is_augmentation:
-            # DATA AUGMENTATION: Create artificial variations of training images
-            # This helps prevent overfitting and makes model more robust
-            
-            # Why augmentation?
-            # - Increases effective dataset size (1000 images → 10,000+ variations)
-            # - Model learns to recognize kidneys from different angles, positions
-            # - Prevents memorization of training images
-            
-            train_datagenerator = tf.keras.preprocessing.image.ImageDataGenerator(
-                # Randomly rotate images up to 40 degrees left or right
-                # Example: Original image → Rotated 15° clockwise
-                # Helps model recognize kidneys at different orientations
-                rotation_range=40,
-                
-                # Randomly flip images horizontally (left ↔ right)
-                # Example: Kidney on left side → Kidney on right side
-                # Medical images can be from either kidney!
-                horizontal_flip=True,
-                
-                # Randomly shift image horizontally by up to 20% of width
-                # Example: 224px image → shift up to 45 pixels left/right
-                # Helps model handle kidneys not perfectly centered
-                width_shift_range=0.2,
-                
-                # Randomly shift image vertically by up to 20% of height
-                # Example: 224px image → shift up to 45 pixels up/down
-                height_shift_range=0.2,
-                
-                # Apply shear transformation (slanting effect)
-                # Example: Rectangle → Parallelogram
-                # Range: 0.2 means up to 20% shear
-                # Helps with images taken at angles
-                shear_range=0.2,
-                
-                # Randomly zoom in/out by up to 20%
-                # Example: Zoom in 10% → closer view of kidney
-                # Helps model recognize kidneys at different scales
-                zoom_range=0.2,
-                
-                # Also apply rescaling and validation_split
-                **datagenerator_kwargs
-            )
-            
-            # IMPORTANT: Each image is augmented RANDOMLY each epoch
-            # Same image looks different every time it's fed to the model!
-            # This creates essentially unlimited training variations
-            
-        else:
-            # If augmentation is disabled, use same generator as validation
-            # Training images only get rescaled, no transformations
-            # Useful for: debugging, fast prototyping, or very large datasets
-            train_datagenerator = valid_datagenerator
-    
-        # Create the actual generator that loads training images
-        self.train_generator = train_datagenerator.flow_from_directory(
-            # Path to data folder
-            directory=self.config.training_data,
-            
-            # Use the training split (80% of data)
-            subset="training",
-            
-            # Shuffle training data - important for good learning!
-            # Model sees images in different order each epoch
-            # Prevents learning based on image order
-            shuffle=True,
-            
-            # Apply the dataflow settings
-            **dataflow_kwargs
+            # DATA AUGMENTATION: random rotation, flip, shifts, shear and zoom
+            # (augmentation.POLICY - the values ImageDataGenerator used)
+            # Each image is transformed differently every epoch
+            # Keras preprocessing layers transform whole batches at once, in the
+            # tf.data graph, after the decoded pixels were cached. They are NOT
+            # part of the model, so the saved/exported model never contains them
+            batch_augment = augment_batches()
+
+        # Shuffle training data - model sees images in a different order each epoch
+        self.train_generator = ImageFolderDataset(
+            subset="training", shuffle=True, batch_augment=batch_augment, **dataset_kwargs
         )
-        # Output example: "Found 160 images belonging to 2 classes."
         
         # FINAL RESULT:
-        # self.train_generator: Loads augmented training images in batches
-        # self.valid_generator: Loads original validation images in batches
+        # self.train_generator.dataset: (augmented) training batches for model.fit
+        # self.valid_generator.dataset: original validation batches
+
+    def get_head_model(self):
+        """
+        Build a model made of only the trainable layers at the end of the full model
+
+        With freeze_all=True (stage 02) these are the Flatten → Dense head layers.
+        The head shares its layers with self.model, so training the head updates
+        the full model that gets saved
+
+        Returns:
+            tf.keras.Model or None: None if any backbone layer is trainable
+            (fine-tuning needs real images, cached features can't be used)
+        """
+        layers = self.model.layers
+        # Index of the first layer of the trainable head
+        start = len(layers)
+        while start > 0 and layers[start - 1].trainable:
+            start -= 1
+
+        if start in (0, len(layers)) or any(layer.trainable_weights for layer in layers[:start]):
+            return None
+
+        # Head input = output of the last frozen layer, e.g. (7, 7, 512) for VGG16
+        head_input = tf.keras.Input(shape=layers[start - 1].output.shape[1:])
+        x = head_input
+        for layer in layers[start:]:
+            x = layer(x)
+
+        head = tf.keras.Model(inputs=head_input, outputs=x)
+        head.compile(
+            optimizer=tf.keras.optimizers.SGD(learning_rate=0.001),
+            loss=tf.keras.losses.CategoricalCrossentropy(),
+            metrics=["accuracy"]
+        )
+        return head
+
+    def train_head(self, features):
+        """
+        Train only the classification head on cached bottleneck features
+
+        The frozen backbone already ran once over every image (feature_extraction
+        stage), so each epoch is just the small head on (7, 7, 512) arrays instead
+        of 13 conv layers on 224x224 images - seconds instead of hours on CPU
+
+        Args:
+            features: FeatureExtraction object with up-to-date cached features
+        """
+        head = self.get_head_model()
+
+        head.fit(
+            # Batches are read from the memory-mapped feature files on disk
+            features.batches("train", self.config.params_batch_size, shuffle=True),
+            epochs = self.config.params_epochs,
+            validation_data = features.batches("valid", self.config.params_batch_size)
+        )
+
+        # The head's layers ARE the full model's layers, so the full model is trained now
+        self.save_model(
+            path = self.config.trained_model_path,
+            model = self.model
+        )
 
     @staticmethod
     def save_model(path: Path, model: tf.keras.Model):
@@ -251,22 +240,6 @@ class Training:
                           - Reduce learning rate
         """
         
-        # ==================== CALCULATE TRAINING STEPS ====================
-        
-        # Calculate how many batches (steps) in one epoch for TRAINING data
-        # Formula: total_images // batch_size
-        # Example: 160 training images, batch_size=16 → 160 // 16 = 10 steps per epoch
-        # 
-        # Why // (floor division)?
-        # - If 165 images and batch_size=16 → 165 // 16 = 10 steps
-        # - Last 5 images are dropped (can't form complete batch)
-        # - This ensures all batches have exactly the same size
-        self.steps_per_epoch = self.train_generator.samples // self.train_generator.batch_size 
-        
-        # Calculate how many batches (steps) for VALIDATION data
-        # Example: 40 validation images, batch_size=16 → 40 // 16 = 2 steps
-        self.validation_steps = self.valid_generator.samples // self.valid_generator.batch_size 
-        
         # ==================== TRAIN THE MODEL ====================
         
         # model.fit() is the main training function
@@ -281,10 +254,12 @@ class Training:
         #     2. Calculate metrics
         
         self.model.fit(
-            # Training data generator
+            # Training input pipeline (tf.data)
             # Provides batches of (images, labels) automatically
-            # Example batch: 16 images of shape (224, 224, 3) + 16 labels [0 or 1]
-            self.train_generator,
+            # Example batch: 16 images of shape (224, 224, 3) + 16 one-hot labels
+            # One pass over the dataset is one epoch - every training image is used,
+            # the last batch may be smaller
+            self.train_generator.dataset,
             
             # Number of times to iterate over the ENTIRE dataset
             # Example: epochs=10 means model sees each image 10 times
@@ -297,21 +272,11 @@ class Training:
             # Epoch 20+: Might start overfitting (memorizing instead of learning)
             epochs = self.config.params_epochs,
             
-            # Number of batches to process in one epoch
-            # We calculated this above: total_training_images // batch_size
-            # Example: 10 steps means model processes 10 batches per epoch
-            steps_per_epoch = self.steps_per_epoch,
-            
-            # Number of validation batches to process after each epoch
-            # Used to check model performance on unseen data
-            # Example: 2 steps means process 2 batches of validation data
-            validation_steps = self.validation_steps,
-            
-            # Validation data generator
+            # Validation input pipeline
             # After each epoch, model is evaluated on this data
             # This gives us validation accuracy and loss
             # If validation loss increases → model is overfitting!
-            validation_data = self.valid_generator,
+            validation_data = self.valid_generator.dataset,
             
             # Callbacks are executed at specific points during training
             # Common callbacks:
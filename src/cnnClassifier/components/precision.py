@@ -0,0 +1,69 @@
+"""
+cnnClassifier.components.precision
+
+This module contains the precision helpers responsible for:
+- Validating the PRECISION value in params.yaml
+- Rebuilding a Keras model under a mixed-precision dtype policy
+  (bfloat16 compute, float32 weights) or back to float32
+- Keeping the softmax output layer in float32 whatever the policy
+"""
+
+import tensorflow as tf
+
+# float32: everything in float32. mixed_bfloat16: layers compute in bfloat16
+# (native on CPUs with AVX512_BF16 / AMX), variables stay float32.
+PRECISIONS = ("float32", "mixed_bfloat16")
+
+
+def check_precision(precision: str) -> str:
+    if precision not in PRECISIONS:
+        raise ValueError(f"Unknown PRECISION {precision!r}, expected one of {PRECISIONS}")
+    return precision
+
+
+def _layer_policies(config: dict, precision: str, keep_float32: set) -> dict:
+    """Set the dtype policy of every layer in a functional model config (nested models included)."""
+    for layer in config["layers"]:
+        if layer["class_name"] == "InputLayer":
+            continue
+        if "layers" in layer["config"]:
+            _layer_policies(layer["config"], precision, keep_float32)
+        elif layer["config"]["name"] in keep_float32:
+            layer["config"]["dtype"] = "float32"
+        else:
+            layer["config"]["dtype"] = precision
+    return config
+
+
+def with_precision(model: tf.keras.Model, precision: str) -> tf.keras.Model:
+    """
+    Return model running under the given precision.
+
+    The dtype policy of a layer is fixed when it is built, so the model is
+    rebuilt from its config with the new policy and the (always float32)
+    weights are copied over. The output layer stays float32 so the softmax
+    and the loss are computed at full precision. Compile settings are kept.
+
+    Args:
+        model: Loaded or freshly built Keras model.
+        precision: One of PRECISIONS.
+
+    Returns:
+        tf.keras.Model: model itself if it already runs under precision, else a rebuilt copy.
+    """
+    check_precision(precision)
+    output_layer = model.layers[-1].name
+    current = {
+        layer.name: layer.dtype_policy.name for layer in model.layers
+        if not isinstance(layer, tf.keras.layers.InputLayer)
+    }
+    wanted = {name: "float32" if name == output_layer else precision for name in current}
+    if current == wanted:
+        return model
+
+    config = _layer_policies(model.get_config(), precision, keep_float32={output_layer})
+    rebuilt = model.__class__.from_config(config)
+    rebuilt.set_weights(model.get_weights())
+    if model.compiled:
+        rebuilt.compile_from_config(model.get_compile_config())
+    return rebuilt
@@ -0,0 +1,140 @@
+"""
+cnnClassifier.components.prediction_cache
+
+This module contains the PredictionCache component responsible for:
+- Remembering class probabilities of images that were already predicted
+- Keying entries by the upload's content hash and the model version
+- Keeping a size-bounded in-memory LRU tier and an optional on-disk tier
+- Counting hits and misses
+"""
+
+import time
+import hashlib
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+import numpy as np
+
+from cnnClassifier import logger
+
+
+class PredictionCache:
+    """
+    Content-addressed LRU cache of prediction probabilities with a TTL.
+
+    Keys combine the SHA-256 of the raw upload bytes with the model's
+    content hash, so entries written for an older model are never served
+    once the model file changes.
+    """
+
+    def __init__(self, max_entries: int = 4096, ttl_seconds: float = 86400,
+                 disk_dir: Path = None, disk_size_limit: int = 2 ** 30):
+        """
+        Args:
+            max_entries: Entries kept in memory before the least recently used is dropped.
+            ttl_seconds: How long an entry stays valid.
+            disk_dir: Directory of the optional on-disk tier (None disables it).
+            disk_size_limit: Size cap in bytes of the on-disk tier.
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl_seconds
+
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        self._disk = None
+        if disk_dir is not None:
+            # diskcache is only needed when the disk tier is switched on
+            import diskcache
+            self._disk = diskcache.Cache(str(disk_dir), size_limit=disk_size_limit)
+            logger.info(f"Prediction cache disk tier at: {disk_dir}")
+
+        self.hits = 0
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    @property
+    def on_disk(self) -> bool:
+        """True when the disk tier is on: get/set/clear may then block on SQLite and file I/O."""
+        return self._disk is not None
+
+    @staticmethod
+    def key(contents: bytes, model_version: str) -> str:
+        """Cache key for an upload: '<model version>:<sha256 of the bytes>'."""
+        return f"{model_version}:{hashlib.sha256(contents).hexdigest()}"
+
+    def _remember(self, key: str, probabilities: np.ndarray, expires_at: float) -> None:
+        with self._lock:
+            self._memory[key] = (expires_at, probabilities)
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_entries:
+                self._memory.popitem(last=False)
+
+    def get(self, key: str):
+        """
+        Return cached probabilities for key, or None on a miss or expired entry.
+        """
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                expires_at, probabilities = entry
+                if expires_at > now:
+                    self._memory.move_to_end(key)
+                    self.hits += 1
+                    self.memory_hits += 1
+                    return probabilities
+                del self._memory[key]
+
+        if self._disk is not None:
+            entry = self._disk.get(key)
+            if entry is not None:
+                expires_at, probabilities = entry
+                probabilities = np.asarray(probabilities, dtype="float32")
+                # Promote to the memory tier for the next lookup
+                self._remember(key, probabilities, expires_at)
+                with self._lock:
+                    self.hits += 1
+                    self.disk_hits += 1
+                return probabilities
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def set(self, key: str, probabilities) -> None:
+        """Store class probabilities for key in both tiers."""
+        probabilities = np.asarray(probabilities, dtype="float32")
+        expires_at = time.time() + self.ttl
+        self._remember(key, probabilities, expires_at)
+
+        if self._disk is not None:
+            self._disk.set(key, (expires_at, probabilities.tolist()), expire=self.ttl)
+
+    def clear(self) -> None:
+        """Drop every entry (e.g. after the model changed)."""
+        with self._lock:
+            self._memory.clear()
+        if self._disk is not None:
+            self._disk.clear()
+        logger.info("Prediction cache cleared")
+
+    def close(self) -> None:
+        """Close the on-disk tier."""
+        if self._disk is not None:
+            self._disk.close()
+
+    def stats(self) -> dict:
+        """Hit/miss counters and current number of entries."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "memory_hits": self.memory_hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else None,
+                "memory_entries": len(self._memory),
+                "disk_entries": len(self._disk) if self._disk is not None else None,
+            }
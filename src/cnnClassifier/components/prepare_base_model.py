@@ -5,10 +5,15 @@ from pathlib import Path
 import urllib.request as request 
 from zipfile import ZipFile 
 import tensorflow as tf 
+from cnnClassifier import logger
 from cnnClassifier.entitiy.config_entity import PrepareBaseModelConfig
+from cnnClassifier.components.backbones import build_backbone
+from cnnClassifier.components.model_benchmark import benchmark_model
+from cnnClassifier.components.precision import with_precision
+from cnnClassifier.utils.common import load_json, save_json
 
 class PrepareBaseModel:
-    """Download VGG16 base model from website of Keras application"""
+    """Download the base model (BACKBONE in params.yaml) from website of Keras application"""
     
     def __init__(self, config: PrepareBaseModelConfig):
         """
@@ -22,10 +27,14 @@ class PrepareBaseModel:
     
     def get_base_model(self):
         """
-        Download the pre-trained VGG16 model from Keras
+        Download the pre-trained backbone from Keras
+        (VGG16, ResNet50, MobileNetV2 or EfficientNetB0 - BACKBONE in params.yaml)
         This model has already been trained on ImageNet (1 million+ images)
         """
-        self.model = tf.keras.applications.vgg16.VGG16(
+        self.model = build_backbone(
+            # Which architecture to use, e.g. "MobileNetV2"
+            self.config.params_backbone,
+
             # Image dimensions: (height, width, channels) e.g., (224, 224, 3) for RGB
             input_shape=self.config.params_image_size,
             
@@ -80,7 +89,9 @@ class PrepareBaseModel:
         # Example: [0.7, 0.2, 0.1] means 70% sure it's class 1
         prediction = tf.keras.layers.Dense(
             units=classes,  # Number of output neurons = number of categories
-            activation="softmax"  # Converts raw scores to probabilities
+            activation="softmax",  # Converts raw scores to probabilities
+            # Softmax stays in float32 even under a mixed-precision PRECISION
+            dtype="float32"
         )(flatten_in)
 
         # STEP 3: Combine base model + new layers into complete model
@@ -121,9 +132,35 @@ class PrepareBaseModel:
             freeze_till=None,
             learning_rate=self.config.params_learning_rate
         )
+        # PRECISION in params.yaml: float32 or mixed_bfloat16 compute
+        self.full_model = with_precision(self.full_model, self.config.params_precision)
 
         self.save_model(path=self.config.updated_base_model_path,model=self.full_model)
 
+    def benchmark(self) -> dict:
+        """
+        Record params, FLOPs and CPU latency of the full model for this backbone
+
+        Results are kept per backbone in benchmark_path, so running the stage
+        with different BACKBONE values builds up a comparison table
+        """
+        results = self.config.benchmark_path
+        table = dict(load_json(results)) if results.exists() else {}
+
+        table[self.config.params_backbone] = {
+            "precision": self.config.params_precision,
+            **benchmark_model(self.full_model)
+        }
+        save_json(path=results, data=table)
+
+        entry = table[self.config.params_backbone]
+        logger.info(
+            f"{self.config.params_backbone}: {entry['params'] / 1e6:.1f}M params, "
+            f"{entry['flops_per_image'] / 1e9:.2f} GFLOPs, "
+            f"{entry['latency_ms_p50']:.1f} ms per image (p50)"
+        )
+        return table
+
 
     @staticmethod
     def save_model(path: Path, model: tf.keras.models):
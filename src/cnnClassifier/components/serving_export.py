@@ -0,0 +1,155 @@
+"""
+cnnClassifier.components.serving_export
+
+This module contains the ServingExport component responsible for:
+- Exporting the trained model as a SavedModel whose serving signature takes
+  encoded image bytes and does decode, bilinear resize and backbone
+  preprocessing inside the graph
+- A second signature taking raw [0, 255] pixels (preprocessing still in the graph)
+- Checking the exported graph against the Keras model on the validation
+  split, fed exactly like training (ImageFolderDataset)
+"""
+
+import os
+from pathlib import Path
+
+import numpy as np
+import tensorflow as tf
+
+from cnnClassifier import logger
+from cnnClassifier.entitiy.config_entity import ServingExportConfig
+from cnnClassifier.components.image_ops import decode_and_resize, preprocess_batch
+from cnnClassifier.components.precision import with_precision
+from cnnClassifier.components.augmentation import strip_augmentation
+from cnnClassifier.components.serving_model import ServingModel
+from cnnClassifier.components.image_dataset import ImageFolderDataset
+from cnnClassifier.utils.common import save_json
+
+
+def directory_size(path: Path) -> int:
+    """Total size in bytes of the files under path."""
+    return sum(file.stat().st_size for file in Path(path).rglob("*") if file.is_file())
+
+
+class ServingExport:
+    """
+    Exports artifacts/training/model.keras with its input pipeline fused in.
+
+    Endpoints of the SavedModel:
+        serve(images: string[N])            encoded JPEG/PNG bytes → probabilities (N, classes)
+        serve_pixels(pixels: float32[N, H, W, 3])  raw RGB pixels → probabilities
+    """
+
+    def __init__(self, config: ServingExportConfig):
+        self.config = config
+
+    def _valid_generator(self):
+        """
+        Validation images exactly as Training sees them
+        (backbone preprocessing, same 20% validation split, bilinear resize, no shuffling)
+        """
+        self.valid_generator = ImageFolderDataset(
+            directory=self.config.training_data,
+            image_size=self.config.params_image_size[:-1],
+            batch_size=self.config.params_batch_size,
+            backbone=self.config.params_backbone,
+            subset="validation",
+            validation_split=0.20,
+            shuffle=False
+        )
+
+    def load_keras_model(self) -> tf.keras.Model:
+        """
+        Load the trained Keras model for inference at the configured PRECISION,
+        without any augmentation layers (nothing random in the serving graph).
+        """
+        return with_precision(
+            strip_augmentation(tf.keras.models.load_model(self.config.keras_model_path, compile=False)),
+            self.config.params_precision
+        )
+
+    def build_endpoints(self, model: tf.keras.Model) -> tuple:
+        """tf.functions of the two serving endpoints around model."""
+        height, width = self.config.params_image_size[:2]
+        backbone = self.config.params_backbone
+
+        @tf.function(input_signature=[tf.TensorSpec([None, height, width, 3], tf.float32, name="pixels")])
+        def serve_pixels(pixels):
+            return model(preprocess_batch(pixels, backbone), training=False)
+
+        @tf.function(input_signature=[tf.TensorSpec([None], tf.string, name="images")])
+        def serve(images):
+            pixels = tf.map_fn(
+                lambda data: decode_and_resize(data, (height, width)),
+                images,
+                fn_output_signature=tf.TensorSpec([height, width, 3], tf.float32)
+            )
+            return serve_pixels(pixels)
+
+        return serve, serve_pixels
+
+    def export(self) -> Path:
+        """
+        Write the SavedModel.
+
+        Returns:
+            Path: The SavedModel directory.
+        """
+        model = self.load_keras_model()
+        serve, serve_pixels = self.build_endpoints(model)
+
+        archive = tf.keras.export.ExportArchive()
+        archive.track(model)
+        archive.add_endpoint(name="serve", fn=serve)
+        archive.add_endpoint(name="serve_pixels", fn=serve_pixels)
+        archive.write_out(str(self.config.export_dir))
+
+        logger.info(
+            f"Serving model saved at: {self.config.export_dir} "
+            f"({directory_size(self.config.export_dir) / 2**20:.1f} MB)"
+        )
+        return self.config.export_dir
+
+    def parity_check(self) -> dict:
+        """
+        Compare the exported graph (fed the raw validation files) with the
+        Keras model (fed ImageFolderDataset batches, as in training).
+
+        Returns:
+            dict: max/mean absolute probability difference, label agreement and sizes.
+        """
+        keras_model = self.load_keras_model()
+        serving_model = ServingModel(self.config.export_dir)
+        self._valid_generator()
+        generator = self.valid_generator
+
+        differences, agreements = [], []
+        for step in range(len(generator)):
+            images, _ = generator[step]
+            # shuffle=False, so batch `step` holds these files in order
+            start = step * generator.batch_size
+            files = generator.filepaths[start:start + len(images)]
+            encoded = [Path(file).read_bytes() for file in files]
+
+            keras_probabilities = np.asarray(keras_model.predict_on_batch(images))
+            serving_probabilities = serving_model.predict_on_batch(encoded)
+            differences.append(np.abs(keras_probabilities - serving_probabilities))
+            agreements.append(keras_probabilities.argmax(axis=1) == serving_probabilities.argmax(axis=1))
+
+        differences = np.concatenate(differences)
+        agreements = np.concatenate(agreements)
+        report = {
+            "images": int(len(agreements)),
+            "precision": self.config.params_precision,
+            "max_abs_diff": float(differences.max()),
+            "mean_abs_diff": float(differences.mean()),
+            "label_agreement": float(agreements.mean()),
+            "keras_size_bytes": os.path.getsize(self.config.keras_model_path),
+            "serving_size_bytes": directory_size(self.config.export_dir),
+        }
+        save_json(path=self.config.parity_report_path, data=report)
+        logger.info(
+            f"Serving graph parity on {report['images']} validation images: "
+            f"max |diff| = {report['max_abs_diff']:.2e}, label agreement = {report['label_agreement']:.2%}"
+        )
+        return report
@@ -0,0 +1,163 @@
+"""
+cnnClassifier.components.serving_metrics
+
+This module contains the ServingMetrics component responsible for:
+- Per-stage latency histograms (upload read, decode/resize, model forward, total)
+- Counters of predictions by class and of errors by type
+- Gauges for model load/warm-up time, process RSS and serving queues
+- Rendering everything in the Prometheus text format for /metrics
+"""
+
+import os
+import time
+import functools
+
+from prometheus_client import (CollectorRegistry, Counter, Gauge, Histogram,
+                               generate_latest, CONTENT_TYPE_LATEST)
+
+# Latency buckets from 1 ms to 10 s
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+BATCH_SIZE_BUCKETS = (1, 2, 4, 8, 16, 32, 64)
+
+
+class ServingMetrics:
+    """
+    Prometheus metrics of the prediction API.
+
+    Hot-path instrumentation is a perf_counter() pair and one observe() on a
+    pre-bound histogram child. Gauges that need system calls (RSS, queue
+    sizes) are refreshed outside the request path by refresh().
+
+    When PROMETHEUS_MULTIPROC_DIR is set (gunicorn with several workers),
+    /metrics aggregates the values of all workers.
+    """
+
+    def __init__(self):
+        self.registry = CollectorRegistry(auto_describe=True)
+        self.multiprocess_dir = os.environ.get("PROMETHEUS_MULTIPROC_DIR")
+
+        self.stage_latency = Histogram(
+            "kidney_stage_latency_seconds", "Latency of each /predict stage",
+            ["stage"], buckets=LATENCY_BUCKETS, registry=self.registry
+        )
+        # Bound once so the hot path skips the label lookup
+        self.upload_read = self.stage_latency.labels(stage="upload_read")
+        self.decode = self.stage_latency.labels(stage="decode")
+        self.forward = self.stage_latency.labels(stage="forward")
+        self.total = self.stage_latency.labels(stage="total")
+
+        self.predictions = Counter(
+            "kidney_predictions", "Predictions served, by predicted class",
+            ["predicted_class"], registry=self.registry
+        )
+        self.errors = Counter(
+            "kidney_errors", "Failed prediction requests, by error type",
+            ["error_type"], registry=self.registry
+        )
+        self.cache_lookups = Counter(
+            "kidney_cache_lookups", "Prediction cache lookups, by result",
+            ["result"], registry=self.registry
+        )
+
+        self.batch_size = Histogram(
+            "kidney_batch_size", "Images per model forward pass",
+            buckets=BATCH_SIZE_BUCKETS, registry=self.registry
+        )
+        self.queue_delay = Histogram(
+            "kidney_batch_queue_delay_seconds", "Time a request waited for its micro-batch",
+            buckets=LATENCY_BUCKETS, registry=self.registry
+        )
+
+        self.model_load_seconds = Gauge(
+            "kidney_model_load_seconds", "Time taken to load the model",
+            registry=self.registry, multiprocess_mode="max"
+        )
+        self.model_warmup_seconds = Gauge(
+            "kidney_model_warmup_seconds", "Time taken by the startup warm-up passes",
+            registry=self.registry, multiprocess_mode="max"
+        )
+        self.process_rss = Gauge(
+            "kidney_process_rss_bytes", "Resident memory of the serving process",
+            registry=self.registry, multiprocess_mode="liveall"
+        )
+        self.queue_depth = Gauge(
+            "kidney_batch_queue_depth", "Requests waiting for a micro-batch",
+            registry=self.registry, multiprocess_mode="livesum"
+        )
+        self.inference_in_flight = Gauge(
+            "kidney_inference_in_flight", "Inference jobs running or queued",
+            registry=self.registry, multiprocess_mode="livesum"
+        )
+        self.event_loop_lag = Gauge(
+            "kidney_event_loop_lag_seconds", "Recent event-loop lag",
+            ["quantile"], registry=self.registry, multiprocess_mode="liveall"
+        )
+
+        self._process = None
+
+    def timed(self, stage, fn):
+        """
+        Wrap fn so each call is observed in the given stage histogram.
+
+        Args:
+            stage: One of self.upload_read / decode / forward / total.
+            fn: Function to time.
+        """
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                stage.observe(time.perf_counter() - start)
+        return wrapper
+
+    def observe_batch(self, size: int, queue_delays) -> None:
+        """Record one micro-batch: its size and each request's queueing delay."""
+        self.batch_size.observe(size)
+        for delay in queue_delays:
+            self.queue_delay.observe(delay)
+
+    def count_predictions(self, prediction: list) -> None:
+        """Count [{"image": "Tumor"}, ...] results by class."""
+        for result in prediction:
+            self.predictions.labels(predicted_class=result["image"]).inc()
+
+    def refresh(self, model_holder=None, batcher=None, inference=None, loop_monitor=None) -> None:
+        """
+        Update gauges that are read from other components (off the request path).
+        """
+        if self._process is None:
+            import psutil
+            self._process = psutil.Process()
+        self.process_rss.set(self._process.memory_info().rss)
+
+        if model_holder is not None:
+            if model_holder.load_time is not None:
+                self.model_load_seconds.set(model_holder.load_time)
+            if model_holder.warmup_time is not None:
+                self.model_warmup_seconds.set(model_holder.warmup_time)
+        if batcher is not None:
+            self.queue_depth.set(batcher.stats()["queue_depth"])
+        if inference is not None:
+            self.inference_in_flight.set(inference.stats()["in_flight"])
+        if loop_monitor is not None:
+            lag = loop_monitor.stats()
+            for quantile in ("p50", "p99"):
+                if lag[quantile] is not None:
+                    self.event_loop_lag.labels(quantile=quantile).set(lag[quantile] / 1000.0)
+
+    def exposition(self) -> tuple:
+        """
+        Render the metrics for a Prometheus scrape.
+
+        Returns:
+            tuple: (payload bytes, content type)
+        """
+        registry = self.registry
+        if self.multiprocess_dir:
+            # Aggregate the files written by every gunicorn worker
+            from prometheus_client import multiprocess
+            registry = CollectorRegistry()
+            multiprocess.MultiProcessCollector(registry)
+        return generate_latest(registry), CONTENT_TYPE_LATEST
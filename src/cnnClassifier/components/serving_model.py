@@ -0,0 +1,53 @@
+"""
+cnnClassifier.components.serving_model
+
+This module contains the ServingModel component responsible for:
+- Loading the SavedModel written by the serving_export stage
+- Running encoded image bytes or raw pixels through its fused input pipeline
+- Exposing the same predict_on_batch() call as a Keras model
+"""
+
+from pathlib import Path
+
+import numpy as np
+import tensorflow as tf
+
+
+class ServingModel:
+    """
+    Keras-like wrapper around the exported serving SavedModel.
+
+    Decoding, resizing and backbone preprocessing happen inside the graph,
+    so callers pass either encoded images (bytes) or raw [0, 255] pixels and
+    never preprocess anything themselves.
+    """
+
+    def __init__(self, export_dir: Path):
+        """
+        Args:
+            export_dir: SavedModel directory (artifacts/serving_export/serving_model).
+        """
+        self.export_dir = Path(export_dir)
+        self._saved_model = tf.saved_model.load(str(self.export_dir))
+
+    def predict_on_batch(self, batch) -> np.ndarray:
+        """
+        Run one forward pass.
+
+        Args:
+            batch: List of encoded JPEG/PNG images (bytes), or raw RGB
+                   pixels of shape (N, height, width, 3) in [0, 255].
+
+        Returns:
+            np.ndarray: Class probabilities of shape (N, classes).
+        """
+        if isinstance(batch, (list, tuple)):
+            return self._saved_model.serve(tf.constant([bytes(data) for data in batch])).numpy()
+        return self._saved_model.serve_pixels(tf.constant(batch, dtype=tf.float32)).numpy()
+
+    def predict(self, images, batch_size: int = 32) -> np.ndarray:
+        """Run predict_on_batch() over images in chunks of batch_size."""
+        return np.concatenate([
+            self.predict_on_batch(images[start:start + batch_size])
+            for start in range(0, len(images), batch_size)
+        ])
@@ -0,0 +1,147 @@
+"""
+cnnClassifier.components.tflite_model
+
+This module contains the TFLiteModel component responsible for:
+- Running an exported .tflite model with the TFLite interpreter
+- One interpreter per batch-size bucket, batches padded up to the next
+  bucket (like CompiledModel), so tensors are never re-allocated per call
+- Quantizing inputs / dequantizing outputs of full-integer (int8) models
+- Exposing the same predict_on_batch() call as a Keras model
+"""
+
+import threading
+from pathlib import Path
+
+import numpy as np
+
+# Same buckets as CompiledModel (serving.batch_buckets in config.yaml);
+# not imported from there because that module loads TensorFlow
+DEFAULT_BUCKETS = (1, 4, 8, 16, 32)
+
+
+def _interpreter_class():
+    """LiteRT's interpreter when installed, else the (deprecated) one bundled with TensorFlow."""
+    try:
+        from ai_edge_litert.interpreter import Interpreter
+    except ImportError:
+        import tensorflow as tf
+        Interpreter = tf.lite.Interpreter
+    return Interpreter
+
+
+class TFLiteModel:
+    """
+    Keras-like wrapper around tf.lite.Interpreter.
+
+    resize_tensor_input + allocate_tensors on every change of batch size is
+    slow with the micro-batcher, whose batches vary from call to call. So
+    every bucket gets its own interpreter, sized once on first use, and a
+    batch is zero-padded up to the next bucket. The interpreters map the
+    same .tflite file, so only the activation buffers are per bucket.
+    An interpreter is not thread-safe: each one has its own lock.
+
+    Callers always pass float32 images and get float32 probabilities back,
+    whether the model has float or integer inputs and outputs.
+    """
+
+    def __init__(self, model_path: Path, num_threads: int = None, buckets=DEFAULT_BUCKETS):
+        """
+        Args:
+            model_path: Path of the .tflite file.
+            num_threads: CPU threads used by each interpreter (None = TFLite default).
+            buckets: Batch sizes to allocate for; other sizes are padded up to the next one.
+        """
+        self.model_path = Path(model_path)
+        self.num_threads = num_threads
+        self.buckets = tuple(sorted(set(int(size) for size in buckets)))
+        # Tensor details are the same for every interpreter of the file
+        interpreter = self._new_interpreter()
+        self._input = interpreter.get_input_details()[0]
+        self._output = interpreter.get_output_details()[0]
+        # bucket -> (interpreter, lock)
+        self._interpreters = {}
+        self._lock = threading.Lock()
+
+    def _new_interpreter(self):
+        return _interpreter_class()(model_path=str(self.model_path), num_threads=self.num_threads)
+
+    def bucket(self, batch_size: int) -> int:
+        """Smallest bucket that holds batch_size images (the largest bucket if none does)."""
+        for size in self.buckets:
+            if size >= batch_size:
+                return size
+        return self.buckets[-1]
+
+    def _interpreter(self, bucket: int) -> tuple:
+        """(interpreter, lock) of a bucket, allocated on first use."""
+        entry = self._interpreters.get(bucket)
+        if entry is None:
+            with self._lock:
+                entry = self._interpreters.get(bucket)
+                if entry is None:
+                    interpreter = self._new_interpreter()
+                    shape = [bucket] + list(self._input["shape"][1:])
+                    interpreter.resize_tensor_input(self._input["index"], shape)
+                    interpreter.allocate_tensors()
+                    entry = self._interpreters[bucket] = (interpreter, threading.Lock())
+        return entry
+
+    @staticmethod
+    def _quantize(values: np.ndarray, details: dict) -> np.ndarray:
+        scale, zero_point = details["quantization"]
+        info = np.iinfo(details["dtype"])
+        values = np.round(values / scale + zero_point)
+        return np.clip(values, info.min, info.max).astype(details["dtype"])
+
+    @staticmethod
+    def _dequantize(values: np.ndarray, details: dict) -> np.ndarray:
+        scale, zero_point = details["quantization"]
+        return (values.astype("float32") - zero_point) * scale
+
+    @property
+    def is_quantized(self) -> bool:
+        """True for models with integer inputs (full-integer quantization)."""
+        return np.issubdtype(self._input["dtype"], np.integer)
+
+    def predict_on_batch(self, batch: np.ndarray) -> np.ndarray:
+        """
+        Run one forward pass.
+
+        Args:
+            batch: Preprocessed images of shape (N, height, width, 3).
+
+        Returns:
+            np.ndarray: Model outputs of shape (N, classes).
+        """
+        if len(batch) > self.buckets[-1]:
+            return self.predict(batch, batch_size=self.buckets[-1])
+
+        if self.is_quantized:
+            batch = self._quantize(np.asarray(batch, dtype="float32"), self._input)
+        else:
+            batch = np.asarray(batch, dtype=self._input["dtype"])
+
+        bucket = self.bucket(len(batch))
+        if bucket != len(batch):
+            padded = np.zeros((bucket,) + batch.shape[1:], dtype=batch.dtype)
+            padded[:len(batch)] = batch
+        else:
+            padded = batch
+
+        interpreter, lock = self._interpreter(bucket)
+        with lock:
+            interpreter.set_tensor(self._input["index"], padded)
+            interpreter.invoke()
+            # get_tensor() returns a copy, safe to use after the lock is released
+            output = interpreter.get_tensor(self._output["index"])[:len(batch)]
+
+        if np.issubdtype(output.dtype, np.integer):
+            output = self._dequantize(output, self._output)
+        return output
+
+    def predict(self, images: np.ndarray, batch_size: int = 32) -> np.ndarray:
+        """Run predict_on_batch() over images in chunks of batch_size."""
+        return np.concatenate([
+            self.predict_on_batch(images[start:start + batch_size])
+            for start in range(0, len(images), batch_size)
+        ])
@@ -0,0 +1,208 @@
+"""
+cnnClassifier.components.upload_spool
+
+This module contains the UploadSpool component responsible for:
+- Keeping a sampled fraction of uploads on disk for auditing
+- Writing them on a background thread, off the request path
+- Capping the spool directory by total bytes and file count, across every
+  process (gunicorn worker) sharing it
+- Evicting the oldest files first, and files older than a maximum age
+"""
+
+import os
+import time
+import uuid
+import queue
+import random
+import threading
+from collections import deque
+from pathlib import Path
+
+from cnnClassifier import logger
+
+# Queue item asking the writer thread to enforce the caps (see track())
+_ENFORCE = object()
+
+
+class UploadSpool:
+    """
+    Bounded, asynchronously written directory of uploaded scans.
+
+    offer() never blocks: when the write queue is full the upload is
+    dropped (and counted) rather than slowing the request down.
+
+    Every gunicorn worker has its own UploadSpool on the same directory, so
+    the caps are enforced against a fresh scan of the directory, not a
+    per-process index: max_bytes / max_files hold for the folder as a
+    whole. Two workers may pick the same oldest file; deleting a file that
+    is already gone is not an error.
+    """
+
+    def __init__(self, directory: Path, max_bytes: int, max_files: int,
+                 max_age_seconds: float = None, sample_rate: float = 1.0, queue_size: int = 256):
+        """
+        Args:
+            directory: Where uploads are kept.
+            max_bytes: Cap on the total size of the spool directory (all workers).
+            max_files: Cap on the number of files in the spool directory (all workers).
+            max_age_seconds: Files older than this are deleted (None = keep until evicted).
+            sample_rate: Fraction of offered uploads that are kept (0.0 - 1.0).
+            queue_size: Uploads allowed to wait for the writer thread.
+        """
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.max_files = max_files
+        self.max_age = max_age_seconds
+        self.sample_rate = sample_rate
+
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._thread = None
+        self._lock = threading.Lock()
+        # Directory usage seen by the last scan
+        self._files = 0
+        self._total_bytes = 0
+
+        self.written = 0
+        self.dropped = 0
+        self.evicted = 0
+
+    def start(self) -> None:
+        """Enforce the caps on the files already in the directory, start the writer."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._enforce()
+
+        self._thread = threading.Thread(target=self._run, name="upload-spool", daemon=True)
+        self._thread.start()
+        logger.info(
+            f"Upload spool at {self.directory}: {self._files} files, "
+            f"{self._total_bytes} bytes (sample rate {self.sample_rate})"
+        )
+
+    @staticmethod
+    def _is_spooled(path: Path) -> bool:
+        """Only '<uuid>_<name>' files are managed, anything else in the folder is left alone."""
+        prefix, _, name = path.name.partition("_")
+        try:
+            uuid.UUID(prefix)
+        except ValueError:
+            return False
+        return bool(name)
+
+    def stop(self) -> None:
+        """Write what is still queued, then stop the writer thread."""
+        if self._thread is None:
+            return
+        self._queue.put(None)
+        self._thread.join()
+        self._thread = None
+
+    def offer(self, filename: str, contents: bytes) -> bool:
+        """
+        Maybe keep an upload (according to sample_rate), without waiting for the disk.
+
+        Returns:
+            bool: True if the upload was queued for writing.
+        """
+        if self.sample_rate <= 0 or random.random() >= self.sample_rate:
+            return False
+        try:
+            self._queue.put_nowait((filename, contents))
+            return True
+        except queue.Full:
+            with self._lock:
+                self.dropped += 1
+            return False
+
+    def track(self, path: Path) -> None:
+        """
+        A file was written into the directory by someone else: enforce the caps soon.
+
+        The scan runs on the writer thread, not on the caller's request.
+        """
+        if self._thread is None:
+            self._enforce()
+            return
+        try:
+            self._queue.put_nowait(_ENFORCE)
+        except queue.Full:
+            # The writer enforces after every queued upload anyway
+            pass
+
+    def _run(self) -> None:
+        while True:
+            try:
+                # Wake up now and then so age-based eviction runs on an idle server
+                item = self._queue.get(timeout=60)
+            except queue.Empty:
+                self._enforce()
+                continue
+            if item is None:
+                break
+            if item is _ENFORCE:
+                self._enforce()
+                continue
+
+            filename, contents = item
+            path = self.directory / f"{uuid.uuid4()}_{Path(filename).name}"
+            try:
+                path.write_bytes(contents)
+            except OSError as e:
+                logger.warning(f"Could not write upload to spool: {e}")
+                continue
+
+            with self._lock:
+                self.written += 1
+            self._enforce()
+
+    def _scan(self) -> list:
+        """(modified_at, path, size) of every spooled file in the directory, oldest first."""
+        files = []
+        with os.scandir(self.directory) as entries:
+            for entry in entries:
+                if not (entry.is_file() and self._is_spooled(Path(entry.name))):
+                    continue
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    # Evicted by another worker since it was listed
+                    continue
+                files.append((stat.st_mtime, Path(entry.path), stat.st_size))
+        return sorted(files, key=lambda file: file[0])
+
+    def _enforce(self) -> None:
+        """Delete the oldest files of the directory until every cap holds."""
+        now = time.time()
+        files = deque(self._scan())
+        total_bytes = sum(size for _, _, size in files)
+        evicted = 0
+        while files:
+            modified_at, path, size = files[0]
+            too_old = self.max_age is not None and now - modified_at > self.max_age
+            if not (too_old or total_bytes > self.max_bytes or len(files) > self.max_files):
+                break
+            files.popleft()
+            total_bytes -= size
+            try:
+                # Another worker may have deleted it first: it is gone either way
+                os.remove(path)
+                evicted += 1
+            except FileNotFoundError:
+                pass
+        with self._lock:
+            self._files = len(files)
+            self._total_bytes = total_bytes
+            self.evicted += evicted
+
+    def stats(self) -> dict:
+        """Files and bytes currently kept, plus written/dropped/evicted counters."""
+        with self._lock:
+            return {
+                "files": self._files,
+                "bytes": self._total_bytes,
+                "max_files": self.max_files,
+                "max_bytes": self.max_bytes,
+                "queued": self._queue.qsize(),
+                "written": self.written,
+                "dropped": self.dropped,
+                "evicted": self.evicted,
+            }
@@ -10,9 +10,17 @@ This module contains the ConfigurationManager class, which is responsible for:
 from cnnClassifier.constants import CONFIG_PATH_YAML, PARAMS_FILE_PATH
 from cnnClassifier.utils.common import read_yaml, create_directories
 from cnnClassifier.entitiy.config_entity import (DataIngestionConfig,
+                                                DatasetPackingConfig,
                                                 PrepareBaseModelConfig,
                                                 TrainingConfig,
-                                                EvaluationConfig)
+                                                FeatureExtractionConfig,
+                                                EvaluationConfig,
+                                                ModelDistillationConfig,
+                                                ModelCompressionConfig,
+                                                ModelExportConfig,
+                                                ModelQuantizationConfig,
+                                                ServingExportConfig,
+                                                ServingConfig)
 from pathlib import Path 
 import os 
 
@@ -57,10 +65,32 @@ class ConfigurationManager:
             root_dir=config.root_dir,
             source_url=config.source_URL,
             local_data_file=config.local_data_file,
-            unzip_dir=config.unzip_dir
+            unzip_dir=config.unzip_dir,
+            manifest_path=Path(config.manifest_path),
+            extract_workers=config.extract_workers,
+            reuse_local_archive=config.reuse_local_archive
         )
 
         return data_ingestion_config
+
+    def get_dataset_packing_config(self)-> DatasetPackingConfig:
+
+        packing = self.config.dataset_packing
+        create_directories([packing.root_dir, packing.shard_dir])
+
+        dataset_packing_config = DatasetPackingConfig(
+            root_dir=Path(packing.root_dir),
+            source_dir=Path(os.path.join(self.config.data_ingestion.unzip_dir,"kidney-ct-scan-image")),
+            shard_dir=Path(packing.shard_dir),
+            index_path=Path(packing.index_path),
+            format=packing.format,
+            store_path=Path(packing.store_path),
+            shard_size=packing.shard_size,
+            params_image_size=self.params.IMAGE_SIZE
+        )
+
+        return dataset_packing_config
+
     def get_prepare_base_model_config(self)->PrepareBaseModelConfig:
         config = self.config.prepare_base_model 
         create_directories([config.root_dir])
@@ -69,11 +99,14 @@ class ConfigurationManager:
             root_dir=Path(config.root_dir),
             base_model_path=Path(config.base_model_path),
             updated_base_model_path=Path(config.updated_base_model_path),
+            benchmark_path=Path(config.benchmark_path),
             params_image_size=self.params.IMAGE_SIZE,
             params_learning_rate=self.params.LEARNING_RATE,
             params_include_top=self.params.INCLUDE_TOP,
             params_weight=self.params.WEIGHTS,
-            params_classes=self.params.CLASSES
+            params_classes=self.params.CLASSES,
+            params_backbone=self.params.BACKBONE,
+            params_precision=self.params.PRECISION
         )
 
         return prepare_base_model_config
@@ -98,10 +131,31 @@ class ConfigurationManager:
             params_batch_size=params.BATCH_SIZE,
             params_is_augmentation=params.AUGMENTATION,
             params_image_size=params.IMAGE_SIZE,
+            params_backbone=params.BACKBONE,
+            params_precision=params.PRECISION,
+            params_feature_cache=params.FEATURE_CACHE,
+            packed_index_path=Path(self.config.dataset_packing.index_path),
         )
 
         return training_config 
 
+    def get_feature_extraction_config(self)-> FeatureExtractionConfig:
+
+        features = self.config.feature_extraction
+        create_directories([features.root_dir])
+
+        feature_extraction_config = FeatureExtractionConfig(
+            root_dir=Path(features.root_dir),
+            base_model_path=Path(features.base_model_path),
+            manifest_path=Path(features.manifest_path),
+            training_data=Path(os.path.join(self.config.data_ingestion.unzip_dir,"kidney-ct-scan-image")),
+            params_image_size=self.params.IMAGE_SIZE,
+            params_backbone=self.params.BACKBONE,
+            params_precision=self.params.PRECISION
+        )
+
+        return feature_extraction_config
+
     def get_evaluation_config(self)-> EvaluationConfig:
 
         eval_config = EvaluationConfig(
@@ -110,7 +164,151 @@ class ConfigurationManager:
             mlflow_uri="https://dagshub.com/asadullahcreative/Kidney-Disease-Classification-Project.mlflow",
             all_params=self.params,
             params_image_size=self.params.IMAGE_SIZE,
-            params_batch_size=self.params.BATCH_SIZE
+            params_batch_size=self.params.BATCH_SIZE,
+            params_backbone=self.params.BACKBONE,
+            params_precision=self.params.PRECISION,
+            packed_index_path=Path(self.config.dataset_packing.index_path)
+        )
+
+        return eval_config
+
+    def get_model_distillation_config(self)-> ModelDistillationConfig:
+
+        distillation = self.config.model_distillation
+        create_directories([distillation.root_dir])
+
+        model_distillation_config = ModelDistillationConfig(
+            root_dir=Path(distillation.root_dir),
+            teacher_model_path=Path(distillation.teacher_model_path),
+            student_model_path=Path(distillation.student_model_path),
+            report_path=Path(distillation.report_path),
+            params_image_size=self.params.IMAGE_SIZE,
+            params_classes=self.params.CLASSES,
+            params_temperature=self.params.DISTILLATION_TEMPERATURE,
+            params_alpha=self.params.DISTILLATION_ALPHA,
+            params_epochs=self.params.DISTILLATION_EPOCHS,
+            params_learning_rate=self.params.DISTILLATION_LEARNING_RATE
+        )
+
+        return model_distillation_config
+
+    def get_model_compression_config(self)-> ModelCompressionConfig:
+
+        compression = self.config.model_compression
+        create_directories([compression.root_dir])
+
+        model_compression_config = ModelCompressionConfig(
+            root_dir=Path(compression.root_dir),
+            model_path=Path(compression.model_path),
+            compressed_model_path=Path(compression.compressed_model_path),
+            report_path=Path(compression.report_path),
+            params_enabled=self.params.COMPRESSION,
+            params_method=self.params.COMPRESSION_METHOD,
+            params_sparsity=self.params.COMPRESSION_SPARSITY,
+            params_clusters=self.params.COMPRESSION_CLUSTERS,
+            params_scope=self.params.COMPRESSION_SCOPE,
+            params_epochs=self.params.COMPRESSION_EPOCHS,
+            params_learning_rate=self.params.COMPRESSION_LEARNING_RATE
+        )
+
+        return model_compression_config
+
+    def get_model_export_config(self)-> ModelExportConfig:
+
+        export = self.config.model_export
+        create_directories([export.root_dir])
+
+        model_export_config = ModelExportConfig(
+            root_dir=Path(export.root_dir),
+            keras_model_path=Path(export.keras_model_path),
+            tflite_model_path=Path(export.tflite_model_path),
+            parity_report_path=Path(export.parity_report_path),
+            training_data=Path(os.path.join(self.config.data_ingestion.unzip_dir,"kidney-ct-scan-image")),
+            num_threads=export.num_threads,
+            params_image_size=self.params.IMAGE_SIZE,
+            params_batch_size=self.params.BATCH_SIZE,
+            params_backbone=self.params.BACKBONE
+        )
+
+        return model_export_config
+
+    def get_model_quantization_config(self)-> ModelQuantizationConfig:
+
+        quantization = self.config.model_quantization
+        create_directories([quantization.root_dir])
+
+        model_quantization_config = ModelQuantizationConfig(
+            root_dir=Path(quantization.root_dir),
+            keras_model_path=Path(self.config.training.trained_model_path),
+            float_model_path=Path(quantization.float_model_path),
+            int8_model_path=Path(quantization.int8_model_path),
+            report_path=Path(quantization.report_path),
+            num_threads=quantization.num_threads,
+            params_calibration_samples=self.params.CALIBRATION_SAMPLES
+        )
+
+        return model_quantization_config
+
+    def get_serving_export_config(self)-> ServingExportConfig:
+
+        export = self.config.serving_export
+        create_directories([export.root_dir])
+
+        serving_export_config = ServingExportConfig(
+            root_dir=Path(export.root_dir),
+            keras_model_path=Path(export.keras_model_path),
+            export_dir=Path(export.export_dir),
+            parity_report_path=Path(export.parity_report_path),
+            training_data=Path(os.path.join(self.config.data_ingestion.unzip_dir,"kidney-ct-scan-image")),
+            params_image_size=self.params.IMAGE_SIZE,
+            params_batch_size=self.params.BATCH_SIZE,
+            params_backbone=self.params.BACKBONE,
+            params_precision=self.params.PRECISION
+        )
+
+        return serving_export_config
+
+    def get_serving_config(self)-> ServingConfig:
+
+        serving = self.config.serving
+
+        serving_config = ServingConfig(
+            model_path=Path(serving.model_path),
+            backend=serving.backend,
+            tflite_model_path=Path(serving.tflite_model_path),
+            tflite_num_threads=serving.tflite_num_threads,
+            student_model_path=Path(serving.student_model_path),
+            savedmodel_path=Path(serving.savedmodel_path),
+            compiled_inference=serving.compiled_inference,
+            jit_compile=serving.jit_compile,
+            batch_buckets=list(serving.batch_buckets),
+            batching_enabled=serving.batching_enabled,
+            max_batch_size=serving.max_batch_size,
+            max_wait_ms=serving.max_wait_ms,
+            upload_mode=serving.upload_mode,
+            upload_sample_rate=serving.upload_sample_rate,
+            spool_max_bytes=serving.spool_max_bytes,
+            spool_max_files=serving.spool_max_files,
+            spool_max_age_seconds=serving.spool_max_age_seconds,
+            spool_queue_size=serving.spool_queue_size,
+            batch_endpoint_size=serving.batch_endpoint_size,
+            batch_decode_workers=serving.batch_decode_workers,
+            batch_max_request_bytes=serving.batch_max_request_bytes,
+            inference_workers=serving.inference_workers,
+            inference_max_pending=serving.inference_max_pending,
+            retry_after_seconds=serving.retry_after_seconds,
+            loop_lag_interval_ms=serving.loop_lag_interval_ms,
+            model_watch_interval_seconds=serving.model_watch_interval_seconds,
+            cache_enabled=serving.cache_enabled,
+            cache_max_entries=serving.cache_max_entries,
+            cache_ttl_seconds=serving.cache_ttl_seconds,
+            cache_disk_dir=Path(serving.cache_disk_dir) if serving.cache_disk_dir else None,
+            cache_disk_size_limit=serving.cache_disk_size_limit,
+            metrics_refresh_seconds=serving.metrics_refresh_seconds,
+            params_image_size=self.params.IMAGE_SIZE,
+            params_classes=self.params.CLASSES,
+            params_backbone=self.params.BACKBONE,
+            params_precision=self.params.PRECISION
         )
 
-        return eval_config
\ No newline at end of file
+        return serving_config
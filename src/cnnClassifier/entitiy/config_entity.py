@@ -16,17 +16,34 @@ class DataIngestionConfig:
     source_url: str
     local_data_file: Path
     unzip_dir: Path
+    manifest_path: Path
+    extract_workers: int
+    reuse_local_archive: bool
+
+@dataclass(frozen=True)
+class DatasetPackingConfig:
+    root_dir : Path
+    source_dir : Path
+    shard_dir : Path
+    index_path : Path
+    format : str
+    store_path : Path
+    shard_size : int
+    params_image_size : list
 
 @dataclass(frozen=True)
 class PrepareBaseModelConfig:
     root_dir : Path
     base_model_path : Path 
     updated_base_model_path : Path 
+    benchmark_path : Path
     params_image_size : list 
     params_learning_rate : float 
     params_include_top : bool 
     params_weight : str 
     params_classes : int 
+    params_backbone : str
+    params_precision : str
 
 @dataclass(frozen=True)
 class TrainingConfig:
@@ -38,6 +55,20 @@ class TrainingConfig:
     params_batch_size : int 
     params_is_augmentation : bool 
     params_image_size : list 
+    params_backbone : str
+    params_precision : str
+    params_feature_cache : bool
+    packed_index_path : Path
+
+@dataclass(frozen=True)
+class FeatureExtractionConfig:
+    root_dir : Path
+    base_model_path : Path
+    manifest_path : Path
+    training_data : Path
+    params_image_size : list
+    params_backbone : str
+    params_precision : str
 
 @dataclass(frozen=True)
 class EvaluationConfig:
@@ -46,4 +77,107 @@ class EvaluationConfig:
     all_params : dict 
     mlflow_uri : str 
     params_image_size : list
-    params_batch_size : int 
\ No newline at end of file
+    params_batch_size : int
+    params_backbone : str
+    params_precision : str
+    packed_index_path : Path
+
+@dataclass(frozen=True)
+class ModelDistillationConfig:
+    root_dir : Path
+    teacher_model_path : Path
+    student_model_path : Path
+    report_path : Path
+    params_image_size : list
+    params_classes : int
+    params_temperature : float
+    params_alpha : float
+    params_epochs : int
+    params_learning_rate : float
+
+@dataclass(frozen=True)
+class ModelCompressionConfig:
+    root_dir : Path
+    model_path : Path
+    compressed_model_path : Path
+    report_path : Path
+    params_enabled : bool
+    params_method : str
+    params_sparsity : float
+    params_clusters : int
+    params_scope : str
+    params_epochs : int
+    params_learning_rate : float
+
+@dataclass(frozen=True)
+class ModelExportConfig:
+    root_dir : Path
+    keras_model_path : Path
+    tflite_model_path : Path
+    parity_report_path : Path
+    training_data : Path
+    num_threads : int
+    params_image_size : list
+    params_batch_size : int
+    params_backbone : str
+
+@dataclass(frozen=True)
+class ModelQuantizationConfig:
+    root_dir : Path
+    keras_model_path : Path
+    float_model_path : Path
+    int8_model_path : Path
+    report_path : Path
+    num_threads : int
+    params_calibration_samples : int
+
+@dataclass(frozen=True)
+class ServingExportConfig:
+    root_dir : Path
+    keras_model_path : Path
+    export_dir : Path
+    parity_report_path : Path
+    training_data : Path
+    params_image_size : list
+    params_batch_size : int
+    params_backbone : str
+    params_precision : str
+
+@dataclass(frozen=True)
+class ServingConfig:
+    model_path : Path
+    backend : str
+    tflite_model_path : Path
+    tflite_num_threads : int
+    student_model_path : Path
+    savedmodel_path : Path
+    compiled_inference : bool
+    jit_compile : bool
+    batch_buckets : list
+    batching_enabled : bool
+    max_batch_size : int
+    max_wait_ms : float
+    upload_mode : str
+    upload_sample_rate : float
+    spool_max_bytes : int
+    spool_max_files : int
+    spool_max_age_seconds : float
+    spool_queue_size : int
+    batch_endpoint_size : int
+    batch_decode_workers : int
+    batch_max_request_bytes : int
+    inference_workers : int
+    inference_max_pending : int
+    retry_after_seconds : int
+    loop_lag_interval_ms : float
+    model_watch_interval_seconds : float
+    cache_enabled : bool
+    cache_max_entries : int
+    cache_ttl_seconds : float
+    cache_disk_dir : Path
+    cache_disk_size_limit : int
+    metrics_refresh_seconds : float
+    params_image_size : list
+    params_classes : int
+    params_backbone : str
+    params_precision : str
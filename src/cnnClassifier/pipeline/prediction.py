@@ -1,10 +1,372 @@
 """
 src/cnnClassifier/pipeline/predictions.py
 """
+import io  # In-memory byte streams (to read uploaded bytes like a file)
+import time  # Timing how long the model takes to load
+import threading  # Locks so only one thread loads the model
+import queue  # Thread-safe pool of reusable image buffers
+from contextlib import contextmanager
+from dataclasses import replace
+from pathlib import Path
+
 import numpy as np  # Library for numerical operations (like arrays and math)
-from tensorflow.keras.models import load_model  # Import function to load trained models
-from tensorflow.keras.preprocessing import image  # Tools to process images for our model
-import os  # Library to work with file paths and directories
+from PIL import Image  # Pillow image objects (e.g. from Streamlit uploads)
+
+from cnnClassifier import logger
+from cnnClassifier.config.configuration import ConfigurationManager
+from cnnClassifier.entitiy.config_entity import ServingConfig
+from cnnClassifier.utils.common import get_file_hash
+
+# Index → label mapping used by the classifier head (0=Normal, 1=Tumor)
+CLASS_NAMES = ["Normal", "Tumor"]
+
+# Ways the model can be run (serving.backend in config.yaml)
+BACKENDS = ("keras", "tflite", "student", "savedmodel")
+
+
+class ModelHolder:
+    """
+    Process-wide owner of the trained model.
+
+    The model is loaded from disk once (at startup), its predict function
+    is built once, and every PredictionPipeline in the process reuses
+    the same in-memory instance.
+
+    The backend decides how the model runs: "keras" loads model_path with
+    Keras, "tflite" runs tflite_model_path with the TFLite interpreter and
+    "student" loads the distilled student_model_path with Keras and
+    "savedmodel" loads the serving_export SavedModel, which decodes,
+    resizes and preprocesses encoded images inside its own graph.
+
+    With compiled_inference, Keras models run through CompiledModel: one
+    tf.function per batch bucket (optionally XLA-compiled), inputs padded
+    up to the nearest bucket, instead of Keras' predict machinery.
+
+    Images are passed in as raw RGB pixels in [0, 255]; the backbone's
+    preprocessing (BACKBONE in params.yaml) is applied right before the
+    forward pass, exactly as during training and evaluation. Backends that
+    decode images themselves (decodes_images) also take the encoded bytes.
+    """
+
+    _instances = {}
+    _instance_lock = threading.Lock()
+
+    def __init__(self, config: ServingConfig):
+        if config.backend not in BACKENDS:
+            raise ValueError(f"Unknown serving backend {config.backend!r}, expected one of {BACKENDS}")
+        self.config = config
+        # Backbone preprocessing, looked up with the model (it needs TensorFlow)
+        self._preprocess = None
+        self._model = None
+        self._lock = threading.Lock()
+
+        # Filled in by load(); exposed through info()
+        self.load_time = None
+        self.loaded_at = None
+        self.version = None
+        self._signature = None
+        self.warmup_time = None
+        # Batch sizes warmed up at startup (and again after a reload)
+        self._warmup_sizes = ()
+
+    @classmethod
+    def instance(cls, config: ServingConfig = None, backend: str = None) -> "ModelHolder":
+        """
+        Return the process-wide holder of a backend, creating it on first use.
+
+        Args:
+            config: Serving configuration. Read from config.yaml/params.yaml when omitted.
+            backend: Overrides config.backend (e.g. "tflite").
+        """
+        with cls._instance_lock:
+            if config is None:
+                config = ConfigurationManager().get_serving_config()
+            if backend is not None and backend != config.backend:
+                config = replace(config, backend=backend)
+            if config.backend not in cls._instances:
+                cls._instances[config.backend] = cls(config)
+            return cls._instances[config.backend]
+
+    @property
+    def model(self):
+        """The loaded model (loads it on first access)."""
+        if self._model is None:
+            self.load()
+        return self._model
+
+    @property
+    def model_path(self) -> Path:
+        """File the current backend loads the model from."""
+        if self.config.backend == "tflite":
+            return Path(self.config.tflite_model_path)
+        if self.config.backend == "student":
+            return Path(self.config.student_model_path)
+        if self.config.backend == "savedmodel":
+            return Path(self.config.savedmodel_path)
+        return Path(self.config.model_path)
+
+    @property
+    def decodes_images(self) -> bool:
+        """True when the model takes encoded image bytes and does all pixel work in its graph."""
+        return self.config.backend == "savedmodel"
+
+    def _file_signature(self) -> tuple:
+        """(modification time, size) of the model file, used to notice a new model."""
+        if self.model_path.is_dir():
+            # SavedModel: newest modification time and total size of its files
+            stats = [file.stat() for file in self.model_path.rglob("*") if file.is_file()]
+            return max(stat.st_mtime_ns for stat in stats), sum(stat.st_size for stat in stats)
+        stat = self.model_path.stat()
+        return stat.st_mtime_ns, stat.st_size
+
+    def _read_model(self, model_path: Path):
+        """Load the model file with the configured backend."""
+        if self.config.backend == "tflite":
+            # Imported here so the Keras backend never pulls in the interpreter
+            from cnnClassifier.components.tflite_model import TFLiteModel
+            return TFLiteModel(
+                model_path, num_threads=self.config.tflite_num_threads, buckets=self.config.batch_buckets
+            )
+        if self.config.backend == "savedmodel":
+            # PRECISION and preprocessing were fixed when the graph was exported
+            from cnnClassifier.components.serving_model import ServingModel
+            return ServingModel(model_path)
+
+        # Imported here so importing this module (app.py, tooling) never loads TensorFlow
+        from tensorflow.keras.models import load_model
+        from cnnClassifier.components.compiled_model import CompiledModel
+        from cnnClassifier.components.precision import with_precision
+
+        # PRECISION in params.yaml (float32 or mixed_bfloat16), softmax kept in float32
+        model = with_precision(load_model(model_path, compile=False), self.config.params_precision)
+        if self.config.compiled_inference:
+            model = CompiledModel(model, buckets=self.config.batch_buckets, jit_compile=self.config.jit_compile)
+            # Trace (and XLA-compile) every bucket now instead of on the first requests
+            model.compile_buckets()
+            return model
+
+        # Build the predict graph now instead of on the first request
+        model.make_predict_function()
+        return model
+
+    def _load_from_disk(self) -> None:
+        # Caller must hold self._lock
+        model_path = self.model_path
+        logger.info(f"Loading {self.config.backend} model from: {model_path}")
+
+        signature = self._file_signature()
+        start = time.perf_counter()
+        model = self._read_model(model_path)
+        self.load_time = time.perf_counter() - start
+
+        if self._preprocess is None:
+            from cnnClassifier.components.backbones import get_preprocess_function
+            self._preprocess = get_preprocess_function(self.config.params_backbone)
+
+        if self._warmup_sizes:
+            # Reload: warm the new model up before it takes traffic
+            self._warm(model, self._warmup_sizes)
+
+        self.version = get_file_hash(model_path)
+        self.loaded_at = time.time()
+        self._signature = signature
+        self._model = model
+
+        logger.info(
+            f"Model loaded in {self.load_time:.2f}s "
+            f"(id: {id(model)}, version: {self.version[:12]})"
+        )
+
+    def load(self):
+        """
+        Load and compile the model once. Safe to call from several threads:
+        only the first caller does the work, the others wait and reuse it.
+        """
+        if self._model is not None:
+            return self._model
+
+        with self._lock:
+            if self._model is None:
+                self._load_from_disk()
+
+        return self._model
+
+    def reload_if_changed(self) -> bool:
+        """
+        Reload the model when its file on disk changed since it was loaded.
+        Requests keep using the old model until the new one is ready.
+
+        Returns:
+            bool: True if a new model was loaded.
+        """
+        if self._model is None or self._file_signature() == self._signature:
+            return False
+
+        with self._lock:
+            if self._file_signature() == self._signature:
+                return False
+            old_version = self.version
+            self._load_from_disk()
+
+        logger.info(f"Model file changed, reloaded (version {old_version[:12]} -> {self.version[:12]})")
+        return old_version != self.version
+
+    def _warm(self, model, batch_sizes) -> None:
+        # One forward pass per batch size: traces the graph and lets oneDNN
+        # pick its kernels for every shape the server will send
+        height, width, channels = self.config.params_image_size
+        start = time.perf_counter()
+        for size in batch_sizes:
+            model.predict_on_batch(np.zeros((size, height, width, channels), dtype="float32"))
+        if self.decodes_images:
+            # The bytes endpoint is a separate graph (decode + resize): run it once too
+            blank = io.BytesIO()
+            Image.new("RGB", (width, height)).save(blank, format="PNG")
+            model.predict_on_batch([blank.getvalue()])
+        self.warmup_time = time.perf_counter() - start
+        logger.info(
+            f"Model warm-up finished in {self.warmup_time:.2f}s "
+            f"(batch sizes: {list(batch_sizes)})"
+        )
+
+    def warmup(self, batch_sizes) -> float:
+        """
+        Run dummy forward passes at every batch size the server will use.
+
+        Args:
+            batch_sizes: Batch sizes to warm up (e.g. 1..max_batch_size).
+
+        Returns:
+            float: Warm-up duration in seconds.
+        """
+        self._warmup_sizes = tuple(batch_sizes)
+        self._warm(self.model, self._warmup_sizes)
+        return self.warmup_time
+
+    def predict_batch(self, batch: np.ndarray) -> np.ndarray:
+        """
+        Run one forward pass and return class probabilities.
+
+        Args:
+            batch: Raw RGB images of shape (N, height, width, 3), pixels in [0, 255],
+                   or, when decodes_images is True, a list of encoded images (bytes).
+        """
+        if self.decodes_images:
+            # Decode, resize and preprocessing all happen inside the exported graph
+            return np.asarray(self.model.predict_on_batch(batch))
+        return np.asarray(self.model.predict_on_batch(self._preprocess(batch)))
+
+    def info(self) -> dict:
+        """Load time, in-memory identity and version hash of the served model."""
+        return {
+            "backend": self.config.backend,
+            "backbone": self.config.params_backbone,
+            "precision": self.config.params_precision if self.config.backend != "tflite" else "float32",
+            "compiled": self.config.compiled_inference and self.config.backend in ("keras", "student"),
+            "decodes_images": self.decodes_images,
+            "jit_compile": self.config.jit_compile,
+            "model_path": str(self.model_path),
+            "loaded": self._model is not None,
+            "model_id": id(self._model) if self._model is not None else None,
+            "version": self.version,
+            "load_time_seconds": self.load_time,
+            "warmup_time_seconds": self.warmup_time,
+            "loaded_at": self.loaded_at,
+        }
+
+
+def decode_predictions(probabilities) -> list:
+    """
+    Convert class probabilities into [{"image": "Tumor"}, ...], one entry per image.
+
+    Args:
+        probabilities: Array of shape (classes,) or (N, classes).
+    """
+    # argmax picks the highest value index: 0=Normal, 1=Tumor
+    result = np.argmax(np.atleast_2d(probabilities), axis=1)
+    return [{"image": CLASS_NAMES[index]} for index in result]
+
+
+def load_image(source, target_size) -> np.ndarray:
+    """
+    Turn one image into a float32 array of shape (height, width, 3).
+
+    Args:
+        source: File path, raw image bytes, PIL image or numpy array.
+        target_size: (height, width) expected by the model.
+    """
+    if isinstance(source, np.ndarray):
+        return source.astype("float32", copy=False)
+
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        # Read uploaded bytes directly, no temporary file needed
+        source = io.BytesIO(source)
+
+    if not isinstance(source, Image.Image):
+        # Paths and byte streams: decode with PIL, as Keras' load_img does
+        source = Image.open(source)
+
+    # Resize to what the model expects (bilinear, like the training input pipeline)
+    source = source.convert("RGB")
+    if source.size != tuple(target_size[::-1]):
+        source = source.resize(target_size[::-1], Image.BILINEAR)
+
+    return np.asarray(source, dtype="float32")
+
+
+def decode_image_into(data: bytes, out: np.ndarray) -> np.ndarray:
+    """
+    Decode image bytes straight from memory into a preallocated buffer.
+
+    Applies the same RGB conversion and bilinear resize as
+    load_image() (and training), but writes the pixels into `out` instead of allocating
+    a new float array (and never touches the disk).
+
+    Args:
+        data: Raw bytes of a JPEG/PNG upload.
+        out: float32 buffer of shape (height, width, 3) to fill.
+    """
+    height, width = out.shape[:2]
+    with Image.open(io.BytesIO(data)) as img:
+        img = img.convert("RGB")
+        if img.size != (width, height):
+            img = img.resize((width, height), Image.BILINEAR)
+        out[...] = np.asarray(img)
+    return out
+
+
+class ImageBufferPool:
+    """
+    Pool of preallocated float32 image buffers reused across requests.
+
+    A buffer stays checked out until the caller is done with it (for
+    example until its micro-batch has been copied), so it is never
+    overwritten while still queued.
+    """
+
+    def __init__(self, image_size, size: int = 32):
+        """
+        Args:
+            image_size: (height, width, channels) of one buffer.
+            size: Number of buffers allocated up front.
+        """
+        self.shape = tuple(image_size)
+        self._free = queue.LifoQueue()
+        for _ in range(size):
+            self._free.put(np.empty(self.shape, dtype="float32"))
+
+    @contextmanager
+    def buffer(self):
+        """Check out a buffer for the duration of the with-block."""
+        try:
+            buf = self._free.get_nowait()
+        except queue.Empty:
+            # More requests in flight than preallocated buffers: grow the pool
+            buf = np.empty(self.shape, dtype="float32")
+        try:
+            yield buf
+        finally:
+            self._free.put(buf)
 
 
 class PredictionPipeline:
@@ -12,41 +374,55 @@ class PredictionPipeline:
     A simple class to predict if a brain scan image shows a tumor or is normal.
     Think of it like a doctor that looks at X-ray images and gives a diagnosis!
     """
-    
-    def __init__(self, filename):
+
+    def __init__(self, filename=None, holder: ModelHolder = None, backend: str = None):
         # Constructor - runs when we create a new PredictionPipeline object
-        # filename is the path to the image we want to analyze
-        self.filename = filename 
-    
-    def predict(self):
-        # Main prediction method - this does all the magic!
-        
-        # Step 1: Load our trained model from the saved location
-        # The model was trained earlier and saved in artifacts/training/model.keras
-        model = load_model(os.path.join("model", "model.keras"))
-        
-        # Step 2: Prepare the image for prediction (same size model expects)
-        imagename = self.filename  # Get the image path
-        test_image = image.load_img(imagename, target_size=(224, 224))
-        # Load image and resize to 224x224 pixels (standard size for this model)
-        
-        test_image = image.img_to_array(test_image)
-        # Convert image to numerical array that model can understand
-        
-        test_image = np.expand_dims(test_image, axis=0)
+        # filename is the path to the image we want to analyze (optional when
+        # the image is passed straight to predict())
+        self.filename = filename
+        # Shared model holder - creating a pipeline never reloads the model
+        # backend: "keras", "tflite", "student" or "savedmodel" (defaults to serving.backend in config.yaml)
+        self.holder = holder if holder is not None else ModelHolder.instance(backend=backend)
+
+    def preprocess(self, data) -> np.ndarray:
+        """
+        Build a batch of raw RGB pixels of shape (N, height, width, 3)
+        (the backbone preprocessing is applied by ModelHolder.predict_batch).
+
+        Args:
+            data: File path, image bytes, PIL image, a single (H, W, 3) array
+                  or an already batched (N, H, W, 3) array.
+        """
+        target_size = tuple(self.holder.config.params_image_size[:-1])
+
+        if isinstance(data, np.ndarray) and data.ndim == 4:
+            return data.astype("float32", copy=False)
+
         # Add batch dimension - model expects [1, 224, 224, 3] shape, not [224, 224, 3]
-        
-        # Step 3: Get model's prediction
-        result = np.argmax(model.predict(test_image), axis=1)
+        return np.expand_dims(load_image(data, target_size), axis=0)
+
+    def predict_proba(self, data=None) -> np.ndarray:
+        """
+        Return class probabilities of shape (N, classes).
+
+        Args:
+            data: Image to classify. Defaults to the filename given at construction.
+        """
+        data = self.filename if data is None else data
+
+        if self.holder.decodes_images and isinstance(data, (str, Path, bytes, bytearray, memoryview)):
+            # Encoded image: the serving graph decodes and resizes it itself
+            encoded = Path(data).read_bytes() if isinstance(data, (str, Path)) else bytes(data)
+            return self.holder.predict_batch([encoded])
+
+        return self.holder.predict_batch(self.preprocess(data))
+
+    def predict(self, data=None):
+        # Main prediction method - this does all the magic!
+
         # model.predict() gives probabilities like [0.2, 0.8]
-        # argmax picks the highest value index: 0=Normal, 1=Tumor
-        print(result)  # Debug print to see raw prediction (0 or 1)
-        
-        # Step 4: Convert number to human-readable result
-        if result[0] == 1:
-            prediction = 'Tumor'
-            return [{"image": prediction}]  # Return tumor prediction
-        
-        else:
-            prediction = 'Normal'
-            return [{"image": prediction}]  # Return normal prediction
+        probabilities = self.predict_proba(data)
+        logger.debug(f"Raw prediction: {probabilities}")
+
+        # Convert number to human-readable result, one entry per image
+        return decode_predictions(probabilities)
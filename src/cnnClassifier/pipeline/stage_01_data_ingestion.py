@@ -17,9 +17,6 @@ ensures that raw data is available for downstream processing stages.
 # Import configuration manager to load pipeline settings
 from cnnClassifier.config.configuration import ConfigurationManager
 
-# Import Data Ingestion component responsible for data download & extraction
-from cnnClassifier.components.data_ingestion import DataIngestion
-
 # Import centralized logger for pipeline tracking
 from cnnClassifier import logger
 
@@ -44,6 +41,9 @@ class DataIngestionTrainingPipeline:
         2. Downloads dataset
         3. Extracts dataset files
         """
+        # Component imported here so importing this stage (main.py) stays cheap
+        from cnnClassifier.components.data_ingestion import DataIngestion
+
         try:
             # Load project configuration
             config = ConfigurationManager()
@@ -54,10 +54,12 @@ class DataIngestionTrainingPipeline:
             # Initialize Data Ingestion component
             data_ingestion = DataIngestion(config=data_ingestion_config)
 
-            # Download dataset from source
+            # Download dataset from source (skipped when data.zip is the
+            # archive the current extraction came from)
             data_ingestion.download_file()
 
-            # Extract downloaded dataset
+            # Extract downloaded dataset (only the members that changed
+            # since the last run; nothing at all for an identical archive)
             data_ingestion.extract_zip_file()
 
         except Exception as e:
@@ -1,5 +1,4 @@
 from cnnClassifier.config.configuration import ConfigurationManager
-from cnnClassifier.components.prepare_base_model import PrepareBaseModel
 from cnnClassifier import logger 
 
 STAGE_NAME = "Prepare base model"
@@ -9,6 +8,9 @@ class PrepareBaseModelTrainingPipeline:
         pass 
 
     def main(self):
+        # Component imported here so importing this stage (main.py) stays cheap
+        from cnnClassifier.components.prepare_base_model import PrepareBaseModel
+
         # 1.Create config object to get hyper-parameters 
         config  = ConfigurationManager()
     
@@ -25,6 +27,9 @@ class PrepareBaseModelTrainingPipeline:
         # 5.Update parameters of basemodel and create our classifier CNN Architecture
         prepare_base_model.update_base_model() 
 
+        # 6.Record params, FLOPs and CPU latency of this backbone
+        prepare_base_model.benchmark()
+
 if __name__ == "__main__":
     logger.info(">>>>> stage {STAGE_NAME} started <<<<<")
 
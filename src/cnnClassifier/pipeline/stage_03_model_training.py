@@ -1,5 +1,4 @@
 from cnnClassifier.config.configuration import ConfigurationManager
-from cnnClassifier.components.model_training import Training
 from cnnClassifier import logger 
 
 STAGE_NAME = "Training"
@@ -10,6 +9,9 @@ class ModelTrainingPipeline:
         pass 
 
     def main(self):
+        # Components imported here so importing this stage (main.py) stays cheap
+        from cnnClassifier.components.model_training import Training
+        from cnnClassifier.components.feature_extraction import FeatureExtraction
 
         # Initialize config object 
         config = ConfigurationManager()
@@ -23,10 +25,26 @@ class ModelTrainingPipeline:
         # Load the prepared VGG16 model from disk 
         training.get_base_model()
 
-        # Create data generator objects for feeding images to model during training
+        # Fast path: only the head is trainable and augmentation is off,
+        # so train it on the cached backbone features (feature_extraction stage)
+        features = None
+        if training_config.params_feature_cache and not training_config.params_is_augmentation:
+            features = FeatureExtraction(
+                config=config.get_feature_extraction_config(),
+                training_config=training_config
+            )
+            if not features.is_up_to_date():
+                logger.info("Cached features are missing or stale, training on images")
+                features = None
+
+        if features is not None and training.get_head_model() is not None:
+            training.train_head(features)
+            return
+
+        # Create the tf.data input pipelines feeding images to the model during training
         training.train_valid_generator()
 
-        # Train the VGG16 model on kidney CT scan images
+        # Train the model on kidney CT scan images
         training.train()
 
 if __name__ == "__main__":
@@ -1,5 +1,4 @@
 from cnnClassifier.config.configuration import ConfigurationManager
-from cnnClassifier.components.model_evaluation import Evaluation
 from cnnClassifier import logger 
 
 
@@ -23,6 +22,9 @@ class EvaluationPipeline:
 
         :return: None
         """
+        # Component imported here so importing this stage (main.py) stays cheap
+        from cnnClassifier.components.model_evaluation import Evaluation
+
         
         config = ConfigurationManager()
         eval_config = config.get_evaluation_config()
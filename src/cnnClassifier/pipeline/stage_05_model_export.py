@@ -0,0 +1,39 @@
+from cnnClassifier.config.configuration import ConfigurationManager
+from cnnClassifier import logger
+
+
+STAGE_NAME = "Model Export Stage"
+
+class ModelExportPipeline:
+
+    def __init__(self):
+        pass
+
+    def main(self):
+        # Component imported here so importing this stage (main.py) stays cheap
+        from cnnClassifier.components.model_export import ModelExport
+
+        # Initialize config object
+        config = ConfigurationManager()
+
+        # Get the export related configuration values
+        model_export_config = config.get_model_export_config()
+
+        model_export = ModelExport(config=model_export_config)
+
+        # Convert artifacts/training/model.keras to TFLite
+        model_export.convert()
+
+        # Compare TFLite and Keras probabilities on the validation split
+        model_export.parity_check()
+
+if __name__ == "__main__":
+    try:
+        logger.info(f"*"*20)
+        logger.info(f">>>>>>>>> {STAGE_NAME} STARTED <<<<<<<<<<")
+        obj = ModelExportPipeline()
+        obj.main()
+        logger.info(f">>>>>>>>>>>>>>{STAGE_NAME} completed <<<<<<<<<<")
+    except Exception as e:
+        logger.exception(e)
+        raise e
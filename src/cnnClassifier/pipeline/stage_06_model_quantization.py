@@ -0,0 +1,43 @@
+from cnnClassifier.config.configuration import ConfigurationManager
+from cnnClassifier import logger
+
+
+STAGE_NAME = "Model Quantization Stage"
+
+class ModelQuantizationPipeline:
+
+    def __init__(self):
+        pass
+
+    def main(self):
+        # Component imported here so importing this stage (main.py) stays cheap
+        from cnnClassifier.components.model_quantization import ModelQuantization
+
+        # Initialize config object
+        config = ConfigurationManager()
+
+        # Quantization paths, plus the training config for the data split
+        model_quantization = ModelQuantization(
+            config=config.get_model_quantization_config(),
+            training_config=config.get_training_config()
+        )
+
+        # Calibration (training split) and scoring (validation split) images
+        model_quantization.load_data()
+
+        # Full-integer int8 conversion calibrated on training images
+        model_quantization.quantize()
+
+        # Float vs int8: accuracy, loss, size and latency
+        model_quantization.save_score()
+
+if __name__ == "__main__":
+    try:
+        logger.info(f"*"*20)
+        logger.info(f">>>>>>>>> {STAGE_NAME} STARTED <<<<<<<<<<")
+        obj = ModelQuantizationPipeline()
+        obj.main()
+        logger.info(f">>>>>>>>>>>>>>{STAGE_NAME} completed <<<<<<<<<<")
+    except Exception as e:
+        logger.exception(e)
+        raise e
@@ -0,0 +1,47 @@
+from cnnClassifier.config.configuration import ConfigurationManager
+from cnnClassifier import logger
+
+
+STAGE_NAME = "Feature Extraction Stage"
+
+class FeatureExtractionPipeline:
+
+    def __init__(self):
+        pass
+
+    def main(self):
+        # Component imported here so importing this stage (main.py) stays cheap
+        from cnnClassifier.components.feature_extraction import FeatureExtraction
+
+        # Initialize config object
+        config = ConfigurationManager()
+
+        feature_extraction_config = config.get_feature_extraction_config()
+        training_config = config.get_training_config()
+
+        # Same condition Training uses to read the cache: without it the
+        # features would never be used (the output folder is left empty)
+        if not (training_config.params_feature_cache and not training_config.params_is_augmentation):
+            logger.info("FEATURE_CACHE is off or AUGMENTATION is on, skipping feature extraction")
+            return
+
+        # Feature cache paths, plus the training config for the data split
+        feature_extraction = FeatureExtraction(
+            config=feature_extraction_config,
+            training_config=training_config
+        )
+
+        # Run the frozen backbone once over every image
+        # (skipped when the base model and the dataset did not change)
+        feature_extraction.extract()
+
+if __name__ == "__main__":
+    try:
+        logger.info(f"*"*20)
+        logger.info(f">>>>>>>>> {STAGE_NAME} STARTED <<<<<<<<<<")
+        obj = FeatureExtractionPipeline()
+        obj.main()
+        logger.info(f">>>>>>>>>>>>>>{STAGE_NAME} completed <<<<<<<<<<")
+    except Exception as e:
+        logger.exception(e)
+        raise e
@@ -0,0 +1,43 @@
+from cnnClassifier.config.configuration import ConfigurationManager
+from cnnClassifier import logger
+
+
+STAGE_NAME = "Model Distillation Stage"
+
+class ModelDistillationPipeline:
+
+    def __init__(self):
+        pass
+
+    def main(self):
+        # Component imported here so importing this stage (main.py) stays cheap
+        from cnnClassifier.components.model_distillation import ModelDistillation
+
+        # Initialize config object
+        config = ConfigurationManager()
+
+        # Distillation settings, plus the training config for the data split
+        model_distillation = ModelDistillation(
+            config=config.get_model_distillation_config(),
+            training_config=config.get_training_config()
+        )
+
+        # Same training/validation split as stage_03
+        model_distillation.load_data()
+
+        # Train the student on the teacher's soft targets
+        model_distillation.distill()
+
+        # Teacher vs student: accuracy and CPU latency
+        model_distillation.save_score()
+
+if __name__ == "__main__":
+    try:
+        logger.info(f"*"*20)
+        logger.info(f">>>>>>>>> {STAGE_NAME} STARTED <<<<<<<<<<")
+        obj = ModelDistillationPipeline()
+        obj.main()
+        logger.info(f">>>>>>>>>>>>>>{STAGE_NAME} completed <<<<<<<<<<")
+    except Exception as e:
+        logger.exception(e)
+        raise e
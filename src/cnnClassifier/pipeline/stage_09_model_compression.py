@@ -0,0 +1,49 @@
+from cnnClassifier.config.configuration import ConfigurationManager
+from cnnClassifier import logger
+
+
+STAGE_NAME = "Model Compression Stage"
+
+class ModelCompressionPipeline:
+
+    def __init__(self):
+        pass
+
+    def main(self):
+        # Component imported here so importing this stage (main.py) stays cheap
+        from cnnClassifier.components.model_compression import ModelCompression
+
+        # Initialize config object
+        config = ConfigurationManager()
+
+        # Optional stage: only runs with COMPRESSION: True in params.yaml
+        compression_config = config.get_model_compression_config()
+        if not compression_config.params_enabled:
+            logger.info("COMPRESSION is False in params.yaml, skipping model compression")
+            return
+
+        # Compression settings, plus the training config for the data split
+        model_compression = ModelCompression(
+            config=compression_config,
+            training_config=config.get_training_config()
+        )
+
+        # Same training/validation split as stage_03
+        model_compression.load_data()
+
+        # Prune or cluster, fine-tune and save the compressed model
+        model_compression.compress()
+
+        # Compressed vs original: accuracy, size and load time
+        model_compression.save_score()
+
+if __name__ == "__main__":
+    try:
+        logger.info(f"*"*20)
+        logger.info(f">>>>>>>>> {STAGE_NAME} STARTED <<<<<<<<<<")
+        obj = ModelCompressionPipeline()
+        obj.main()
+        logger.info(f">>>>>>>>>>>>>>{STAGE_NAME} completed <<<<<<<<<<")
+    except Exception as e:
+        logger.exception(e)
+        raise e
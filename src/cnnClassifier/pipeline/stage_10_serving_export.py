@@ -0,0 +1,39 @@
+from cnnClassifier.config.configuration import ConfigurationManager
+from cnnClassifier import logger
+
+
+STAGE_NAME = "Serving Export Stage"
+
+class ServingExportPipeline:
+
+    def __init__(self):
+        pass
+
+    def main(self):
+        # Component imported here so importing this stage (main.py) stays cheap
+        from cnnClassifier.components.serving_export import ServingExport
+
+        # Initialize config object
+        config = ConfigurationManager()
+
+        # Get the serving export related configuration values
+        serving_export_config = config.get_serving_export_config()
+
+        serving_export = ServingExport(config=serving_export_config)
+
+        # SavedModel with decode, resize and preprocessing inside the graph
+        serving_export.export()
+
+        # Raw files through the graph vs training input batches through Keras
+        serving_export.parity_check()
+
+if __name__ == "__main__":
+    try:
+        logger.info(f"*"*20)
+        logger.info(f">>>>>>>>> {STAGE_NAME} STARTED <<<<<<<<<<")
+        obj = ServingExportPipeline()
+        obj.main()
+        logger.info(f">>>>>>>>>>>>>>{STAGE_NAME} completed <<<<<<<<<<")
+    except Exception as e:
+        logger.exception(e)
+        raise e
@@ -0,0 +1,42 @@
+# Numbered 11 because it was added after stages 01-10, but it runs second,
+# right after data ingestion (main.py, dvc.yaml): every later stage reads the
+# packed images. Stage numbers are kept stable so existing commands, dvc.lock
+# entries and logs keep pointing at the same modules.
+from cnnClassifier.config.configuration import ConfigurationManager
+from cnnClassifier import logger
+
+
+STAGE_NAME = "Dataset Packing Stage"
+
+class DatasetPackingPipeline:
+
+    def __init__(self):
+        pass
+
+    def main(self):
+        # Component imported here so importing this stage (main.py) stays cheap
+        from cnnClassifier.components.dataset_packing import DatasetPacking
+
+        # Initialize config object
+        config = ConfigurationManager()
+
+        # Get the packing related configuration values
+        dataset_packing_config = config.get_dataset_packing_config()
+
+        dataset_packing = DatasetPacking(config=dataset_packing_config)
+
+        # Decode + resize every extracted image once and write the uint8 store
+        # or shards (skipped when index.json still matches the images, IMAGE_SIZE
+        # and format)
+        dataset_packing.pack()
+
+if __name__ == "__main__":
+    try:
+        logger.info(f"*"*20)
+        logger.info(f">>>>>>>>> {STAGE_NAME} STARTED <<<<<<<<<<")
+        obj = DatasetPackingPipeline()
+        obj.main()
+        logger.info(f">>>>>>>>>>>>>>{STAGE_NAME} completed <<<<<<<<<<")
+    except Exception as e:
+        logger.exception(e)
+        raise e
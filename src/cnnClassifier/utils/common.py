@@ -11,8 +11,8 @@ Common utility functions used across the project for:
 import os
 import json
 import yaml
-import joblib
 import base64
+import hashlib
 from pathlib import Path
 from typing import Any,Sequence
 
@@ -108,6 +108,8 @@ def save_bin(data: Any, path: Path) -> None:
         data (Any): Object to serialize.
         path (Path): Destination path for binary file.
     """
+    # Imported here: only binary artifacts need joblib, not every importer of common
+    import joblib
     joblib.dump(data, path)
     logger.info(f"Binary file saved at: {path}")
 
@@ -123,6 +125,7 @@ def load_bin(path: Path) -> Any:
     Returns:
         Any: Deserialized Python object.
     """
+    import joblib
     data = joblib.load(path)
     logger.info(f"Binary file loaded from: {path}")
     return data
@@ -143,6 +146,106 @@ def get_size(path: Path) -> str:
     return f"~ {size_in_kb} KB"
 
 
+def get_file_hash(path: Path, chunk_size: int = 1024 * 1024) -> str:
+    """
+    Compute the SHA-256 hash of a file, reading it in chunks.
+
+    For a directory (e.g. a SavedModel) the hash covers the relative path
+    and content of every file in it, in sorted order.
+
+    Args:
+        path (Path): Path to file or directory.
+        chunk_size (int): Number of bytes read per chunk.
+
+    Returns:
+        str: Hex digest of the file content.
+    """
+    path = Path(path)
+    files = sorted(p for p in path.rglob("*") if p.is_file()) if path.is_dir() else [path]
+
+    digest = hashlib.sha256()
+    for file in files:
+        if path.is_dir():
+            digest.update(file.relative_to(path).as_posix().encode())
+        with open(file, "rb") as f:
+            for chunk in iter(lambda: f.read(chunk_size), b""):
+                digest.update(chunk)
+    return digest.hexdigest()
+
+
+def dataset_fingerprint(directory: Path, mtime: bool = True) -> str:
+    """
+    SHA-256 over the relative path, size and modification time of every file in directory.
+
+    Args:
+        directory (Path): Folder to fingerprint (e.g. the extracted dataset).
+        mtime (bool): Include modification times. Without them the fingerprint
+                      survives a fresh checkout, `dvc pull` or a re-extraction
+                      of the same files, which all reset the mtimes.
+
+    Returns:
+        str: Hex digest, changes whenever a file is added, removed or rewritten
+             (with mtime=False: added, removed or changes size).
+    """
+    digest = hashlib.sha256()
+    for root, dirs, files in os.walk(directory):
+        dirs.sort()
+        for name in sorted(files):
+            path = Path(root) / name
+            stat = path.stat()
+            entry = f"{path.relative_to(directory).as_posix()}|{stat.st_size}"
+            if mtime:
+                entry += f"|{stat.st_mtime_ns}"
+            digest.update(f"{entry}\n".encode())
+    return digest.hexdigest()
+
+
+def get_cpu_count() -> int:
+    """
+    Number of CPU cores this process may run on (respects taskset/cpusets).
+
+    Returns:
+        int: Usable core count.
+    """
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+def configure_tf_threads(workers: int = 1, cpu_count: int = None) -> dict:
+    """
+    Size TensorFlow's thread pools for one of several serving workers.
+
+    Every worker process would otherwise size its pools to all cores and
+    the workers would oversubscribe the machine. Must run before TensorFlow
+    executes its first op in this process.
+
+    Args:
+        workers (int): Number of worker processes sharing the machine.
+        cpu_count (int): Cores available (detected when omitted).
+
+    Returns:
+        dict: The intra_op and inter_op thread counts that were applied.
+    """
+    cpu_count = cpu_count or get_cpu_count()
+    intra_op = max(1, cpu_count // max(1, workers))
+    inter_op = 1 if intra_op <= 2 else 2
+
+    # oneDNN/OpenMP kernels read this, TF's own pools are set below
+    os.environ["OMP_NUM_THREADS"] = str(intra_op)
+
+    import tensorflow as tf
+    tf.config.threading.set_intra_op_parallelism_threads(intra_op)
+    tf.config.threading.set_inter_op_parallelism_threads(inter_op)
+
+    logger.info(
+        f"TensorFlow threads: intra_op={intra_op}, inter_op={inter_op} "
+        f"({cpu_count} cores / {workers} workers)"
+    )
+    return {"intra_op": intra_op, "inter_op": inter_op}
+
+
 def decodeImage(imgstring: str, fileName: str) -> None:
     """
     Decode a Base64-encoded image string and save it as an image file.
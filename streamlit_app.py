@@ -4,11 +4,9 @@ Upload an image and get instant prediction!
 """
 
 import streamlit as st
-import numpy as np
-from tensorflow.keras.models import load_model
-from tensorflow.keras.preprocessing import image
 from PIL import Image
-import os
+
+from cnnClassifier.pipeline.prediction import PredictionPipeline
 
 # Configure the page
 st.set_page_config(
@@ -24,8 +22,8 @@ st.write("Upload a Kidney Disease scan image to detect if it contains a tumor or
 # Load model (with caching to load only once)
 @st.cache_resource
 def load_my_model():
-    """Load the trained model - only runs once"""
-    return load_model(os.path.join("model", "model.keras"))
+    """Load the serving model (serving.backend in config.yaml) - only runs once"""
+    return PredictionPipeline()
 
 # File uploader
 uploaded_file = st.file_uploader(
@@ -41,25 +39,14 @@ if uploaded_file is not None:
     # Add a predict button
     if st.button("🔍 Predict", type="primary"):
         with st.spinner("Analyzing image..."):
-            # Save uploaded file temporarily
-            temp_path = "temp_image.jpg"
-            img.save(temp_path)
-            
-            # Load and preprocess image
-            test_image = image.load_img(temp_path, target_size=(224, 224))
-            test_image = image.img_to_array(test_image)
-            test_image = np.expand_dims(test_image, axis=0)
-            
-            # Load model and predict
+            # Hand over the uploaded bytes: decode, resize and preprocessing
+            # are the same as for the API (inside the graph for "savedmodel")
             model = load_my_model()
-            result = np.argmax(model.predict(test_image), axis=1)
-            
-            # Clean up temp file
-            os.remove(temp_path)
+            result = model.predict(uploaded_file.getvalue())
             
             # Show results
             st.markdown("---")
-            if result[0] == 1:
+            if result[0]["image"] == "Tumor":
                 st.error("⚠️ Prediction: **TUMOR DETECTED**")
                 st.write("The model detected signs of a tumor in the scan.")
             else: